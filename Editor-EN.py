@@ -3,15 +3,42 @@ from tkinter import ttk, messagebox, filedialog
 import json
 from pathlib import Path
 import os
-import shutil
-import uuid
-import zipfile
-import tempfile
-import webbrowser
-import platform
-from datetime import datetime
+import sys
+import queue
+import threading
+from quickide.core import (ItemSpec, BlockSpec, EntitySpec, RecipeSpec, LootSpec, LootPool, LootEntry,
+                           build_item, build_block, build_entity, build_spawn_rules, build_recipe,
+                           build_loot_table, display_name_key, suggest_filename, to_json)
+from quickide.filetree import FileTreeModel
+from quickide.index import ProjectIndex, block_references, entity_references, recipe_references
+from quickide.lang import LangStore
+from quickide.loader import ChunkedTextLoader
+from quickide.project import cache_path
+from quickide.schema import schema_errors, schema_kind
+from quickide.search import RESULT_LIMIT, SearchIndex, SearchWorker
+from quickide.validate import ProjectValidator, ValidationWorker, validate_files
+from quickide.viewer import VirtualTextView
+from quickide.watcher import ProjectWatcher, DELETED, RESCAN
 
 class Editor:
+    # Files at least this large open in the read-only virtualized view
+    LARGE_FILE_SIZE = 4 * 1024 * 1024
+    
+    # Rows shown in the Problems panel
+    MAX_PROBLEM_ROWS = 1000
+    
+    # Form fields named in reference warnings
+    REFERENCE_FIELDS = {
+        "loot": "Loot Item",
+        "texture": "Texture",
+        "equipment_table": "Equipment Table",
+        "loot_table": "Loot Table",
+        "output": "Output Item",
+        "input": "Input Item",
+        "reagent": "Reagent",
+        "ingredient": "Ingredient"
+    }
+    
     def __init__(self, root, project_path):
         self.root = root
         self.project_path = project_path
@@ -23,6 +50,21 @@ class Editor:
         # Load project configuration
         self.load_project_config()
         
+        # Language files, each parsed once and re-read only when changed on disk
+        self.lang_store = LangStore(self.rp_path / "texts")
+        
+        # Project index, still empty here and scanned once the window is shown; backed by the cache in .quick
+        self.project_index = ProjectIndex(self.bp_path, self.rp_path, cache_path(self.project_path, "index.db"))
+        
+        # Trigram index for Find in Project, built by the first search
+        self.search_index = SearchIndex(self.bp_path, self.rp_path)
+        
+        # Diagnostics of every file; after a save only that file and the files depending on it are checked again
+        self.project_validator = ProjectValidator(self.bp_path, self.rp_path, self.project_path)
+        
+        # File tree loads folder contents on expand (lazy mode)
+        self.lazy_file_tree = True
+        
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="5")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -36,6 +78,29 @@ class Editor:
         # Create left and right panels
         self.create_panels()
         
+        # Show the window first, the file trees and background work follow after the first redraw
+        self.root.after_idle(lambda: self.root.after(0, self.start_background_work))
+    
+    def start_background_work(self):
+        """Fill the file trees and start indexing, watching and checking the project"""
+        # The window was closed before it was shown
+        if not self.root.winfo_exists():
+            return
+        
+        # File trees (lazy mode only reads the top level, folders are filled in when expanded)
+        for model in self.file_tree_models.values():
+            model.load()
+        
+        # Index of every identifier, texture and lang key, built in the background;
+        # files unchanged since the last session come from the cache in .quick
+        self.project_index.build_async()
+        
+        # Watch the packs for outside changes
+        self.start_file_watcher()
+        
+        # Check the whole project in the background, the results go to the Problems panel
+        self.validation_worker.submit()
+        
     def load_project_config(self):
         """Load project configuration"""
         config_path = self.project_path / "project.json"
@@ -58,8 +123,16 @@ class Editor:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Save", command=self.save_all, accelerator="Ctrl+S")
         file_menu.add_command(label="Save As", command=self.save_as)
+        file_menu.add_command(label="Close Tab", command=self.close_current_tab, accelerator="Ctrl+W")
         file_menu.add_separator()
         file_menu.add_command(label="Export Addon", command=self.export_addon)
+        file_menu.add_command(label="Export Packs (.mcpack)", command=self.export_packs)
+        # Compact JSON without comments in exported packs
+        self.minify_export = tk.BooleanVar(value=False)
+        file_menu.add_checkbutton(label="Minify JSON on Export", variable=self.minify_export)
+        # Lossless re-encode of PNGs in exported packs
+        self.optimize_textures_export = tk.BooleanVar(value=False)
+        file_menu.add_checkbutton(label="Optimize PNG Textures on Export", variable=self.optimize_textures_export)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.destroy)
         
@@ -92,6 +165,9 @@ class Editor:
         menubar.add_cascade(label="Tools", menu=tools_menu)
         tools_menu.add_command(label="Validate Project Structure", command=self.validate_project)
         tools_menu.add_command(label="Regenerate UUIDs", command=self.regenerate_uuids)
+        tools_menu.add_command(label="Reveal Current File in Tree", command=self.reveal_current_file)
+        tools_menu.add_command(label="Bulk Import...", command=self.show_bulk_import_dialog)
+        tools_menu.add_command(label="Find in Project", command=self.show_search_panel, accelerator="Ctrl+Shift+F")
         tools_menu.add_separator()
         tools_menu.add_command(label="Open Behavior Pack Folder", command=lambda: self.open_folder(self.bp_path))
         tools_menu.add_command(label="Open Resource Pack Folder", command=lambda: self.open_folder(self.rp_path))
@@ -139,26 +215,46 @@ class Editor:
         paned.add(left_frame, weight=1)
         
         # Create tabs to separate BP and RP
-        file_notebook = ttk.Notebook(left_frame)
-        file_notebook.pack(fill=tk.BOTH, expand=True)
+        self.file_notebook = ttk.Notebook(left_frame)
+        self.file_notebook.pack(fill=tk.BOTH, expand=True)
         
         # Behavior Pack tab
-        bp_frame = ttk.Frame(file_notebook)
-        file_notebook.add(bp_frame, text="Behavior Pack (BP)")
+        bp_frame = ttk.Frame(self.file_notebook)
+        self.file_notebook.add(bp_frame, text="Behavior Pack (BP)")
         self.create_file_tree(bp_frame, self.bp_path, "bp")
         
         # Resource Pack tab
-        rp_frame = ttk.Frame(file_notebook)
-        file_notebook.add(rp_frame, text="Resource Pack (RP)")
+        rp_frame = ttk.Frame(self.file_notebook)
+        self.file_notebook.add(rp_frame, text="Resource Pack (RP)")
         self.create_file_tree(rp_frame, self.rp_path, "rp")
         
+        # Find in Project tab
+        self.search_frame = ttk.Frame(self.file_notebook)
+        self.file_notebook.add(self.search_frame, text="Search")
+        self.create_search_panel(self.search_frame)
+        
         # Right panel - Edit area
         right_frame = ttk.Frame(paned, padding="5")
         paned.add(right_frame, weight=3)
         
+        # Open files on top, the Problems panel below
+        right_paned = ttk.PanedWindow(right_frame, orient=tk.VERTICAL)
+        right_paned.pack(fill=tk.BOTH, expand=True)
+        
         # Create notebook
-        self.notebook = ttk.Notebook(right_frame)
-        self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = ttk.Notebook(right_paned)
+        right_paned.add(self.notebook, weight=4)
+        
+        problems_frame = ttk.Frame(right_paned)
+        right_paned.add(problems_frame, weight=1)
+        self.create_problems_panel(problems_frame)
+        
+        # Close tabs with Ctrl+W or a middle click
+        self.root.bind("<Control-w>", self.close_current_tab)
+        self.notebook.bind("<Button-2>", self.close_tab_at)
+        
+        # Ctrl+Shift+F opens Find in Project
+        self.root.bind("<Control-F>", self.show_search_panel)
         
         # Welcome tab
         welcome_frame = ttk.Frame(self.notebook)
@@ -197,6 +293,9 @@ Reference Documentation: https://learn.microsoft.com/en-us/minecraft/creator/"""
         
         # Store opened tabs
         self.open_tabs = {}
+        
+        # Open file tabs by path, with their text widget and loaded file state
+        self.open_files = {}
     
     def create_file_tree(self, parent, root_path, tree_id):
         """Create file tree"""
@@ -216,97 +315,90 @@ Reference Documentation: https://learn.microsoft.com/en-us/minecraft/creator/"""
         # Store tree reference
         if not hasattr(self, 'file_trees'):
             self.file_trees = {}
+            self.file_tree_models = {}
+            self.file_tree_pages = {}
         self.file_trees[tree_id] = tree
         
-        # Load files
-        self.load_file_tree_node(tree, "", root_path, root_path.name)
+        # Pack tab of each file tree
+        self.file_tree_pages[tree_id] = parent
+        
+        # Path-keyed tree model, saves only update a single node
+        model = FileTreeModel(tree, root_path, lazy=self.lazy_file_tree, missing_text="(does not exist)")
+        self.file_tree_models[tree_id] = model
+        
+        # Files are loaded by start_background_work() after the window is shown
         
         # Bind double-click event
-        tree.bind("<Double-1>", lambda e: self.open_file_from_tree(e, tree, root_path))
+        tree.bind("<Double-1>", lambda e: self.open_file_from_tree(e, model))
+        
+        # Load folder contents on expand
+        tree.bind("<<TreeviewOpen>>", lambda e: model.expand(tree.focus()))
     
-    def load_file_tree_node(self, tree, parent, path, node_text):
-        """Recursively load file tree nodes"""
-        if not path.exists():
-            node = tree.insert(parent, "end", text=f"{node_text} (does not exist)", open=True)
-            return
+    def refresh_file_tree(self, path):
+        """Refresh the file tree node for a single path"""
+        for model in self.file_tree_models.values():
+            if model.contains(path):
+                model.add(path)
         
-        node = tree.insert(parent, "end", text=node_text, open=True)
+        # Saved files are scanned again right away
+        self.project_index.update_file(path)
+        self.search_index.update_file(path)
         
-        try:
-            # Add folders first
-            folders = []
-            files = []
-            
-            for item in path.iterdir():
-                if item.is_dir():
-                    folders.append(item)
-                else:
-                    files.append(item)
-            
-            # Sort
-            folders.sort(key=lambda x: x.name)
-            files.sort(key=lambda x: x.name)
-            
-            # Add folders
-            for folder in folders:
-                self.load_file_tree_node(tree, node, folder, folder.name)
-            
-            # Add files
-            for file in files:
-                # Set different icon tags based on file type
-                tags = []
-                if file.suffix == '.json':
-                    tags.append('json')
-                elif file.suffix in ['.png', '.jpg', '.tga']:
-                    tags.append('image')
-                elif file.suffix == '.lang':
-                    tags.append('lang')
-                elif file.suffix == '.js':
-                    tags.append('script')
-                elif file.suffix == '.mcfunction':
-                    tags.append('function')
-                
-                tree.insert(node, "end", text=file.name, tags=tags)
-            
-        except Exception as e:
-            print(f"Failed to load file tree: {e}")
+        # Check the saved file and its dependents again
+        self.schedule_validation(path)
     
-    def open_file_from_tree(self, event, tree, root_path):
+    def open_file_from_tree(self, event, model):
         """Open file from file tree"""
-        selection = tree.selection()
+        selection = model.tree.selection()
         if not selection:
             return
         
-        item = selection[0]
-        item_text = tree.item(item, "text")
-        
-        # Check if it's a file (has extension)
-        if "." not in item_text:
+        # Look up the node's path directly, folders are known from the model
+        file_path = model.path_of(selection[0])
+        if file_path is None or model.is_folder(file_path):
             return
         
-        # Get full path
-        path_parts = []
-        current = item
-        while current:
-            text = tree.item(current, "text")
-            path_parts.insert(0, text)
-            current = tree.parent(current)
+        if file_path.is_file():
+            self.open_file_in_tab(file_path)
+    
+    def reveal_in_tree(self, file_path):
+        """Select a file's node in the file tree"""
+        for tree_id, model in self.file_tree_models.items():
+            if model.contains(file_path):
+                # Switch to the pack tab that holds the file
+                self.file_notebook.select(self.file_tree_pages[tree_id])
+                return model.reveal(file_path)
+        return None
+    
+    def reveal_current_file(self):
+        """Reveal the file of the current tab in the file tree"""
+        file_path = self.get_current_file()
+        if file_path is None:
+            messagebox.showwarning("Warning", "The current tab is not a file")
+            return
+        self.reveal_in_tree(file_path)
+    
+    def get_current_file(self):
+        """Get the path of the file shown in the current tab"""
+        current_tab = self.notebook.select()
+        if not current_tab:
+            return None
         
-        # Build file path
-        # First part is the root node name, skip it
-        if len(path_parts) > 1:
-            file_path = root_path
-            for part in path_parts[1:-1]:  # Skip root node and file name
-                file_path = file_path / part
-            file_path = file_path / path_parts[-1]
-            
-            if file_path.exists() and file_path.is_file():
-                self.open_file_in_tab(file_path)
+        frame = self.notebook.nametowidget(current_tab)
+        for file_path, info in self.open_files.items():
+            if info["frame"] is frame:
+                return file_path
+        return None
     
     def open_file_in_tab(self, file_path):
         """Open file in tab"""
         tab_name = f"{file_path.parent.name}/{file_path.name}"
         
+        # Already open
+        if file_path in self.open_files:
+            self.notebook.select(self.open_files[file_path]["frame"])
+            return
+        
         if tab_name in self.open_tabs:
             self.notebook.select(self.open_tabs[tab_name])
             return
@@ -316,19 +408,64 @@ Reference Documentation: https://learn.microsoft.com/en-us/minecraft/creator/"""
         self.notebook.add(tab_frame, text=tab_name)
         self.open_tabs[tab_name] = tab_frame
         self.notebook.select(tab_frame)
+        self.open_files[file_path] = {"frame": tab_frame}
         
-        # Display content based on file type
-        if file_path.suffix == ".json":
-            self.display_json_file(tab_frame, file_path)
+        self.display_file(tab_frame, file_path)
+    
+    def close_current_tab(self, event=None):
+        """Close the current tab"""
+        current_tab = self.notebook.select()
+        if current_tab:
+            self.close_tab(self.notebook.nametowidget(current_tab))
+    
+    def close_tab_at(self, event):
+        """Close the tab under the mouse (middle click)"""
+        try:
+            index = self.notebook.index(f"@{event.x},{event.y}")
+        except tk.TclError:
+            return
+        self.close_tab(self.notebook.nametowidget(self.notebook.tabs()[index]))
+    
+    def close_tab(self, frame):
+        """Close a tab and cancel any loading still running in it"""
+        for file_path, info in list(self.open_files.items()):
+            if info["frame"] is frame:
+                loader = info.get("loader")
+                if loader is not None:
+                    loader.cancel()
+                del self.open_files[file_path]
+        
+        for tab_name, tab in list(self.open_tabs.items()):
+            if tab is frame:
+                del self.open_tabs[tab_name]
+        
+        self.notebook.forget(frame)
+        frame.destroy()
+    
+    def display_file(self, parent, file_path, editable=False):
+        """Display file content based on file type"""
+        if file_path.suffix in [".png", ".jpg"]:
+            self.display_image_info(parent, file_path)
+        elif not editable and (self.get_file_stat(file_path) or (0, 0))[1] >= self.LARGE_FILE_SIZE:
+            # Huge files open in a read-only view that only renders the visible lines
+            self.display_large_file(parent, file_path)
+        elif file_path.suffix == ".json":
+            self.display_json_file(parent, file_path)
         elif file_path.suffix == ".lang":
-            self.display_text_file(tab_frame, file_path)
-        elif file_path.suffix in [".png", ".jpg"]:
-            self.display_image_info(tab_frame, file_path)
+            self.display_text_file(parent, file_path)
         else:
-            self.display_text_file(tab_frame, file_path)
+            self.display_text_file(parent, file_path)
     
     def display_json_file(self, parent, file_path):
         """Display JSON file content"""
+        # Loading progress, removed once the file is shown
+        progress_frame = ttk.Frame(parent)
+        progress_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        ttk.Label(progress_frame, text="Loading...").pack(side=tk.LEFT)
+        progress_bar = ttk.Progressbar(progress_frame, mode="indeterminate", length=200)
+        progress_bar.pack(side=tk.LEFT, padx=5)
+        progress_bar.start()
+        
         # Create text box
         text_frame = ttk.Frame(parent)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -345,35 +482,92 @@ Reference Documentation: https://learn.microsoft.com/en-us/minecraft/creator/"""
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         text_widget.config(xscrollcommand=scrollbar_x.set)
         
-        # Load file content
+        # Save button (enabled once loading has finished)
+        save_btn = ttk.Button(parent, text="Save Changes", state="disabled",
+                             command=lambda: self.save_json_file(file_path, text_widget))
+        save_btn.pack(pady=5)
+        
+        def on_progress(fraction):
+            if str(progress_bar["mode"]) != "determinate":
+                # Parsing is done, switch to showing insert progress
+                progress_bar.stop()
+                progress_bar.config(mode="determinate", maximum=100)
+            progress_bar["value"] = fraction * 100
+        
+        def on_done():
+            progress_frame.destroy()
+            save_btn.config(state="normal")
+            
+            # Remember the loaded file state
+            self.track_open_file(file_path, text_widget)
+        
+        # Parse and format on a worker thread, insert the text in chunks
+        loader = ChunkedTextLoader(text_widget, lambda: self.read_json_for_display(file_path),
+                                   on_progress=on_progress, on_done=on_done)
+        if file_path in self.open_files:
+            self.open_files[file_path]["loader"] = loader
+        loader.start()
+    
+    def read_json_for_display(self, file_path):
+        """Read and format a JSON file for display (runs on a worker thread)"""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-                # Format JSON
-                try:
-                    json_obj = json.loads(content)
-                    formatted = json.dumps(json_obj, indent=2, ensure_ascii=False)
-                    text_widget.insert(1.0, formatted)
-                except:
-                    text_widget.insert(1.0, content)
         except Exception as e:
-            text_widget.insert(1.0, f"Unable to read file: {str(e)}")
+            return f"Unable to read file: {str(e)}"
         
-        # Save button
-        save_btn = ttk.Button(parent, text="Save Changes", 
-                             command=lambda: self.save_json_file(file_path, text_widget))
-        save_btn.pack(pady=5)
+        # Format JSON
+        try:
+            json_obj = json.loads(content)
+            return json.dumps(json_obj, indent=2, ensure_ascii=False)
+        except:
+            return content
     
     def display_text_file(self, parent, file_path):
         """Display text file content"""
         text_widget = tk.Text(parent, wrap=tk.WORD)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Read on a worker thread and insert in chunks, so large files do not freeze the window
+        loader = ChunkedTextLoader(text_widget, lambda: self.read_text_for_display(file_path),
+                                   on_done=lambda: self.track_open_file(file_path, text_widget))
+        if file_path in self.open_files:
+            self.open_files[file_path]["loader"] = loader
+        loader.start()
+    
+    def read_text_for_display(self, file_path):
+        """Read a text file for display (runs on a worker thread)"""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                text_widget.insert(1.0, f.read())
+                return f.read()
         except:
-            text_widget.insert(1.0, "Unable to read file")
+            return "Unable to read file"
+    
+    def display_large_file(self, parent, file_path):
+        """Display a large file in a read-only virtualized view"""
+        try:
+            viewer = VirtualTextView(parent, file_path)
+        except Exception as e:
+            ttk.Label(parent, text=f"Unable to read file: {str(e)}").pack(pady=10)
+            return
+        
+        size = viewer.index.size
+        info_frame = ttk.Frame(parent)
+        info_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        ttk.Label(info_frame, text=f"Read-only view: {viewer.line_count} lines, {size / (1024 * 1024):.1f} MB").pack(side=tk.LEFT)
+        ttk.Button(info_frame, text="Edit",
+                  command=lambda: self.edit_large_file(parent, file_path)).pack(side=tk.RIGHT)
+        
+        viewer.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Remember the loaded file state
+        self.track_open_file(file_path)
+    
+    def edit_large_file(self, parent, file_path):
+        """Switch a large file view to an editable buffer"""
+        for widget in parent.winfo_children():
+            widget.destroy()
+        self.display_file(parent, file_path, editable=True)
     
     def display_image_info(self, parent, file_path):
         """Display image information"""
@@ -401,17 +595,370 @@ Type: {file_path.suffix}
         content = text_widget.get(1.0, tk.END).strip()
         try:
             # Validate JSON
-            json.loads(content)
+            document = json.loads(content)
+            
+            # Check against the schema of the file type
+            if not self.check_schema(schema_kind(file_path, self.bp_path, self.rp_path), document):
+                return
             
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(content)
             
+            # Remember the saved file state so the watcher does not reload it
+            self.track_open_file(file_path, text_widget)
+            
             messagebox.showinfo("Success", f"File saved: {file_path}")
         except json.JSONDecodeError as e:
             messagebox.showerror("Error", f"JSON format error: {str(e)}")
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {str(e)}")
     
+    def check_schema(self, kind, document):
+        """Check JSON against the schema of its file type, ask whether to save anyway if it does not match"""
+        errors = schema_errors(kind, document)
+        if not errors:
+            return True
+        
+        lines = [f"{path}: {message}" for path, message in errors[:15]]
+        if len(errors) > 15:
+            lines.append(f"... and {len(errors) - 15} more")
+        return messagebox.askyesno("Schema Check", "The JSON does not match the schema of this file type:\n\n" + "\n".join(lines) + "\n\nSave anyway?")
+    
+    # ==================== Project Index ====================
+    def warn_unknown_references(self, references):
+        """Warn about references to content the project does not define"""
+        # Nothing to check against until the first scan is done
+        if not self.project_index.ready:
+            return
+        
+        unknown = self.project_index.unknown_references(references)
+        if not unknown:
+            return
+        
+        lines = []
+        for field, name, suggestions in unknown:
+            line = f"{self.REFERENCE_FIELDS.get(field, field)}: {name}"
+            if suggestions:
+                line += f" (did you mean {', '.join(suggestions)}?)"
+            lines.append(line)
+        messagebox.showwarning("Warning", "Not found in this project:\n" + "\n".join(lines) + "\n\nThis is fine for content that comes with the game. The JSON was generated anyway.")
+    
+    # ==================== Find in Project ====================
+    def create_search_panel(self, parent):
+        """Create the Find in Project panel"""
+        self.search_entry = ttk.Entry(parent)
+        self.search_entry.pack(fill=tk.X, padx=2, pady=(5, 2))
+        
+        self.search_status = ttk.Label(parent, text="")
+        self.search_status.pack(fill=tk.X, padx=2)
+        
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True, pady=(2, 0))
+        
+        self.search_results = ttk.Treeview(frame, columns=("location", "text"), show="headings", height=20)
+        self.search_results.heading("location", text="Location")
+        self.search_results.heading("text", text="Line")
+        self.search_results.column("location", width=140, stretch=False)
+        self.search_results.column("text", width=200)
+        self.search_results.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.search_results.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.search_results.config(yscrollcommand=scrollbar.set)
+        
+        # Treeview item -> SearchHit
+        self.search_hits = {}
+        self.search_query = ""
+        self.search_after_id = None
+        self.search_worker = SearchWorker(self.search_index, self.root, self.show_search_results)
+        
+        # Search once typing pauses, queries run on a worker thread
+        self.search_entry.bind("<KeyRelease>", self.schedule_search)
+        self.search_entry.bind("<Return>", lambda e: self.run_search())
+        self.search_results.bind("<Double-1>", self.open_search_result)
+        self.search_results.bind("<Return>", self.open_search_result)
+    
+    def show_search_panel(self, event=None):
+        """Switch to the search panel and focus the query"""
+        self.file_notebook.select(self.search_frame)
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, tk.END)
+    
+    def schedule_search(self, event=None):
+        """Run the search shortly after the last keystroke"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(150, self.run_search)
+    
+    def run_search(self):
+        """Send the current query to the search worker"""
+        self.search_after_id = None
+        query = self.search_entry.get()
+        if query == self.search_query:
+            return
+        self.search_query = query
+        
+        if not query.strip():
+            self.show_search_results(query, [])
+            return
+        self.search_status.config(text="Searching..." if self.search_index.ready else "Indexing project...")
+        self.search_worker.submit(query)
+    
+    def show_search_results(self, query, hits):
+        """Show the results of the latest query"""
+        # The query changed while this one ran
+        if query != self.search_query:
+            return
+        
+        self.search_results.delete(*self.search_results.get_children())
+        self.search_hits = {}
+        for hit in hits:
+            item = self.search_results.insert("", tk.END, values=(f"{hit.pack} {hit.relative}:{hit.line}", hit.text))
+            self.search_hits[item] = hit
+        
+        if not query.strip():
+            self.search_status.config(text="")
+        elif not hits:
+            self.search_status.config(text="No results")
+        elif len(hits) >= RESULT_LIMIT:
+            self.search_status.config(text=f"First {len(hits)} results")
+        else:
+            self.search_status.config(text=f"{len(hits)} results")
+    
+    def open_search_result(self, event=None):
+        """Open the selected result"""
+        selection = self.search_results.selection()
+        hit = self.search_hits.get(selection[0]) if selection else None
+        if hit is None:
+            return
+        
+        file_path = Path(hit.path)
+        self.open_file_in_tab(file_path)
+        self.jump_to_search_hit(file_path, hit, self.search_query)
+    
+    def when_file_loaded(self, file_path, callback, attempts=100):
+        """Call callback(text_widget) once the file has been loaded into its tab"""
+        info = self.open_files.get(file_path)
+        if info is None or attempts <= 0:
+            return
+        
+        # The text is still being loaded
+        if "text" not in info:
+            self.root.after(50, lambda: self.when_file_loaded(file_path, callback, attempts - 1))
+            return
+        
+        if info["text"] is not None:
+            callback(info["text"])
+    
+    def jump_to_search_hit(self, file_path, hit, query):
+        """Select a match once the file has been loaded into its tab"""
+        def select(text_widget):
+            # JSON is shown reformatted, so the match is found by its number rather than its line
+            position = None
+            start = "1.0"
+            for _ in range(hit.occurrence + 1):
+                found = text_widget.search(query, start, stopindex=tk.END, nocase=True)
+                if not found:
+                    break
+                position = found
+                start = f"{found}+1c"
+            if position is None:
+                position = f"{hit.line}.{hit.column - 1}"
+            
+            end = f"{position}+{len(query)}c"
+            text_widget.tag_remove(tk.SEL, "1.0", tk.END)
+            text_widget.tag_add(tk.SEL, position, end)
+            text_widget.mark_set(tk.INSERT, end)
+            text_widget.see(position)
+            text_widget.focus_set()
+        
+        self.when_file_loaded(file_path, select)
+    
+    # ==================== Problems ====================
+    def create_problems_panel(self, parent):
+        """Create the Problems panel"""
+        header = ttk.Frame(parent)
+        header.pack(fill=tk.X)
+        ttk.Label(header, text="Problems").pack(side=tk.LEFT, padx=2)
+        self.problems_status = ttk.Label(header, text="", foreground="gray")
+        self.problems_status.pack(side=tk.LEFT, padx=10)
+        
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True, pady=(2, 0))
+        
+        self.problems_tree = ttk.Treeview(frame, columns=("severity", "location", "message"), show="headings", height=6)
+        self.problems_tree.heading("severity", text="Severity")
+        self.problems_tree.heading("location", text="Location")
+        self.problems_tree.heading("message", text="Message")
+        self.problems_tree.column("severity", width=70, stretch=False)
+        self.problems_tree.column("location", width=260, stretch=False)
+        self.problems_tree.column("message", width=400)
+        self.problems_tree.tag_configure("error", foreground="red")
+        self.problems_tree.tag_configure("warning", foreground="#b36b00")
+        self.problems_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.problems_tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.problems_tree.config(yscrollcommand=scrollbar.set)
+        
+        # relative path -> diagnostics, list item -> Diagnostic
+        self.problems = {}
+        self.problem_items = {}
+        # Files are checked on a worker thread
+        self.validation_worker = ValidationWorker(self.project_validator, self.root, self.show_problems)
+        
+        self.problems_tree.bind("<Double-1>", self.open_problem)
+        self.problems_tree.bind("<Return>", self.open_problem)
+    
+    def schedule_validation(self, path):
+        """Check a saved or changed file again"""
+        self.validation_worker.submit([path])
+    
+    def show_problems(self, by_file, full):
+        """Show new diagnostics, after a full check they replace all of them"""
+        if full:
+            self.problems = {}
+        for relative, diagnostics in by_file.items():
+            if diagnostics:
+                self.problems[relative] = diagnostics
+            else:
+                self.problems.pop(relative, None)
+        
+        # Errors first, then by file and line
+        diagnostics = [diagnostic for file_diagnostics in self.problems.values() for diagnostic in file_diagnostics]
+        diagnostics.sort(key=lambda diagnostic: (diagnostic.severity != "error", diagnostic.path, diagnostic.line or 0))
+        
+        self.problems_tree.delete(*self.problems_tree.get_children())
+        self.problem_items = {}
+        for diagnostic in diagnostics[:self.MAX_PROBLEM_ROWS]:
+            severity = "Error" if diagnostic.severity == "error" else "Warning"
+            location = f"{diagnostic.path}:{diagnostic.line}" if diagnostic.line else diagnostic.path
+            item = self.problems_tree.insert("", tk.END, values=(severity, location, diagnostic.message),
+                                             tags=(diagnostic.severity,))
+            self.problem_items[item] = diagnostic
+        
+        errors = sum(1 for diagnostic in diagnostics if diagnostic.severity == "error")
+        warnings = len(diagnostics) - errors
+        status = f"{errors} errors, {warnings} warnings"
+        if len(diagnostics) > self.MAX_PROBLEM_ROWS:
+            status += f" (showing the first {self.MAX_PROBLEM_ROWS})"
+        self.problems_status.config(text=status)
+    
+    def open_problem(self, event=None):
+        """Open the file of the selected problem at its line"""
+        selection = self.problems_tree.selection()
+        diagnostic = self.problem_items.get(selection[0]) if selection else None
+        if diagnostic is None or diagnostic.path is None:
+            return
+        
+        file_path = self.project_path / diagnostic.path
+        if not file_path.is_file():
+            return
+        self.open_file_in_tab(file_path)
+        
+        # Lines refer to the file on disk, reformatted JSON may differ slightly
+        if diagnostic.line:
+            self.when_file_loaded(file_path, lambda text_widget: self.select_line(text_widget, diagnostic.line))
+    
+    def select_line(self, text_widget, line):
+        """Select a whole line"""
+        text_widget.tag_remove(tk.SEL, "1.0", tk.END)
+        text_widget.tag_add(tk.SEL, f"{line}.0", f"{line}.end")
+        text_widget.mark_set(tk.INSERT, f"{line}.0")
+        text_widget.see(f"{line}.0")
+        text_widget.focus_set()
+    
+    # ==================== File Watcher ====================
+    def start_file_watcher(self):
+        """Watch both packs for changes made outside the editor"""
+        self.file_watcher = ProjectWatcher([self.bp_path, self.rp_path])
+        self.file_watcher.subscribe(self.on_files_changed)
+        self.file_watcher.start(self.root)
+        
+        # Stop watching when the editor window closes
+        self.root.bind("<Destroy>", self.stop_file_watcher, add="+")
+    
+    def stop_file_watcher(self, event=None):
+        """Stop the file watcher"""
+        # <Destroy> also fires for every child widget
+        if event is not None and event.widget is not self.root:
+            return
+        self.file_watcher.stop()
+    
+    def on_files_changed(self, changes):
+        """Apply file changes reported by the watcher"""
+        # Keep the project index current
+        self.project_index.apply_changes(changes)
+        self.search_index.apply_changes(changes)
+        
+        # Check changed files and their dependents again
+        if any(kind == RESCAN for kind in changes.values()):
+            self.validation_worker.submit()
+        else:
+            self.validation_worker.submit(changes)
+        
+        for path, kind in changes.items():
+            # Update the file tree
+            for model in self.file_tree_models.values():
+                if kind == RESCAN:
+                    if path == model.root_path:
+                        model.load()
+                elif model.contains(path):
+                    if kind == DELETED:
+                        model.remove(path)
+                    else:
+                        model.add(path)
+            
+            # Reload open tabs that have no unsaved edits
+            if kind == RESCAN:
+                for file_path in list(self.open_files):
+                    self.reload_file_tab(file_path)
+            elif kind != DELETED:
+                self.reload_file_tab(path)
+    
+    def reload_file_tab(self, file_path):
+        """Reload an open file tab if it has no unsaved edits"""
+        info = self.open_files.get(file_path)
+        if info is None:
+            return
+        
+        text_widget = info.get("text")
+        if text_widget is not None and text_widget.edit_modified():
+            return
+        
+        # Unchanged, or written by the editor itself
+        stat = self.get_file_stat(file_path)
+        if stat is None or stat == info.get("stat"):
+            return
+        
+        # Stop a loader that is still filling the old content
+        loader = info.pop("loader", None)
+        if loader is not None:
+            loader.cancel()
+        
+        for widget in info["frame"].winfo_children():
+            widget.destroy()
+        self.display_file(info["frame"], file_path)
+    
+    def track_open_file(self, file_path, text_widget=None):
+        """Remember the loaded state of an open file tab"""
+        info = self.open_files.get(file_path)
+        if info is None:
+            return
+        
+        info["text"] = text_widget
+        info["stat"] = self.get_file_stat(file_path)
+        if text_widget is not None:
+            text_widget.edit_modified(False)
+    
+    def get_file_stat(self, file_path):
+        """Get the (mtime, size) of a file, or None if it is missing"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
     def show_config_tab(self, tab_name):
         """Show configuration tab"""
         if tab_name in self.open_tabs:
@@ -1349,6 +1896,11 @@ Type: {file_path.suffix}
         self.zh_name = ttk.Entry(lang_frame, width=30)
         self.zh_name.grid(row=2, column=1, pady=5, padx=5, sticky="w")
         
+        # Language of the localized name, from languages.json and the .lang files
+        self.lang_locale = ttk.Combobox(lang_frame, width=8, state="readonly", postcommand=self.refresh_lang_locales)
+        self.lang_locale.grid(row=2, column=2, pady=5, padx=5, sticky="w")
+        self.refresh_lang_locales()
+        
         ttk.Button(lang_frame, text="Add to Language File", command=self.add_to_lang).grid(row=3, column=0, columnspan=2, pady=10)
         
         # Bottom - Texture list
@@ -1395,6 +1947,26 @@ Type: {file_path.suffix}
         self.damage.config(state=state)
     
     # ==================== Item Related Methods ====================
+    def get_item_spec(self):
+        """Item spec from the form values"""
+        # Durability, food and weapon values only apply when enabled
+        max_durability = self.max_durability.get() if self.has_durability.get() else ""
+        nutrition = self.nutrition.get() if self.is_food.get() else ""
+        saturation = self.saturation.get() if self.is_food.get() else ""
+        damage = self.damage.get() if self.is_weapon.get() else ""
+        
+        return ItemSpec(
+            identifier=self.item_identifier.get().strip(),
+            display_name=self.item_display_name.get().strip(),
+            category=self.item_category.get() or "items",
+            max_stack_size=int(self.max_stack_size.get()) if self.max_stack_size.get() else None,
+            hand_equipped=self.hand_equipped.get(),
+            max_durability=int(max_durability) if max_durability else None,
+            nutrition=int(nutrition) if nutrition and saturation else None,
+            saturation=float(saturation) if nutrition and saturation else None,
+            damage=int(damage) if damage else None
+        )
+    
     def generate_item_json(self):
         """Generate item JSON configuration"""
         # Validate required fields
@@ -1406,64 +1978,10 @@ Type: {file_path.suffix}
             return
         
         # Build item configuration
-        item_config = {
-            "format_version": "1.20.0",
-            "minecraft:item": {
-                "description": {
-                    "identifier": identifier,
-                    "category": self.item_category.get() or "items"
-                },
-                "components": {}
-            }
-        }
-        
-        # Add display name component
-        name_key = f"item.{identifier.replace(':', '.')}.name"
-        item_config["minecraft:item"]["components"]["minecraft:display_name"] = {
-            "value": name_key
-        }
-        
-        # Add icon component
-        icon_key = identifier.replace(':', ':')
-        item_config["minecraft:item"]["components"]["minecraft:icon"] = {
-            "texture": icon_key
-        }
-        
-        # Add max stack size
-        stack_size = self.max_stack_size.get()
-        if stack_size:
-            item_config["minecraft:item"]["components"]["minecraft:max_stack_size"] = int(stack_size)
-        
-        # Add hand equipped component
-        if self.hand_equipped.get():
-            item_config["minecraft:item"]["components"]["minecraft:hand_equipped"] = True
-        
-        # Add durability component
-        if self.has_durability.get():
-            max_dura = self.max_durability.get()
-            if max_dura:
-                item_config["minecraft:item"]["components"]["minecraft:durability"] = {
-                    "max_durability": int(max_dura)
-                }
-        
-        # Add food component
-        if self.is_food.get():
-            nutrition = self.nutrition.get()
-            saturation = self.saturation.get()
-            if nutrition and saturation:
-                item_config["minecraft:item"]["components"]["minecraft:food"] = {
-                    "nutrition": int(nutrition),
-                    "saturation_modifier": float(saturation) / float(nutrition) if float(nutrition) > 0 else 0.5
-                }
-        
-        # Add weapon component
-        if self.is_weapon.get():
-            damage = self.damage.get()
-            if damage:
-                item_config["minecraft:item"]["components"]["minecraft:damage"] = int(damage)
+        item_config = build_item(self.get_item_spec())
         
         # Convert to JSON string
-        json_str = json.dumps(item_config, indent=2, ensure_ascii=False)
+        json_str = to_json(item_config)
         
         # Display in preview
         self.item_json_preview.delete(1.0, tk.END)
@@ -1471,14 +1989,8 @@ Type: {file_path.suffix}
         
         # Auto-generate filename
         if not self.item_filename.get().strip():
-            name_parts = identifier.split(":")
-            if len(name_parts) > 1:
-                suggested_name = name_parts[1]
-            else:
-                suggested_name = identifier.replace(":", "_")
-            
             self.item_filename.delete(0, tk.END)
-            self.item_filename.insert(0, suggested_name)
+            self.item_filename.insert(0, suggest_filename(identifier))
     
     def save_item_to_behavior(self):
         """Save item JSON to behavior pack"""
@@ -1494,6 +2006,10 @@ Type: {file_path.suffix}
             messagebox.showerror("Error", f"JSON format error: {str(e)}")
             return
         
+        # Check against the schema of the file type
+        if not self.check_schema("item", json_obj):
+            return
+        
         # Get filename
         filename = self.item_filename.get().strip()
         if not filename:
@@ -1523,14 +2039,31 @@ Type: {file_path.suffix}
                                       "Tip: Don't forget to configure corresponding textures and localization names in the resource pack")
             
             # Refresh file tree
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {str(e)}")
     
     # ==================== Block Related Methods ====================
+    def get_block_spec(self):
+        """Block spec from the form values"""
+        return BlockSpec(
+            identifier=self.block_identifier.get().strip(),
+            display_name=self.block_display_name.get().strip(),
+            category=self.block_category.get() or "construction",
+            light_emission=float(self.block_light_emission.get() or 0),
+            destroy_time=float(self.block_hardness.get() or 1.5),
+            explosion_resistance=float(self.block_resistance.get() or 10),
+            flammable=self.block_flammable.get(),
+            texture=self.block_texture.get(),
+            render_method=self.block_material.get() or "opaque",
+            unit_cube=self.block_unit_cube.get(),
+            geometry=self.block_geometry.get().strip(),
+            transparent=self.block_transparent.get(),
+            replaceable=self.block_replaceable.get(),
+            loot=self.block_loot_item.get().strip()
+        )
+    
     def generate_block_json(self):
         """Generate block JSON configuration"""
         # Validate required fields
@@ -1542,67 +2075,23 @@ Type: {file_path.suffix}
             return
         
         # Build block configuration
-        block_config = {
-            "format_version": "1.20.0",
-            "minecraft:block": {
-                "description": {
-                    "identifier": identifier,
-                    "category": self.block_category.get() or "construction"
-                },
-                "components": {
-                    "minecraft:block_light_emission": float(self.block_light_emission.get() or 0),
-                    "minecraft:destroy_time": float(self.block_hardness.get() or 1.5),
-                    "minecraft:explosion_resistance": float(self.block_resistance.get() or 10),
-                    "minecraft:friction": 0.6,
-                    "minecraft:flammable": {
-                        "burn_odds": 0 if not self.block_flammable.get() else 5
-                    },
-                    "minecraft:map_color": "#ffffff",
-                    "minecraft:material_instances": {
-                        "*": {
-                            "texture": self.block_texture.get() or identifier.replace(':', ':'),
-                            "render_method": self.block_material.get() or "opaque"
-                        }
-                    }
-                }
-            }
-        }
-        
-        # Add unit cube geometry
-        if self.block_unit_cube.get():
-            block_config["minecraft:block"]["components"]["minecraft:geometry"] = "minecraft:geometry.full_block"
-        elif self.block_geometry.get().strip():
-            block_config["minecraft:block"]["components"]["minecraft:geometry"] = self.block_geometry.get().strip()
-        
-        # Add transparent property
-        if self.block_transparent.get():
-            block_config["minecraft:block"]["components"]["minecraft:breathability"] = "air"
-        
-        # Add replaceable property
-        if self.block_replaceable.get():
-            block_config["minecraft:block"]["components"]["minecraft:replaceable"] = True
-        
-        # Add loot
-        if self.block_loot_item.get().strip():
-            block_config["minecraft:block"]["components"]["minecraft:loot"] = self.block_loot_item.get().strip()
+        spec = self.get_block_spec()
+        block_config = build_block(spec)
         
         # Convert to JSON string
-        json_str = json.dumps(block_config, indent=2, ensure_ascii=False)
+        json_str = to_json(block_config)
         
         # Display in preview
         self.block_json_preview.delete(1.0, tk.END)
         self.block_json_preview.insert(1.0, json_str)
         
+        # Check references to other project content
+        self.warn_unknown_references(block_references(spec))
+        
         # Auto-generate filename
         if not self.block_filename.get().strip():
-            name_parts = identifier.split(":")
-            if len(name_parts) > 1:
-                suggested_name = name_parts[1]
-            else:
-                suggested_name = identifier.replace(":", "_")
-            
             self.block_filename.delete(0, tk.END)
-            self.block_filename.insert(0, suggested_name)
+            self.block_filename.insert(0, suggest_filename(identifier))
     
     def save_block_to_behavior(self):
         """Save block JSON to behavior pack"""
@@ -1618,6 +2107,10 @@ Type: {file_path.suffix}
             messagebox.showerror("Error", f"JSON format error: {str(e)}")
             return
         
+        # Check against the schema of the file type
+        if not self.check_schema("block", json_obj):
+            return
+        
         # Get filename
         filename = self.block_filename.get().strip()
         if not filename:
@@ -1641,20 +2134,39 @@ Type: {file_path.suffix}
             display_name = self.block_display_name.get().strip()
             
             if identifier and display_name:
-                name_key = f"tile.{identifier.replace(':', '.')}.name"
+                name_key = display_name_key("tile", identifier)
                 self.update_language_files_custom(name_key, display_name)
             
             messagebox.showinfo("Success", f"Block configuration saved to behavior pack:\n{file_path}")
             
             # Refresh file tree
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {str(e)}")
     
     # ==================== Entity Related Methods ====================
+    def get_entity_spec(self):
+        """Entity spec from the form values"""
+        return EntitySpec(
+            identifier=self.entity_identifier.get().strip(),
+            display_name=self.entity_display_name.get().strip(),
+            family=self.entity_type.get(),
+            health=int(self.entity_health.get() or 20),
+            speed=float(self.entity_speed.get() or 0.25),
+            damage=int(self.entity_damage.get() or 0),
+            knockback_resistance=float(self.entity_knockback_resistance.get() or 0),
+            behavior=self.entity_behavior.get(),
+            equipment_table=self.entity_equipment_table.get().strip() if self.entity_equipment.get() else "",
+            loot_table=self.entity_loot_table.get().strip(),
+            breedable=self.entity_baby.get(),
+            spawnable=self.entity_spawnable.get(),
+            biome=self.entity_biome.get(),
+            spawn_weight=int(self.entity_spawn_weight.get() or 10),
+            spawn_min=int(self.entity_spawn_min.get() or 2),
+            spawn_max=int(self.entity_spawn_max.get() or 4)
+        )
+    
     def generate_entity_json(self):
         """Generate entity JSON configuration"""
         # Validate required fields
@@ -1666,98 +2178,23 @@ Type: {file_path.suffix}
             return
         
         # Build entity configuration
-        entity_config = {
-            "format_version": "1.20.0",
-            "minecraft:entity": {
-                "description": {
-                    "identifier": identifier,
-                    "is_spawnable": self.entity_spawnable.get(),
-                    "is_summonable": True,
-                    "is_experimental": False
-                },
-                "component_groups": {},
-                "components": {
-                    "minecraft:type_family": {
-                        "family": [self.entity_type.get()]
-                    },
-                    "minecraft:health": {
-                        "value": int(self.entity_health.get() or 20),
-                        "max": int(self.entity_health.get() or 20)
-                    },
-                    "minecraft:movement": {
-                        "value": float(self.entity_speed.get() or 0.25)
-                    },
-                    "minecraft:attack": {
-                        "damage": int(self.entity_damage.get() or 0)
-                    },
-                    "minecraft:knockback_resistance": {
-                        "value": float(self.entity_knockback_resistance.get() or 0)
-                    },
-                    "minecraft:nameable": {
-                        "always_show": True,
-                        "allow_name_tag_renaming": True
-                    },
-                    "minecraft:despawn": {
-                        "despawn_from_distance": {
-                            "min_distance": 128,
-                            "max_distance": 256
-                        }
-                    }
-                },
-                "events": {}
-            }
-        }
-        
-        # Add behavior
-        if self.entity_behavior.get():
-            behavior_map = {
-                "idle": "minecraft:behavior.look_around",
-                "walk": "minecraft:behavior.random_stroll",
-                "look": "minecraft:behavior.look_at_player",
-                "panic": "minecraft:behavior.panic",
-                "follow_owner": "minecraft:behavior.follow_owner"
-            }
-            
-            if self.entity_behavior.get() in behavior_map:
-                entity_config["minecraft:entity"]["components"][behavior_map[self.entity_behavior.get()]] = {}
-        
-        # Add equipment
-        if self.entity_equipment.get() and self.entity_equipment_table.get().strip():
-            entity_config["minecraft:entity"]["components"]["minecraft:equipment"] = {
-                "table": self.entity_equipment_table.get().strip()
-            }
-        
-        # Add loot table
-        if self.entity_loot_table.get().strip():
-            entity_config["minecraft:entity"]["components"]["minecraft:loot"] = {
-                "table": self.entity_loot_table.get().strip()
-            }
-        
-        # Add breedable component
-        if self.entity_baby.get():
-            entity_config["minecraft:entity"]["components"]["minecraft:breedable"] = {
-                "require_tame": False,
-                "breeds_with": [],
-                "breed_items": []
-            }
+        spec = self.get_entity_spec()
+        entity_config = build_entity(spec)
         
         # Convert to JSON string
-        json_str = json.dumps(entity_config, indent=2, ensure_ascii=False)
+        json_str = to_json(entity_config)
         
         # Display in preview
         self.entity_json_preview.delete(1.0, tk.END)
         self.entity_json_preview.insert(1.0, json_str)
         
+        # Check references to other project content
+        self.warn_unknown_references(entity_references(spec))
+        
         # Auto-generate filename
         if not self.entity_filename.get().strip():
-            name_parts = identifier.split(":")
-            if len(name_parts) > 1:
-                suggested_name = name_parts[1]
-            else:
-                suggested_name = identifier.replace(":", "_")
-            
             self.entity_filename.delete(0, tk.END)
-            self.entity_filename.insert(0, suggested_name)
+            self.entity_filename.insert(0, suggest_filename(identifier))
     
     def save_entity_to_behavior(self):
         """Save entity JSON to behavior pack"""
@@ -1773,6 +2210,10 @@ Type: {file_path.suffix}
             messagebox.showerror("Error", f"JSON format error: {str(e)}")
             return
         
+        # Check against the schema of the file type
+        if not self.check_schema("entity", json_obj):
+            return
+        
         # Get filename
         filename = self.entity_filename.get().strip()
         if not filename:
@@ -1796,7 +2237,7 @@ Type: {file_path.suffix}
             display_name = self.entity_display_name.get().strip()
             
             if identifier and display_name:
-                name_key = f"entity.{identifier.replace(':', '.')}.name"
+                name_key = display_name_key("entity", identifier)
                 self.update_language_files_custom(name_key, display_name)
             
             # If spawn rules exist, save spawn rules
@@ -1806,51 +2247,28 @@ Type: {file_path.suffix}
             messagebox.showinfo("Success", f"Entity configuration saved to behavior pack:\n{file_path}")
             
             # Refresh file tree
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {str(e)}")
     
     def save_spawn_rules(self, entity_id):
         """Save spawn rules"""
-        spawn_config = {
-            "format_version": "1.8.0",
-            "minecraft:spawn_rules": {
-                "description": {
-                    "identifier": entity_id,
-                    "population_control": self.entity_type.get()
-                },
-                "conditions": [
-                    {
-                        "minecraft:spawns_on_surface": {},
-                        "minecraft:weight": {
-                            "default": int(self.entity_spawn_weight.get() or 10)
-                        },
-                        "minecraft:herd": {
-                            "min_size": int(self.entity_spawn_min.get() or 2),
-                            "max_size": int(self.entity_spawn_max.get() or 4)
-                        },
-                        "minecraft:biome_filter": {
-                            "test": "has_biome_tag",
-                            "operator": "==",
-                            "value": self.entity_biome.get()
-                        }
-                    }
-                ]
-            }
-        }
+        spec = self.get_entity_spec()
+        spec.identifier = entity_id
+        spawn_config = build_spawn_rules(spec)
         
         # Save to spawn_rules folder
         spawn_path = self.bp_path / "spawn_rules"
         spawn_path.mkdir(exist_ok=True)
         
-        name_parts = entity_id.split(":")
-        filename = f"{name_parts[1] if len(name_parts) > 1 else entity_id}.json"
+        filename = f"{suggest_filename(entity_id)}.json"
         
         with open(spawn_path / filename, "w", encoding="utf-8") as f:
             json.dump(spawn_config, f, indent=2)
+        
+        # Refresh file tree
+        self.refresh_file_tree(spawn_path / filename)
     
     # ==================== Recipe Related Methods ====================
     def update_recipe_ui(self):
@@ -1914,135 +2332,56 @@ Type: {file_path.suffix}
         self.brewing_reagent = ttk.Entry(self.brewing_frame, width=30)
         self.brewing_reagent.grid(row=1, column=1, pady=5, padx=5, sticky="w")
     
+    def get_recipe_spec(self):
+        """Recipe spec from the form values"""
+        return RecipeSpec(
+            recipe_type=self.recipe_type.get(),
+            output=self.recipe_output.get().strip(),
+            output_count=int(self.recipe_output_count.get() or 1),
+            identifier=self.recipe_identifier.get().strip(),
+            grid=[[self.recipe_grid[i][j].get().strip() for j in range(3)] for i in range(3)],
+            input=self.furnace_input.get().strip() if self.recipe_type.get() == "furnace" and hasattr(self, 'furnace_input') else
+                  self.brewing_input.get().strip() if self.recipe_type.get() == "brewing" and hasattr(self, 'brewing_input') else "",
+            reagent=self.brewing_reagent.get().strip() if hasattr(self, 'brewing_reagent') else ""
+        )
+    
     def generate_recipe_json(self):
         """Generate recipe JSON configuration"""
-        recipe_type = self.recipe_type.get()
-        output = self.recipe_output.get().strip()
-        output_count = self.recipe_output_count.get() or "1"
+        spec = self.get_recipe_spec()
         
-        if not output:
+        if not spec.output:
             messagebox.showwarning("Warning", "Please enter output item")
             return
         
-        # Build recipe configuration
-        if recipe_type == "crafting_shaped":
-            # Shaped crafting
-            pattern = []
-            keys = {}
-            
-            # Read 3x3 grid
-            for i in range(3):
-                row = ""
-                for j in range(3):
-                    item = self.recipe_grid[i][j].get().strip()
-                    if item:
-                        key = chr(65 + j)  # A, B, C, ...
-                        row += key
-                        keys[key] = {"item": item}
-                    else:
-                        row += " "
-                if row.strip():
-                    pattern.append(row)
-            
-            if not pattern:
+        # Check the inputs of the selected recipe type
+        if spec.recipe_type in ["crafting_shaped", "crafting_shapeless"]:
+            if not any(item for row in spec.grid for item in row):
                 messagebox.showwarning("Warning", "Please enter at least one item")
                 return
-            
-            recipe_config = {
-                "format_version": "1.20.0",
-                "minecraft:recipe_shaped": {
-                    "description": {
-                        "identifier": self.recipe_identifier.get().strip() or f"wiki:recipe_{output.split(':')[-1]}"
-                    },
-                    "tags": ["crafting_table"],
-                    "pattern": pattern,
-                    "key": keys,
-                    "result": {
-                        "item": output,
-                        "count": int(output_count)
-                    }
-                }
-            }
-            
-        elif recipe_type == "crafting_shapeless":
-            # Shapeless crafting
-            ingredients = []
-            for i in range(3):
-                for j in range(3):
-                    item = self.recipe_grid[i][j].get().strip()
-                    if item:
-                        ingredients.append({"item": item})
-            
-            if not ingredients:
-                messagebox.showwarning("Warning", "Please enter at least one item")
-                return
-            
-            recipe_config = {
-                "format_version": "1.20.0",
-                "minecraft:recipe_shapeless": {
-                    "description": {
-                        "identifier": self.recipe_identifier.get().strip() or f"wiki:recipe_{output.split(':')[-1]}"
-                    },
-                    "tags": ["crafting_table"],
-                    "ingredients": ingredients,
-                    "result": {
-                        "item": output,
-                        "count": int(output_count)
-                    }
-                }
-            }
-            
-        elif recipe_type == "furnace":
-            # Furnace recipe
-            if not hasattr(self, 'furnace_input') or not self.furnace_input.get().strip():
-                messagebox.showwarning("Warning", "Please enter input item")
-                return
-            
-            recipe_config = {
-                "format_version": "1.20.0",
-                "minecraft:recipe_furnace": {
-                    "description": {
-                        "identifier": self.recipe_identifier.get().strip() or f"wiki:furnace_{output.split(':')[-1]}"
-                    },
-                    "tags": ["furnace", "blast_furnace", "smoker"],
-                    "input": self.furnace_input.get().strip(),
-                    "output": output,
-                    "output_count": int(output_count)
-                }
-            }
-            
-        elif recipe_type == "brewing":
-            # Brewing recipe
-            if not hasattr(self, 'brewing_input') or not self.brewing_input.get().strip():
+        elif spec.recipe_type in ["furnace", "brewing"]:
+            if not spec.input:
                 messagebox.showwarning("Warning", "Please enter input item")
                 return
-            
-            recipe_config = {
-                "format_version": "1.20.0",
-                "minecraft:recipe_brewing_mix": {
-                    "description": {
-                        "identifier": self.recipe_identifier.get().strip() or f"wiki:brewing_{output.split(':')[-1]}"
-                    },
-                    "tags": ["brewing_stand"],
-                    "input": self.brewing_input.get().strip(),
-                    "reagent": self.brewing_reagent.get().strip() if hasattr(self, 'brewing_reagent') else "",
-                    "output": output
-                }
-            }
         else:
             messagebox.showwarning("Warning", "Please select a valid recipe type")
             return
         
+        # Build recipe configuration
+        recipe_config = build_recipe(spec)
+        
         # Convert to JSON string
-        json_str = json.dumps(recipe_config, indent=2, ensure_ascii=False)
+        json_str = to_json(recipe_config)
         
         # Display in preview
         self.recipe_json_preview.delete(1.0, tk.END)
         self.recipe_json_preview.insert(1.0, json_str)
         
+        # Check references to other project content
+        self.warn_unknown_references(recipe_references(spec))
+        
         # Auto-generate filename
         if not self.recipe_filename.get().strip():
-            suggested_name = f"{output.split(':')[-1]}_{recipe_type}"
+            suggested_name = f"{spec.output.split(':')[-1]}_{spec.recipe_type}"
             self.recipe_filename.delete(0, tk.END)
             self.recipe_filename.insert(0, suggested_name)
     
@@ -2060,6 +2399,10 @@ Type: {file_path.suffix}
             messagebox.showerror("Error", f"JSON format error: {str(e)}")
             return
         
+        # Check against the schema of the file type
+        if not self.check_schema("recipe", json_obj):
+            return
+        
         # Get filename
         filename = self.recipe_filename.get().strip()
         if not filename:
@@ -2081,9 +2424,7 @@ Type: {file_path.suffix}
             messagebox.showinfo("Success", f"Recipe configuration saved to behavior pack:\n{file_path}")
             
             # Refresh file tree
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {str(e)}")
@@ -2236,9 +2577,7 @@ Type: {file_path.suffix}
             messagebox.showinfo("Success", f"Item tab configuration saved to behavior pack:\n{file_path}")
             
             # Refresh file tree
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {str(e)}")
@@ -2336,6 +2675,13 @@ Type: {file_path.suffix}
                 del self.loot_pools[pool_index]["entries"][entry_index]
                 self.loot_entries_listbox.delete(entry_index)
     
+    def get_loot_spec(self):
+        """Loot table spec from the loot pools"""
+        return LootSpec(
+            loot_type=self.loot_type.get(),
+            pools=[LootPool(entries=[LootEntry(**entry) for entry in pool["entries"]]) for pool in self.loot_pools]
+        )
+    
     def generate_loot_json(self):
         """Generate loot table JSON configuration"""
         if not self.loot_pools:
@@ -2343,57 +2689,10 @@ Type: {file_path.suffix}
             return
         
         # Build loot table configuration
-        loot_config = {
-            "pools": []
-        }
-        
-        for pool in self.loot_pools:
-            if pool["entries"]:
-                pool_config = {
-                    "rolls": 1,
-                    "entries": []
-                }
-                
-                for entry in pool["entries"]:
-                    entry_config = {
-                        "type": "item",
-                        "name": entry["item"],
-                        "weight": entry["weight"]
-                    }
-                    
-                    # Add count range
-                    if entry["min_count"] != entry["max_count"]:
-                        entry_config["functions"] = [
-                            {
-                                "function": "set_count",
-                                "count": {
-                                    "min": entry["min_count"],
-                                    "max": entry["max_count"]
-                                }
-                            }
-                        ]
-                    else:
-                        entry_config["functions"] = [
-                            {
-                                "function": "set_count",
-                                "count": entry["min_count"]
-                            }
-                        ]
-                    
-                    # Add condition
-                    if entry.get("condition"):
-                        entry_config["conditions"] = [
-                            {
-                                "condition": entry["condition"]
-                            }
-                        ]
-                    
-                    pool_config["entries"].append(entry_config)
-                
-                loot_config["pools"].append(pool_config)
+        loot_config = build_loot_table(self.get_loot_spec())
         
         # Convert to JSON string
-        json_str = json.dumps(loot_config, indent=2, ensure_ascii=False)
+        json_str = to_json(loot_config)
         
         # Display in preview
         self.loot_json_preview.delete(1.0, tk.END)
@@ -2420,6 +2719,10 @@ Type: {file_path.suffix}
             messagebox.showerror("Error", f"JSON format error: {str(e)}")
             return
         
+        # Check against the schema of the file type
+        if not self.check_schema("loot_table", json_obj):
+            return
+        
         # Get filename
         filename = self.loot_filename.get().strip()
         if not filename:
@@ -2448,9 +2751,7 @@ Type: {file_path.suffix}
             messagebox.showinfo("Success", f"Loot table saved to behavior pack:\n{file_path}")
             
             # Refresh file tree
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {str(e)}")
@@ -2483,21 +2784,20 @@ Type: {file_path.suffix}
             return
         
         # Build localization key
-        lang_key = f"item.{item_id.replace(':', '.')}.name"
+        lang_key = display_name_key("item", item_id)
         
         try:
-            # Update English language file
-            en_lang_path = self.rp_path / "texts" / "en_US.lang"
-            if en_lang_path.exists():
-                with open(en_lang_path, "a", encoding="utf-8") as f:
-                    f.write(f"\n{lang_key}={en_name}")
-            
-            # Update localized language file
-            if localized_name:
-                # Use English name as default for other languages
-                # You can add support for other languages here
-                pass
+            # Use English name as default for other languages, their existing names are kept
+            self.lang_store.add(lang_key, {"": en_name})
             
+            # The entered names replace existing ones
+            names = {"en_US": en_name}
+            if localized_name and self.lang_locale.get():
+                names[self.lang_locale.get()] = localized_name
+            self.lang_store.add(lang_key, names, overwrite=True)
+            
+            # Each language file is written once
+            self.lang_store.save()
             messagebox.showinfo("Success", "Added to language file")
             
             # Clear input boxes
@@ -2508,6 +2808,13 @@ Type: {file_path.suffix}
         except Exception as e:
             messagebox.showerror("Error", f"Add failed: {str(e)}")
     
+    def refresh_lang_locales(self):
+        """Fill the localized name language list, English has its own field"""
+        locales = [locale for locale in self.lang_store.locales() if locale != "en_US"]
+        self.lang_locale["values"] = locales
+        if self.lang_locale.get() not in locales:
+            self.lang_locale.set(locales[0] if locales else "")
+    
     def generate_texture_json(self):
         """Generate texture definition file"""
         # Get all texture mappings
@@ -2556,34 +2863,140 @@ Type: {file_path.suffix}
         """Save all texture changes"""
         self.generate_texture_json()
     
+    # ==================== Bulk Import ====================
+    def show_bulk_import_dialog(self):
+        """Import items, blocks and entities from a CSV or JSON table"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Bulk Import")
+        dialog.geometry("520x280")
+        dialog.transient(self.root)
+        
+        frame = ttk.Frame(dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text="Table File:").grid(row=0, column=0, pady=5, sticky="w")
+        path_entry = ttk.Entry(frame, width=40)
+        path_entry.grid(row=0, column=1, pady=5, padx=5, sticky="ew")
+        
+        def browse():
+            filename = filedialog.askopenfilename(
+                title="Select Table",
+                filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json"), ("All files", "*.*")]
+            )
+            if filename:
+                path_entry.delete(0, tk.END)
+                path_entry.insert(0, filename)
+        
+        ttk.Button(frame, text="Browse", command=browse).grid(row=0, column=2, pady=5)
+        
+        ttk.Label(frame, text="Default Type:").grid(row=1, column=0, pady=5, sticky="w")
+        kind_combo = ttk.Combobox(frame, values=["item", "block", "entity"], width=15, state="readonly")
+        kind_combo.grid(row=1, column=1, pady=5, padx=5, sticky="w")
+        kind_combo.set("item")
+        ttk.Label(frame, text="Used for rows without a type column", foreground="gray").grid(row=2, column=1, padx=5, sticky="w")
+        
+        ttk.Label(frame, text="Columns use the field names of the configuration tabs (identifier, display_name, ...).\nOptional columns: type, filename, texture_path and name_<locale> (e.g. name_zh_CN).", foreground="gray", justify=tk.LEFT).grid(row=3, column=0, columnspan=3, pady=10, sticky="w")
+        
+        progress_bar = ttk.Progressbar(frame, mode="determinate")
+        progress_bar.grid(row=4, column=0, columnspan=3, pady=5, sticky="ew")
+        status_label = ttk.Label(frame, text="")
+        status_label.grid(row=5, column=0, columnspan=3, sticky="w")
+        frame.columnconfigure(1, weight=1)
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.grid(row=6, column=0, columnspan=3, pady=(10, 0), sticky="e")
+        import_button = ttk.Button(btn_frame, text="Import")
+        import_button.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT)
+        
+        def start():
+            from quickide.bulk import import_table
+            
+            table_path = path_entry.get().strip()
+            default_kind = kind_combo.get()
+            if not table_path:
+                messagebox.showwarning("Warning", "Please select a table file", parent=dialog)
+                return
+            
+            import_button.config(state=tk.DISABLED)
+            status_label.config(text="Reading table...")
+            
+            # Import on a worker thread, the dialog polls for progress
+            messages = queue.Queue()
+            
+            def work():
+                try:
+                    report = import_table(table_path, self.bp_path, self.rp_path, default_kind=default_kind,
+                                          progress=lambda done, total: messages.put(("progress", done, total)))
+                    messages.put(("done", report))
+                except Exception as e:
+                    messages.put(("error", e))
+            
+            threading.Thread(target=work, name="BulkImport", daemon=True).start()
+            self.poll_bulk_import(dialog, messages, progress_bar, status_label, import_button)
+        
+        import_button.config(command=start)
+    
+    def poll_bulk_import(self, dialog, messages, progress_bar, status_label, import_button):
+        """Show import progress and the result"""
+        if not dialog.winfo_exists():
+            return
+        
+        while True:
+            try:
+                message = messages.get_nowait()
+            except queue.Empty:
+                break
+            
+            if message[0] == "progress":
+                _, done, total = message
+                progress_bar.config(maximum=total, value=done)
+                status_label.config(text=f"Building rows: {done}/{total}")
+            elif message[0] == "error":
+                import_button.config(state=tk.NORMAL)
+                status_label.config(text="")
+                messagebox.showerror("Error", f"Import failed: {message[1]}", parent=dialog)
+                return
+            else:
+                report = message[1]
+                import_button.config(state=tk.NORMAL)
+                status_label.config(text="Import finished")
+                
+                # Refresh file tree
+                for path in report.written:
+                    self.refresh_file_tree(path)
+                
+                result = f"Rows: {report.rows}\nFiles written: {len(report.written)}\nLanguage entries added: {report.lang_entries}\nTexture entries: {report.textures}"
+                if report.errors:
+                    lines = [f"Row {row}: {error}" for row, error in report.errors[:20]]
+                    if len(report.errors) > 20:
+                        lines.append(f"... and {len(report.errors) - 20} more")
+                    result += f"\n\nRows with errors ({len(report.errors)}):\n" + "\n".join(lines)
+                    messagebox.showwarning("Import finished", result, parent=dialog)
+                else:
+                    messagebox.showinfo("Import finished", result, parent=dialog)
+                return
+        
+        dialog.after(100, lambda: self.poll_bulk_import(dialog, messages, progress_bar, status_label, import_button))
+    
     # ==================== Helper Methods ====================
     def update_language_files(self, identifier, display_name):
         """Update language files (items)"""
-        lang_key = f"item.{identifier.replace(':', '.')}.name"
+        lang_key = display_name_key("item", identifier)
         self.update_language_files_custom(lang_key, display_name)
     
     def update_language_files_custom(self, lang_key, display_name):
         """Update language files (custom key)"""
         try:
-            # Update English language file
-            en_lang_path = self.rp_path / "texts" / "en_US.lang"
-            if en_lang_path.exists():
-                with open(en_lang_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                if lang_key not in content:
-                    with open(en_lang_path, "a", encoding="utf-8") as f:
-                        f.write(f"\n{lang_key}={display_name}")
-            
-            # Update Chinese language file (or other languages)
-            # For English version, we might not need Chinese
-            # You can add support for other languages here
+            # Every language of languages.json gets the key, keys that already exist are kept
+            self.lang_store.add(lang_key, {"": display_name})
+            self.lang_store.save()
             
         except Exception as e:
             print(f"Failed to update language files: {e}")
     
     def validate_project(self):
-        """Validate project structure"""
+        """Validate project structure and files"""
         issues = []
         
         # Check necessary folders
@@ -2610,12 +3023,58 @@ Type: {file_path.suffix}
             if not (self.rp_path / "texts").exists():
                 issues.append("⚠️ Resource pack missing texts folder")
         
+        # The files can only be checked when both packs exist
+        if not self.bp_path.exists() or not self.rp_path.exists():
+            messagebox.showinfo("Project Validation", "Project Validation Results:\n\n" + "\n".join(issues))
+            return
+        
+        # Parse and check every JSON file on worker processes, the window stays responsive
+        messages = queue.Queue()
+        
+        def work():
+            try:
+                messages.put(("done", validate_files(self.bp_path, self.rp_path, self.project_path)))
+            except Exception as e:
+                messages.put(("error", e))
+        
+        threading.Thread(target=work, name="ProjectValidation", daemon=True).start()
+        self.poll_validation(messages, issues)
+    
+    def poll_validation(self, messages, issues):
+        """Show the validation result once the files have been checked"""
+        try:
+            message = messages.get_nowait()
+        except queue.Empty:
+            self.root.after(100, lambda: self.poll_validation(messages, issues))
+            return
+        
+        if message[0] == "error":
+            messagebox.showerror("Error", f"Validation failed: {message[1]}")
+            return
+        
+        result = message[1]
+        
+        # Update the Problems panel as well
+        by_file = {}
+        for diagnostic in result.diagnostics:
+            if diagnostic.path is not None:
+                by_file.setdefault(diagnostic.path, []).append(diagnostic)
+        self.show_problems(by_file, True)
+        
+        for diagnostic in result.diagnostics[:30]:
+            icon = "❌" if diagnostic.severity == "error" else "⚠️"
+            location = f"{diagnostic.path}:{diagnostic.line}" if diagnostic.line else diagnostic.path
+            issues.append(f"{icon} {location}: {diagnostic.message}")
+        if len(result.diagnostics) > 30:
+            issues.append(f"... and {len(result.diagnostics) - 30} more")
+        
         if issues:
-            result = "Project Validation Results:\n\n" + "\n".join(issues)
+            summary = f"{result.files} JSON files checked: {len(result.errors)} errors, {len(result.warnings)} warnings"
+            text = "Project Validation Results:\n\n" + "\n".join(issues) + "\n\n" + summary
         else:
-            result = "✅ Project structure is complete, no issues found"
+            text = f"✅ Project is valid, {result.files} JSON files checked, no issues found"
         
-        messagebox.showinfo("Project Validation", result)
+        messagebox.showinfo("Project Validation", text)
     
     def regenerate_uuids(self):
         """Regenerate UUIDs"""
@@ -2682,6 +3141,8 @@ Type: {file_path.suffix}
     
     def open_folder(self, path):
         """Open folder"""
+        import platform
+        
         if platform.system() == "Windows":
             os.startfile(path)
         elif platform.system() == "Darwin":  # macOS
@@ -2759,6 +3220,7 @@ Type: {file_path.suffix}
     def export_addon(self):
         """Export Addon"""
         from datetime import datetime
+        from quickide.export import write_addon
         
         # Select export location
         filename = filedialog.asksaveasfilename(
@@ -2771,32 +3233,54 @@ Type: {file_path.suffix}
             return
         
         try:
-            # Create temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Copy behavior pack and resource pack to temporary directory
-                if self.bp_path.exists():
-                    shutil.copytree(self.bp_path, temp_path / "behavior_pack")
-                
-                if self.rp_path.exists():
-                    shutil.copytree(self.rp_path, temp_path / "resource_pack")
-                
-                # Create ZIP file
-                with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # Add all files
-                    for file in temp_path.rglob("*"):
-                        if file.is_file():
-                            arcname = file.relative_to(temp_path)
-                            zipf.write(file, arcname)
+            # Write both packs into the archive
+            result = write_addon(self.bp_path, self.rp_path, filename, cache_dir=cache_path(self.project_path, "export-cache"),
+                                 minify=self.minify_export.get(), optimize_textures=self.optimize_textures_export.get())
+            
+            messagebox.showinfo("Success", f"Addon exported to:\n{filename}{self.export_summary(result)}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Export failed: {str(e)}")
+    
+    def export_packs(self):
+        """Export each pack as its own .mcpack, reproducibly"""
+        from quickide.export import write_packs
+        
+        # Select output folder
+        folder = filedialog.askdirectory(title="Export Packs")
+        
+        if not folder:
+            return
+        
+        try:
+            # Sorted members with fixed timestamps, identical packs give identical files
+            result = write_packs(self.bp_path, self.rp_path, folder, cache_dir=cache_path(self.project_path, "export-cache"),
+                                 reproducible=True, minify=self.minify_export.get(),
+                                 optimize_textures=self.optimize_textures_export.get())
             
-            messagebox.showinfo("Success", f"Addon exported to:\n{filename}")
+            packs = "\n".join(str(pack) for pack in result.packs)
+            messagebox.showinfo("Success", f"Packs exported to:\n{packs}{self.export_summary(result)}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
     
+    def export_summary(self, result):
+        """Minification, texture and duplicate notes for the export message"""
+        summary = ""
+        if result.minified_saved:
+            summary += f"\n\nMinifying JSON saved {result.minified_saved} bytes"
+        if result.textures_saved:
+            summary += f"\n\nOptimizing textures saved {result.textures_saved} bytes"
+        if result.warnings:
+            summary += f"\n\n{len(result.warnings)} files were left unchanged:\n" + "\n".join(result.warnings[:5])
+        if result.duplicates:
+            summary += f"\n\n{len(result.duplicates)} groups of identical textures:\n" + "\n".join(", ".join(group) for group in result.duplicates[:5])
+        return summary
+    
     def open_docs(self):
         """Open official documentation"""
+        import webbrowser
+        
         webbrowser.open("https://learn.microsoft.com/en-us/minecraft/creator/")
     
     def show_about(self):
@@ -2829,6 +3313,12 @@ Author: Quick Team"""
 
 
 if __name__ == "__main__":
+    # In a frozen build, spawned validation and bulk import workers must not start the app again;
+    # multiprocessing is only imported there so a normal start does not pay for it
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+        freeze_support()
+    
     # Test code
     root = tk.Tk()
     root.geometry("1200x700")
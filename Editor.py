@@ -3,15 +3,42 @@ from tkinter import ttk, messagebox, filedialog
 import json
 from pathlib import Path
 import os
-import shutil
-import uuid
-import zipfile
-import tempfile
-import webbrowser
-import platform
-from datetime import datetime
+import sys
+import queue
+import threading
+from quickide.core import (ItemSpec, BlockSpec, EntitySpec, RecipeSpec, LootSpec, LootPool, LootEntry,
+                           build_item, build_block, build_entity, build_spawn_rules, build_recipe,
+                           build_loot_table, display_name_key, suggest_filename, to_json)
+from quickide.filetree import FileTreeModel
+from quickide.index import ProjectIndex, block_references, entity_references, recipe_references
+from quickide.lang import LangStore
+from quickide.loader import ChunkedTextLoader
+from quickide.project import cache_path
+from quickide.schema import schema_errors, schema_kind
+from quickide.search import RESULT_LIMIT, SearchIndex, SearchWorker
+from quickide.validate import ProjectValidator, ValidationWorker, validate_files
+from quickide.viewer import VirtualTextView
+from quickide.watcher import ProjectWatcher, DELETED, RESCAN
 
 class Editor:
+    # 达到此大小的文件在只读虚拟化视图中打开
+    LARGE_FILE_SIZE = 4 * 1024 * 1024
+    
+    # 问题面板中显示的行数
+    MAX_PROBLEM_ROWS = 1000
+    
+    # 引用警告中显示的表单字段名称
+    REFERENCE_FIELDS = {
+        "loot": "掉落物品",
+        "texture": "纹理",
+        "equipment_table": "装备表",
+        "loot_table": "掉落表",
+        "output": "输出物品",
+        "input": "输入物品",
+        "reagent": "试剂",
+        "ingredient": "材料"
+    }
+    
     def __init__(self, root, project_path):
         self.root = root
         self.project_path = project_path
@@ -23,6 +50,21 @@ class Editor:
         # 加载项目配置
         self.load_project_config()
         
+        # 语言文件只解析一次，磁盘上改动后才重新读取
+        self.lang_store = LangStore(self.rp_path / "texts")
+        
+        # 项目索引，此时还是空的，窗口显示后才开始扫描；使用 .quick 中的缓存
+        self.project_index = ProjectIndex(self.bp_path, self.rp_path, cache_path(self.project_path, "index.db"))
+        
+        # 项目搜索的三元组索引，在第一次搜索时构建
+        self.search_index = SearchIndex(self.bp_path, self.rp_path)
+        
+        # 每个文件的诊断信息；保存后只重新检查该文件及依赖它的文件
+        self.project_validator = ProjectValidator(self.bp_path, self.rp_path, self.project_path)
+        
+        # 文件树在展开时加载文件夹内容（懒加载模式）
+        self.lazy_file_tree = True
+        
         # 创建主框架
         self.main_frame = ttk.Frame(root, padding="5")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -36,6 +78,29 @@ class Editor:
         # 创建左右分栏
         self.create_panels()
         
+        # 先显示窗口，第一次重绘之后再填充文件树并启动后台任务
+        self.root.after_idle(lambda: self.root.after(0, self.start_background_work))
+    
+    def start_background_work(self):
+        """填充文件树并开始索引、监视和检查项目"""
+        # 窗口在显示之前已关闭
+        if not self.root.winfo_exists():
+            return
+        
+        # 文件树（懒加载模式只读取顶层，文件夹在展开时再填充）
+        for model in self.file_tree_models.values():
+            model.load()
+        
+        # 项目中所有标识符、纹理和语言键的索引，在后台构建；
+        # 自上次打开以来未更改的文件直接从 .quick 中的缓存读取
+        self.project_index.build_async()
+        
+        # 监视包的外部更改
+        self.start_file_watcher()
+        
+        # 在后台检查整个项目，结果显示在问题面板中
+        self.validation_worker.submit()
+        
     def load_project_config(self):
         """加载项目配置"""
         config_path = self.project_path / "project.json"
@@ -58,8 +123,16 @@ class Editor:
         menubar.add_cascade(label="文件", menu=file_menu)
         file_menu.add_command(label="保存", command=self.save_all, accelerator="Ctrl+S")
         file_menu.add_command(label="另存为", command=self.save_as)
+        file_menu.add_command(label="关闭选项卡", command=self.close_current_tab, accelerator="Ctrl+W")
         file_menu.add_separator()
         file_menu.add_command(label="导出Addon", command=self.export_addon)
+        file_menu.add_command(label="导出包(.mcpack)", command=self.export_packs)
+        # 导出的包中JSON紧凑且去掉注释
+        self.minify_export = tk.BooleanVar(value=False)
+        file_menu.add_checkbutton(label="导出时压缩JSON", variable=self.minify_export)
+        # 导出的包中PNG无损重新编码
+        self.optimize_textures_export = tk.BooleanVar(value=False)
+        file_menu.add_checkbutton(label="导出时优化PNG纹理", variable=self.optimize_textures_export)
         file_menu.add_separator()
         file_menu.add_command(label="退出", command=self.root.destroy)
         
@@ -92,6 +165,9 @@ class Editor:
         menubar.add_cascade(label="工具", menu=tools_menu)
         tools_menu.add_command(label="验证项目结构", command=self.validate_project)
         tools_menu.add_command(label="重新生成UUID", command=self.regenerate_uuids)
+        tools_menu.add_command(label="在文件树中定位当前文件", command=self.reveal_current_file)
+        tools_menu.add_command(label="批量导入...", command=self.show_bulk_import_dialog)
+        tools_menu.add_command(label="在项目中查找", command=self.show_search_panel, accelerator="Ctrl+Shift+F")
         tools_menu.add_separator()
         tools_menu.add_command(label="打开行为包文件夹", command=lambda: self.open_folder(self.bp_path))
         tools_menu.add_command(label="打开资源包文件夹", command=lambda: self.open_folder(self.rp_path))
@@ -139,26 +215,46 @@ class Editor:
         paned.add(left_frame, weight=1)
         
         # 创建标签页来区分BP和RP
-        file_notebook = ttk.Notebook(left_frame)
-        file_notebook.pack(fill=tk.BOTH, expand=True)
+        self.file_notebook = ttk.Notebook(left_frame)
+        self.file_notebook.pack(fill=tk.BOTH, expand=True)
         
         # 行为包标签页
-        bp_frame = ttk.Frame(file_notebook)
-        file_notebook.add(bp_frame, text="行为包 (BP)")
+        bp_frame = ttk.Frame(self.file_notebook)
+        self.file_notebook.add(bp_frame, text="行为包 (BP)")
         self.create_file_tree(bp_frame, self.bp_path, "bp")
         
         # 资源包标签页
-        rp_frame = ttk.Frame(file_notebook)
-        file_notebook.add(rp_frame, text="资源包 (RP)")
+        rp_frame = ttk.Frame(self.file_notebook)
+        self.file_notebook.add(rp_frame, text="资源包 (RP)")
         self.create_file_tree(rp_frame, self.rp_path, "rp")
         
+        # 项目搜索选项卡
+        self.search_frame = ttk.Frame(self.file_notebook)
+        self.file_notebook.add(self.search_frame, text="搜索")
+        self.create_search_panel(self.search_frame)
+        
         # 右侧面板 - 编辑区域
         right_frame = ttk.Frame(paned, padding="5")
         paned.add(right_frame, weight=3)
         
+        # 上方是打开的文件，下方是问题面板
+        right_paned = ttk.PanedWindow(right_frame, orient=tk.VERTICAL)
+        right_paned.pack(fill=tk.BOTH, expand=True)
+        
         # 创建选项卡
-        self.notebook = ttk.Notebook(right_frame)
-        self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = ttk.Notebook(right_paned)
+        right_paned.add(self.notebook, weight=4)
+        
+        problems_frame = ttk.Frame(right_paned)
+        right_paned.add(problems_frame, weight=1)
+        self.create_problems_panel(problems_frame)
+        
+        # 使用Ctrl+W或鼠标中键关闭选项卡
+        self.root.bind("<Control-w>", self.close_current_tab)
+        self.notebook.bind("<Button-2>", self.close_tab_at)
+        
+        # Ctrl+Shift+F 打开项目搜索
+        self.root.bind("<Control-F>", self.show_search_panel)
         
         # 欢迎选项卡
         welcome_frame = ttk.Frame(self.notebook)
@@ -197,6 +293,9 @@ class Editor:
         
         # 存储打开的选项卡
         self.open_tabs = {}
+        
+        # 按路径记录打开的文件选项卡及其文本框和加载时的文件状态
+        self.open_files = {}
     
     def create_file_tree(self, parent, root_path, tree_id):
         """创建文件树"""
@@ -216,97 +315,90 @@ class Editor:
         # 存储树引用
         if not hasattr(self, 'file_trees'):
             self.file_trees = {}
+            self.file_tree_models = {}
+            self.file_tree_pages = {}
         self.file_trees[tree_id] = tree
         
-        # 加载文件
-        self.load_file_tree_node(tree, "", root_path, root_path.name)
+        # 每个文件树所在的包选项卡
+        self.file_tree_pages[tree_id] = parent
+        
+        # 按路径索引的树模型，保存后只更新单个节点
+        model = FileTreeModel(tree, root_path, lazy=self.lazy_file_tree, missing_text="(不存在)")
+        self.file_tree_models[tree_id] = model
+        
+        # 文件在窗口显示后由 start_background_work() 加载
         
         # 绑定双击事件
-        tree.bind("<Double-1>", lambda e: self.open_file_from_tree(e, tree, root_path))
+        tree.bind("<Double-1>", lambda e: self.open_file_from_tree(e, model))
+        
+        # 展开时加载文件夹内容
+        tree.bind("<<TreeviewOpen>>", lambda e: model.expand(tree.focus()))
     
-    def load_file_tree_node(self, tree, parent, path, node_text):
-        """递归加载文件树节点"""
-        if not path.exists():
-            node = tree.insert(parent, "end", text=f"{node_text} (不存在)", open=True)
-            return
+    def refresh_file_tree(self, path):
+        """刷新文件树中单个路径对应的节点"""
+        for model in self.file_tree_models.values():
+            if model.contains(path):
+                model.add(path)
         
-        node = tree.insert(parent, "end", text=node_text, open=True)
+        # 保存的文件立即重新扫描
+        self.project_index.update_file(path)
+        self.search_index.update_file(path)
         
-        try:
-            # 先添加文件夹
-            folders = []
-            files = []
-            
-            for item in path.iterdir():
-                if item.is_dir():
-                    folders.append(item)
-                else:
-                    files.append(item)
-            
-            # 排序
-            folders.sort(key=lambda x: x.name)
-            files.sort(key=lambda x: x.name)
-            
-            # 添加文件夹
-            for folder in folders:
-                self.load_file_tree_node(tree, node, folder, folder.name)
-            
-            # 添加文件
-            for file in files:
-                # 根据文件类型设置不同的图标标记
-                tags = []
-                if file.suffix == '.json':
-                    tags.append('json')
-                elif file.suffix in ['.png', '.jpg', '.tga']:
-                    tags.append('image')
-                elif file.suffix == '.lang':
-                    tags.append('lang')
-                elif file.suffix == '.js':
-                    tags.append('script')
-                elif file.suffix == '.mcfunction':
-                    tags.append('function')
-                
-                tree.insert(node, "end", text=file.name, tags=tags)
-            
-        except Exception as e:
-            print(f"加载文件树失败: {e}")
+        # 重新检查保存的文件及依赖它的文件
+        self.schedule_validation(path)
     
-    def open_file_from_tree(self, event, tree, root_path):
+    def open_file_from_tree(self, event, model):
         """从文件树打开文件"""
-        selection = tree.selection()
+        selection = model.tree.selection()
         if not selection:
             return
         
-        item = selection[0]
-        item_text = tree.item(item, "text")
-        
-        # 检查是否为文件（有扩展名）
-        if "." not in item_text:
+        # 直接查找节点对应的路径，文件夹由模型记录
+        file_path = model.path_of(selection[0])
+        if file_path is None or model.is_folder(file_path):
             return
         
-        # 获取完整路径
-        path_parts = []
-        current = item
-        while current:
-            text = tree.item(current, "text")
-            path_parts.insert(0, text)
-            current = tree.parent(current)
+        if file_path.is_file():
+            self.open_file_in_tab(file_path)
+    
+    def reveal_in_tree(self, file_path):
+        """在文件树中选中文件对应的节点"""
+        for tree_id, model in self.file_tree_models.items():
+            if model.contains(file_path):
+                # 切换到包含该文件的包选项卡
+                self.file_notebook.select(self.file_tree_pages[tree_id])
+                return model.reveal(file_path)
+        return None
+    
+    def reveal_current_file(self):
+        """在文件树中定位当前选项卡的文件"""
+        file_path = self.get_current_file()
+        if file_path is None:
+            messagebox.showwarning("警告", "当前选项卡不是文件")
+            return
+        self.reveal_in_tree(file_path)
+    
+    def get_current_file(self):
+        """获取当前选项卡中显示的文件路径"""
+        current_tab = self.notebook.select()
+        if not current_tab:
+            return None
         
-        # 构建文件路径
-        # 第一个部分是根节点名称，需要跳过
-        if len(path_parts) > 1:
-            file_path = root_path
-            for part in path_parts[1:-1]:  # 跳过根节点和文件名
-                file_path = file_path / part
-            file_path = file_path / path_parts[-1]
-            
-            if file_path.exists() and file_path.is_file():
-                self.open_file_in_tab(file_path)
+        frame = self.notebook.nametowidget(current_tab)
+        for file_path, info in self.open_files.items():
+            if info["frame"] is frame:
+                return file_path
+        return None
     
     def open_file_in_tab(self, file_path):
         """在选项卡中打开文件"""
         tab_name = f"{file_path.parent.name}/{file_path.name}"
         
+        # 已经打开
+        if file_path in self.open_files:
+            self.notebook.select(self.open_files[file_path]["frame"])
+            return
+        
         if tab_name in self.open_tabs:
             self.notebook.select(self.open_tabs[tab_name])
             return
@@ -316,19 +408,64 @@ class Editor:
         self.notebook.add(tab_frame, text=tab_name)
         self.open_tabs[tab_name] = tab_frame
         self.notebook.select(tab_frame)
+        self.open_files[file_path] = {"frame": tab_frame}
         
-        # 根据文件类型显示内容
-        if file_path.suffix == ".json":
-            self.display_json_file(tab_frame, file_path)
+        self.display_file(tab_frame, file_path)
+    
+    def close_current_tab(self, event=None):
+        """关闭当前选项卡"""
+        current_tab = self.notebook.select()
+        if current_tab:
+            self.close_tab(self.notebook.nametowidget(current_tab))
+    
+    def close_tab_at(self, event):
+        """关闭鼠标下方的选项卡（鼠标中键）"""
+        try:
+            index = self.notebook.index(f"@{event.x},{event.y}")
+        except tk.TclError:
+            return
+        self.close_tab(self.notebook.nametowidget(self.notebook.tabs()[index]))
+    
+    def close_tab(self, frame):
+        """关闭选项卡并取消其中仍在进行的加载"""
+        for file_path, info in list(self.open_files.items()):
+            if info["frame"] is frame:
+                loader = info.get("loader")
+                if loader is not None:
+                    loader.cancel()
+                del self.open_files[file_path]
+        
+        for tab_name, tab in list(self.open_tabs.items()):
+            if tab is frame:
+                del self.open_tabs[tab_name]
+        
+        self.notebook.forget(frame)
+        frame.destroy()
+    
+    def display_file(self, parent, file_path, editable=False):
+        """根据文件类型显示文件内容"""
+        if file_path.suffix in [".png", ".jpg"]:
+            self.display_image_info(parent, file_path)
+        elif not editable and (self.get_file_stat(file_path) or (0, 0))[1] >= self.LARGE_FILE_SIZE:
+            # 超大文件在只读视图中打开，只渲染可见的行
+            self.display_large_file(parent, file_path)
+        elif file_path.suffix == ".json":
+            self.display_json_file(parent, file_path)
         elif file_path.suffix == ".lang":
-            self.display_text_file(tab_frame, file_path)
-        elif file_path.suffix in [".png", ".jpg"]:
-            self.display_image_info(tab_frame, file_path)
+            self.display_text_file(parent, file_path)
         else:
-            self.display_text_file(tab_frame, file_path)
+            self.display_text_file(parent, file_path)
     
     def display_json_file(self, parent, file_path):
         """显示JSON文件内容"""
+        # 加载进度，文件显示完成后移除
+        progress_frame = ttk.Frame(parent)
+        progress_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        ttk.Label(progress_frame, text="正在加载...").pack(side=tk.LEFT)
+        progress_bar = ttk.Progressbar(progress_frame, mode="indeterminate", length=200)
+        progress_bar.pack(side=tk.LEFT, padx=5)
+        progress_bar.start()
+        
         # 创建文本框
         text_frame = ttk.Frame(parent)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -345,35 +482,92 @@ class Editor:
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         text_widget.config(xscrollcommand=scrollbar_x.set)
         
-        # 加载文件内容
+        # 保存按钮（加载完成后启用）
+        save_btn = ttk.Button(parent, text="保存修改", state="disabled",
+                             command=lambda: self.save_json_file(file_path, text_widget))
+        save_btn.pack(pady=5)
+        
+        def on_progress(fraction):
+            if str(progress_bar["mode"]) != "determinate":
+                # 解析完成，改为显示插入进度
+                progress_bar.stop()
+                progress_bar.config(mode="determinate", maximum=100)
+            progress_bar["value"] = fraction * 100
+        
+        def on_done():
+            progress_frame.destroy()
+            save_btn.config(state="normal")
+            
+            # 记录加载时的文件状态
+            self.track_open_file(file_path, text_widget)
+        
+        # 在工作线程中解析和格式化，分块插入文本
+        loader = ChunkedTextLoader(text_widget, lambda: self.read_json_for_display(file_path),
+                                   on_progress=on_progress, on_done=on_done)
+        if file_path in self.open_files:
+            self.open_files[file_path]["loader"] = loader
+        loader.start()
+    
+    def read_json_for_display(self, file_path):
+        """读取并格式化JSON文件用于显示（在工作线程中运行）"""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-                # 格式化JSON
-                try:
-                    json_obj = json.loads(content)
-                    formatted = json.dumps(json_obj, indent=2, ensure_ascii=False)
-                    text_widget.insert(1.0, formatted)
-                except:
-                    text_widget.insert(1.0, content)
         except Exception as e:
-            text_widget.insert(1.0, f"无法读取文件: {str(e)}")
+            return f"无法读取文件: {str(e)}"
         
-        # 保存按钮
-        save_btn = ttk.Button(parent, text="保存修改", 
-                             command=lambda: self.save_json_file(file_path, text_widget))
-        save_btn.pack(pady=5)
+        # 格式化JSON
+        try:
+            json_obj = json.loads(content)
+            return json.dumps(json_obj, indent=2, ensure_ascii=False)
+        except:
+            return content
     
     def display_text_file(self, parent, file_path):
         """显示文本文件内容"""
         text_widget = tk.Text(parent, wrap=tk.WORD)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # 在工作线程中读取并分块插入，避免大文件卡住窗口
+        loader = ChunkedTextLoader(text_widget, lambda: self.read_text_for_display(file_path),
+                                   on_done=lambda: self.track_open_file(file_path, text_widget))
+        if file_path in self.open_files:
+            self.open_files[file_path]["loader"] = loader
+        loader.start()
+    
+    def read_text_for_display(self, file_path):
+        """读取文本文件用于显示（在工作线程中运行）"""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                text_widget.insert(1.0, f.read())
+                return f.read()
         except:
-            text_widget.insert(1.0, "无法读取文件")
+            return "无法读取文件"
+    
+    def display_large_file(self, parent, file_path):
+        """在只读虚拟化视图中显示大文件"""
+        try:
+            viewer = VirtualTextView(parent, file_path)
+        except Exception as e:
+            ttk.Label(parent, text=f"无法读取文件: {str(e)}").pack(pady=10)
+            return
+        
+        size = viewer.index.size
+        info_frame = ttk.Frame(parent)
+        info_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        ttk.Label(info_frame, text=f"只读视图: {viewer.line_count} 行, {size / (1024 * 1024):.1f} MB").pack(side=tk.LEFT)
+        ttk.Button(info_frame, text="编辑",
+                  command=lambda: self.edit_large_file(parent, file_path)).pack(side=tk.RIGHT)
+        
+        viewer.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # 记录加载时的文件状态
+        self.track_open_file(file_path)
+    
+    def edit_large_file(self, parent, file_path):
+        """将大文件视图切换为可编辑的文本框"""
+        for widget in parent.winfo_children():
+            widget.destroy()
+        self.display_file(parent, file_path, editable=True)
     
     def display_image_info(self, parent, file_path):
         """显示图片信息"""
@@ -401,17 +595,370 @@ class Editor:
         content = text_widget.get(1.0, tk.END).strip()
         try:
             # 验证JSON
-            json.loads(content)
+            document = json.loads(content)
+            
+            # 按文件类型的架构检查
+            if not self.check_schema(schema_kind(file_path, self.bp_path, self.rp_path), document):
+                return
             
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(content)
             
+            # 记录保存后的文件状态，避免文件监视器重新加载
+            self.track_open_file(file_path, text_widget)
+            
             messagebox.showinfo("成功", f"文件已保存: {file_path}")
         except json.JSONDecodeError as e:
             messagebox.showerror("错误", f"JSON格式错误: {str(e)}")
         except Exception as e:
             messagebox.showerror("错误", f"保存失败: {str(e)}")
     
+    def check_schema(self, kind, document):
+        """按文件类型的架构检查JSON，不符合时询问是否仍然保存"""
+        errors = schema_errors(kind, document)
+        if not errors:
+            return True
+        
+        lines = [f"{path}: {message}" for path, message in errors[:15]]
+        if len(errors) > 15:
+            lines.append(f"... 以及另外 {len(errors) - 15} 个问题")
+        return messagebox.askyesno("架构检查", "JSON不符合此文件类型的架构:\n\n" + "\n".join(lines) + "\n\n仍要保存吗？")
+    
+    # ==================== 项目索引 ====================
+    def warn_unknown_references(self, references):
+        """对项目中未定义的引用内容发出警告"""
+        # 首次扫描完成前无法检查
+        if not self.project_index.ready:
+            return
+        
+        unknown = self.project_index.unknown_references(references)
+        if not unknown:
+            return
+        
+        lines = []
+        for field, name, suggestions in unknown:
+            line = f"{self.REFERENCE_FIELDS.get(field, field)}: {name}"
+            if suggestions:
+                line += f"（是否是 {', '.join(suggestions)}？）"
+            lines.append(line)
+        messagebox.showwarning("警告", "在此项目中未找到:\n" + "\n".join(lines) + "\n\n如果是游戏自带的内容可以忽略。JSON已照常生成。")
+    
+    # ==================== 项目搜索 ====================
+    def create_search_panel(self, parent):
+        """创建项目搜索面板"""
+        self.search_entry = ttk.Entry(parent)
+        self.search_entry.pack(fill=tk.X, padx=2, pady=(5, 2))
+        
+        self.search_status = ttk.Label(parent, text="")
+        self.search_status.pack(fill=tk.X, padx=2)
+        
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True, pady=(2, 0))
+        
+        self.search_results = ttk.Treeview(frame, columns=("location", "text"), show="headings", height=20)
+        self.search_results.heading("location", text="位置")
+        self.search_results.heading("text", text="内容")
+        self.search_results.column("location", width=140, stretch=False)
+        self.search_results.column("text", width=200)
+        self.search_results.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.search_results.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.search_results.config(yscrollcommand=scrollbar.set)
+        
+        # 结果列表项 -> SearchHit
+        self.search_hits = {}
+        self.search_query = ""
+        self.search_after_id = None
+        self.search_worker = SearchWorker(self.search_index, self.root, self.show_search_results)
+        
+        # 停止输入后再搜索，查询在工作线程中运行
+        self.search_entry.bind("<KeyRelease>", self.schedule_search)
+        self.search_entry.bind("<Return>", lambda e: self.run_search())
+        self.search_results.bind("<Double-1>", self.open_search_result)
+        self.search_results.bind("<Return>", self.open_search_result)
+    
+    def show_search_panel(self, event=None):
+        """切换到搜索面板并聚焦搜索框"""
+        self.file_notebook.select(self.search_frame)
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, tk.END)
+    
+    def schedule_search(self, event=None):
+        """在最后一次按键后稍等片刻再搜索"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(150, self.run_search)
+    
+    def run_search(self):
+        """将当前查询发送到搜索线程"""
+        self.search_after_id = None
+        query = self.search_entry.get()
+        if query == self.search_query:
+            return
+        self.search_query = query
+        
+        if not query.strip():
+            self.show_search_results(query, [])
+            return
+        self.search_status.config(text="正在搜索..." if self.search_index.ready else "正在建立索引...")
+        self.search_worker.submit(query)
+    
+    def show_search_results(self, query, hits):
+        """显示最新查询的结果"""
+        # 运行期间查询已更改
+        if query != self.search_query:
+            return
+        
+        self.search_results.delete(*self.search_results.get_children())
+        self.search_hits = {}
+        for hit in hits:
+            item = self.search_results.insert("", tk.END, values=(f"{hit.pack} {hit.relative}:{hit.line}", hit.text))
+            self.search_hits[item] = hit
+        
+        if not query.strip():
+            self.search_status.config(text="")
+        elif not hits:
+            self.search_status.config(text="无结果")
+        elif len(hits) >= RESULT_LIMIT:
+            self.search_status.config(text=f"前 {len(hits)} 条结果")
+        else:
+            self.search_status.config(text=f"{len(hits)} 条结果")
+    
+    def open_search_result(self, event=None):
+        """打开所选结果"""
+        selection = self.search_results.selection()
+        hit = self.search_hits.get(selection[0]) if selection else None
+        if hit is None:
+            return
+        
+        file_path = Path(hit.path)
+        self.open_file_in_tab(file_path)
+        self.jump_to_search_hit(file_path, hit, self.search_query)
+    
+    def when_file_loaded(self, file_path, callback, attempts=100):
+        """文件在选项卡中加载完成后调用 callback(text_widget)"""
+        info = self.open_files.get(file_path)
+        if info is None or attempts <= 0:
+            return
+        
+        # 文本仍在加载
+        if "text" not in info:
+            self.root.after(50, lambda: self.when_file_loaded(file_path, callback, attempts - 1))
+            return
+        
+        if info["text"] is not None:
+            callback(info["text"])
+    
+    def jump_to_search_hit(self, file_path, hit, query):
+        """文件在选项卡中加载完成后选中匹配项"""
+        def select(text_widget):
+            # JSON以格式化后的形式显示，因此按匹配序号而不是行号定位
+            position = None
+            start = "1.0"
+            for _ in range(hit.occurrence + 1):
+                found = text_widget.search(query, start, stopindex=tk.END, nocase=True)
+                if not found:
+                    break
+                position = found
+                start = f"{found}+1c"
+            if position is None:
+                position = f"{hit.line}.{hit.column - 1}"
+            
+            end = f"{position}+{len(query)}c"
+            text_widget.tag_remove(tk.SEL, "1.0", tk.END)
+            text_widget.tag_add(tk.SEL, position, end)
+            text_widget.mark_set(tk.INSERT, end)
+            text_widget.see(position)
+            text_widget.focus_set()
+        
+        self.when_file_loaded(file_path, select)
+    
+    # ==================== 问题面板 ====================
+    def create_problems_panel(self, parent):
+        """创建问题面板"""
+        header = ttk.Frame(parent)
+        header.pack(fill=tk.X)
+        ttk.Label(header, text="问题").pack(side=tk.LEFT, padx=2)
+        self.problems_status = ttk.Label(header, text="", foreground="gray")
+        self.problems_status.pack(side=tk.LEFT, padx=10)
+        
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True, pady=(2, 0))
+        
+        self.problems_tree = ttk.Treeview(frame, columns=("severity", "location", "message"), show="headings", height=6)
+        self.problems_tree.heading("severity", text="严重性")
+        self.problems_tree.heading("location", text="位置")
+        self.problems_tree.heading("message", text="消息")
+        self.problems_tree.column("severity", width=70, stretch=False)
+        self.problems_tree.column("location", width=260, stretch=False)
+        self.problems_tree.column("message", width=400)
+        self.problems_tree.tag_configure("error", foreground="red")
+        self.problems_tree.tag_configure("warning", foreground="#b36b00")
+        self.problems_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.problems_tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.problems_tree.config(yscrollcommand=scrollbar.set)
+        
+        # 相对路径 -> 诊断信息，列表项 -> Diagnostic
+        self.problems = {}
+        self.problem_items = {}
+        # 文件在工作线程中检查
+        self.validation_worker = ValidationWorker(self.project_validator, self.root, self.show_problems)
+        
+        self.problems_tree.bind("<Double-1>", self.open_problem)
+        self.problems_tree.bind("<Return>", self.open_problem)
+    
+    def schedule_validation(self, path):
+        """重新检查已保存或已更改的文件"""
+        self.validation_worker.submit([path])
+    
+    def show_problems(self, by_file, full):
+        """显示新的诊断信息，完整检查后替换全部"""
+        if full:
+            self.problems = {}
+        for relative, diagnostics in by_file.items():
+            if diagnostics:
+                self.problems[relative] = diagnostics
+            else:
+                self.problems.pop(relative, None)
+        
+        # 错误在前，然后按文件和行排序
+        diagnostics = [diagnostic for file_diagnostics in self.problems.values() for diagnostic in file_diagnostics]
+        diagnostics.sort(key=lambda diagnostic: (diagnostic.severity != "error", diagnostic.path, diagnostic.line or 0))
+        
+        self.problems_tree.delete(*self.problems_tree.get_children())
+        self.problem_items = {}
+        for diagnostic in diagnostics[:self.MAX_PROBLEM_ROWS]:
+            severity = "错误" if diagnostic.severity == "error" else "警告"
+            location = f"{diagnostic.path}:{diagnostic.line}" if diagnostic.line else diagnostic.path
+            item = self.problems_tree.insert("", tk.END, values=(severity, location, diagnostic.message),
+                                             tags=(diagnostic.severity,))
+            self.problem_items[item] = diagnostic
+        
+        errors = sum(1 for diagnostic in diagnostics if diagnostic.severity == "error")
+        warnings = len(diagnostics) - errors
+        status = f"{errors} 个错误，{warnings} 个警告"
+        if len(diagnostics) > self.MAX_PROBLEM_ROWS:
+            status += f"（显示前 {self.MAX_PROBLEM_ROWS} 个）"
+        self.problems_status.config(text=status)
+    
+    def open_problem(self, event=None):
+        """打开所选问题所在的文件并跳到对应行"""
+        selection = self.problems_tree.selection()
+        diagnostic = self.problem_items.get(selection[0]) if selection else None
+        if diagnostic is None or diagnostic.path is None:
+            return
+        
+        file_path = self.project_path / diagnostic.path
+        if not file_path.is_file():
+            return
+        self.open_file_in_tab(file_path)
+        
+        # 行号对应磁盘上的文件，格式化显示的JSON可能略有偏差
+        if diagnostic.line:
+            self.when_file_loaded(file_path, lambda text_widget: self.select_line(text_widget, diagnostic.line))
+    
+    def select_line(self, text_widget, line):
+        """选中整行"""
+        text_widget.tag_remove(tk.SEL, "1.0", tk.END)
+        text_widget.tag_add(tk.SEL, f"{line}.0", f"{line}.end")
+        text_widget.mark_set(tk.INSERT, f"{line}.0")
+        text_widget.see(f"{line}.0")
+        text_widget.focus_set()
+    
+    # ==================== 文件监视 ====================
+    def start_file_watcher(self):
+        """监视两个包中在编辑器外部发生的更改"""
+        self.file_watcher = ProjectWatcher([self.bp_path, self.rp_path])
+        self.file_watcher.subscribe(self.on_files_changed)
+        self.file_watcher.start(self.root)
+        
+        # 编辑器窗口关闭时停止监视
+        self.root.bind("<Destroy>", self.stop_file_watcher, add="+")
+    
+    def stop_file_watcher(self, event=None):
+        """停止文件监视"""
+        # <Destroy> 也会为每个子组件触发
+        if event is not None and event.widget is not self.root:
+            return
+        self.file_watcher.stop()
+    
+    def on_files_changed(self, changes):
+        """应用文件监视器报告的更改"""
+        # 保持项目索引为最新
+        self.project_index.apply_changes(changes)
+        self.search_index.apply_changes(changes)
+        
+        # 重新检查更改的文件及依赖它们的文件
+        if any(kind == RESCAN for kind in changes.values()):
+            self.validation_worker.submit()
+        else:
+            self.validation_worker.submit(changes)
+        
+        for path, kind in changes.items():
+            # 更新文件树
+            for model in self.file_tree_models.values():
+                if kind == RESCAN:
+                    if path == model.root_path:
+                        model.load()
+                elif model.contains(path):
+                    if kind == DELETED:
+                        model.remove(path)
+                    else:
+                        model.add(path)
+            
+            # 重新加载没有未保存修改的已打开选项卡
+            if kind == RESCAN:
+                for file_path in list(self.open_files):
+                    self.reload_file_tab(file_path)
+            elif kind != DELETED:
+                self.reload_file_tab(path)
+    
+    def reload_file_tab(self, file_path):
+        """如果已打开的文件选项卡没有未保存的修改，则重新加载"""
+        info = self.open_files.get(file_path)
+        if info is None:
+            return
+        
+        text_widget = info.get("text")
+        if text_widget is not None and text_widget.edit_modified():
+            return
+        
+        # 未更改，或由编辑器自身写入
+        stat = self.get_file_stat(file_path)
+        if stat is None or stat == info.get("stat"):
+            return
+        
+        # 停止仍在填充旧内容的加载
+        loader = info.pop("loader", None)
+        if loader is not None:
+            loader.cancel()
+        
+        for widget in info["frame"].winfo_children():
+            widget.destroy()
+        self.display_file(info["frame"], file_path)
+    
+    def track_open_file(self, file_path, text_widget=None):
+        """记录已打开文件选项卡的加载状态"""
+        info = self.open_files.get(file_path)
+        if info is None:
+            return
+        
+        info["text"] = text_widget
+        info["stat"] = self.get_file_stat(file_path)
+        if text_widget is not None:
+            text_widget.edit_modified(False)
+    
+    def get_file_stat(self, file_path):
+        """获取文件的 (修改时间, 大小)，文件不存在时返回None"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
     def show_config_tab(self, tab_name):
         """显示配置选项卡"""
         if tab_name in self.open_tabs:
@@ -1398,10 +1945,15 @@ class Editor:
         self.en_name = ttk.Entry(lang_frame, width=30)
         self.en_name.grid(row=1, column=1, pady=5, padx=5, sticky="w")
         
-        ttk.Label(lang_frame, text="中文名称:").grid(row=2, column=0, pady=5, padx=5, sticky="w")
+        ttk.Label(lang_frame, text="本地化名称:").grid(row=2, column=0, pady=5, padx=5, sticky="w")
         self.zh_name = ttk.Entry(lang_frame, width=30)
         self.zh_name.grid(row=2, column=1, pady=5, padx=5, sticky="w")
         
+        # 本地化名称的语言，来自languages.json和.lang文件
+        self.lang_locale = ttk.Combobox(lang_frame, width=8, state="readonly", postcommand=self.refresh_lang_locales)
+        self.lang_locale.grid(row=2, column=2, pady=5, padx=5, sticky="w")
+        self.refresh_lang_locales()
+        
         ttk.Button(lang_frame, text="添加到语言文件", command=self.add_to_lang).grid(row=3, column=0, columnspan=2, pady=10)
         
         # 底部 - 纹理列表
@@ -1448,6 +2000,26 @@ class Editor:
         self.damage.config(state=state)
     
     # ==================== 物品相关方法 ====================
+    def get_item_spec(self):
+        """根据表单内容生成物品描述"""
+        # 耐久度、食物和武器属性只在勾选时生效
+        max_durability = self.max_durability.get() if self.has_durability.get() else ""
+        nutrition = self.nutrition.get() if self.is_food.get() else ""
+        saturation = self.saturation.get() if self.is_food.get() else ""
+        damage = self.damage.get() if self.is_weapon.get() else ""
+        
+        return ItemSpec(
+            identifier=self.item_identifier.get().strip(),
+            display_name=self.item_display_name.get().strip(),
+            category=self.item_category.get() or "items",
+            max_stack_size=int(self.max_stack_size.get()) if self.max_stack_size.get() else None,
+            hand_equipped=self.hand_equipped.get(),
+            max_durability=int(max_durability) if max_durability else None,
+            nutrition=int(nutrition) if nutrition and saturation else None,
+            saturation=float(saturation) if nutrition and saturation else None,
+            damage=int(damage) if damage else None
+        )
+    
     def generate_item_json(self):
         """生成物品JSON配置"""
         # 验证必填字段
@@ -1459,64 +2031,10 @@ class Editor:
             return
         
         # 构建物品配置
-        item_config = {
-            "format_version": "1.20.0",
-            "minecraft:item": {
-                "description": {
-                    "identifier": identifier,
-                    "category": self.item_category.get() or "items"
-                },
-                "components": {}
-            }
-        }
-        
-        # 添加显示名称组件
-        name_key = f"item.{identifier.replace(':', '.')}.name"
-        item_config["minecraft:item"]["components"]["minecraft:display_name"] = {
-            "value": name_key
-        }
-        
-        # 添加图标组件
-        icon_key = identifier.replace(':', ':')
-        item_config["minecraft:item"]["components"]["minecraft:icon"] = {
-            "texture": icon_key
-        }
-        
-        # 添加最大堆叠数量
-        stack_size = self.max_stack_size.get()
-        if stack_size:
-            item_config["minecraft:item"]["components"]["minecraft:max_stack_size"] = int(stack_size)
-        
-        # 添加手持组件
-        if self.hand_equipped.get():
-            item_config["minecraft:item"]["components"]["minecraft:hand_equipped"] = True
-        
-        # 添加耐久度组件
-        if self.has_durability.get():
-            max_dura = self.max_durability.get()
-            if max_dura:
-                item_config["minecraft:item"]["components"]["minecraft:durability"] = {
-                    "max_durability": int(max_dura)
-                }
-        
-        # 添加食物组件
-        if self.is_food.get():
-            nutrition = self.nutrition.get()
-            saturation = self.saturation.get()
-            if nutrition and saturation:
-                item_config["minecraft:item"]["components"]["minecraft:food"] = {
-                    "nutrition": int(nutrition),
-                    "saturation_modifier": float(saturation) / float(nutrition) if float(nutrition) > 0 else 0.5
-                }
-        
-        # 添加武器组件
-        if self.is_weapon.get():
-            damage = self.damage.get()
-            if damage:
-                item_config["minecraft:item"]["components"]["minecraft:damage"] = int(damage)
+        item_config = build_item(self.get_item_spec())
         
         # 转换为JSON字符串
-        json_str = json.dumps(item_config, indent=2, ensure_ascii=False)
+        json_str = to_json(item_config)
         
         # 显示在预览框中
         self.item_json_preview.delete(1.0, tk.END)
@@ -1524,14 +2042,8 @@ class Editor:
         
         # 自动生成文件名
         if not self.item_filename.get().strip():
-            name_parts = identifier.split(":")
-            if len(name_parts) > 1:
-                suggested_name = name_parts[1]
-            else:
-                suggested_name = identifier.replace(":", "_")
-            
             self.item_filename.delete(0, tk.END)
-            self.item_filename.insert(0, suggested_name)
+            self.item_filename.insert(0, suggest_filename(identifier))
     
     def save_item_to_behavior(self):
         """保存物品JSON到行为包"""
@@ -1547,6 +2059,10 @@ class Editor:
             messagebox.showerror("错误", f"JSON格式错误: {str(e)}")
             return
         
+        # 按文件类型的架构检查
+        if not self.check_schema("item", json_obj):
+            return
+        
         # 获取文件名
         filename = self.item_filename.get().strip()
         if not filename:
@@ -1576,14 +2092,31 @@ class Editor:
                                       "提示: 别忘了在资源包中配置对应的纹理和本地化名称")
             
             # 刷新文件树
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("错误", f"保存失败: {str(e)}")
     
     # ==================== 方块相关方法 ====================
+    def get_block_spec(self):
+        """根据表单内容生成方块描述"""
+        return BlockSpec(
+            identifier=self.block_identifier.get().strip(),
+            display_name=self.block_display_name.get().strip(),
+            category=self.block_category.get() or "construction",
+            light_emission=float(self.block_light_emission.get() or 0),
+            destroy_time=float(self.block_hardness.get() or 1.5),
+            explosion_resistance=float(self.block_resistance.get() or 10),
+            flammable=self.block_flammable.get(),
+            texture=self.block_texture.get(),
+            render_method=self.block_material.get() or "opaque",
+            unit_cube=self.block_unit_cube.get(),
+            geometry=self.block_geometry.get().strip(),
+            transparent=self.block_transparent.get(),
+            replaceable=self.block_replaceable.get(),
+            loot=self.block_loot_item.get().strip()
+        )
+    
     def generate_block_json(self):
         """生成方块JSON配置"""
         # 验证必填字段
@@ -1595,67 +2128,23 @@ class Editor:
             return
         
         # 构建方块配置
-        block_config = {
-            "format_version": "1.20.0",
-            "minecraft:block": {
-                "description": {
-                    "identifier": identifier,
-                    "category": self.block_category.get() or "construction"
-                },
-                "components": {
-                    "minecraft:block_light_emission": float(self.block_light_emission.get() or 0),
-                    "minecraft:destroy_time": float(self.block_hardness.get() or 1.5),
-                    "minecraft:explosion_resistance": float(self.block_resistance.get() or 10),
-                    "minecraft:friction": 0.6,
-                    "minecraft:flammable": {
-                        "burn_odds": 0 if not self.block_flammable.get() else 5
-                    },
-                    "minecraft:map_color": "#ffffff",
-                    "minecraft:material_instances": {
-                        "*": {
-                            "texture": self.block_texture.get() or identifier.replace(':', ':'),
-                            "render_method": self.block_material.get() or "opaque"
-                        }
-                    }
-                }
-            }
-        }
-        
-        # 添加单位立方体几何体
-        if self.block_unit_cube.get():
-            block_config["minecraft:block"]["components"]["minecraft:geometry"] = "minecraft:geometry.full_block"
-        elif self.block_geometry.get().strip():
-            block_config["minecraft:block"]["components"]["minecraft:geometry"] = self.block_geometry.get().strip()
-        
-        # 添加透光属性
-        if self.block_transparent.get():
-            block_config["minecraft:block"]["components"]["minecraft:breathability"] = "air"
-        
-        # 添加可替代属性
-        if self.block_replaceable.get():
-            block_config["minecraft:block"]["components"]["minecraft:replaceable"] = True
-        
-        # 添加掉落物
-        if self.block_loot_item.get().strip():
-            block_config["minecraft:block"]["components"]["minecraft:loot"] = self.block_loot_item.get().strip()
+        spec = self.get_block_spec()
+        block_config = build_block(spec)
         
         # 转换为JSON字符串
-        json_str = json.dumps(block_config, indent=2, ensure_ascii=False)
+        json_str = to_json(block_config)
         
         # 显示在预览框中
         self.block_json_preview.delete(1.0, tk.END)
         self.block_json_preview.insert(1.0, json_str)
         
+        # 检查对项目中其他内容的引用
+        self.warn_unknown_references(block_references(spec))
+        
         # 自动生成文件名
         if not self.block_filename.get().strip():
-            name_parts = identifier.split(":")
-            if len(name_parts) > 1:
-                suggested_name = name_parts[1]
-            else:
-                suggested_name = identifier.replace(":", "_")
-            
             self.block_filename.delete(0, tk.END)
-            self.block_filename.insert(0, suggested_name)
+            self.block_filename.insert(0, suggest_filename(identifier))
     
     def save_block_to_behavior(self):
         """保存方块JSON到行为包"""
@@ -1671,6 +2160,10 @@ class Editor:
             messagebox.showerror("错误", f"JSON格式错误: {str(e)}")
             return
         
+        # 按文件类型的架构检查
+        if not self.check_schema("block", json_obj):
+            return
+        
         # 获取文件名
         filename = self.block_filename.get().strip()
         if not filename:
@@ -1694,20 +2187,39 @@ class Editor:
             display_name = self.block_display_name.get().strip()
             
             if identifier and display_name:
-                name_key = f"tile.{identifier.replace(':', '.')}.name"
+                name_key = display_name_key("tile", identifier)
                 self.update_language_files_custom(name_key, display_name)
             
             messagebox.showinfo("成功", f"方块配置已保存到行为包:\n{file_path}")
             
             # 刷新文件树
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("错误", f"保存失败: {str(e)}")
     
     # ==================== 实体相关方法 ====================
+    def get_entity_spec(self):
+        """根据表单内容生成实体描述"""
+        return EntitySpec(
+            identifier=self.entity_identifier.get().strip(),
+            display_name=self.entity_display_name.get().strip(),
+            family=self.entity_type.get(),
+            health=int(self.entity_health.get() or 20),
+            speed=float(self.entity_speed.get() or 0.25),
+            damage=int(self.entity_damage.get() or 0),
+            knockback_resistance=float(self.entity_knockback_resistance.get() or 0),
+            behavior=self.entity_behavior.get(),
+            equipment_table=self.entity_equipment_table.get().strip() if self.entity_equipment.get() else "",
+            loot_table=self.entity_loot_table.get().strip(),
+            breedable=self.entity_baby.get(),
+            spawnable=self.entity_spawnable.get(),
+            biome=self.entity_biome.get(),
+            spawn_weight=int(self.entity_spawn_weight.get() or 10),
+            spawn_min=int(self.entity_spawn_min.get() or 2),
+            spawn_max=int(self.entity_spawn_max.get() or 4)
+        )
+    
     def generate_entity_json(self):
         """生成实体JSON配置"""
         # 验证必填字段
@@ -1719,98 +2231,23 @@ class Editor:
             return
         
         # 构建实体配置
-        entity_config = {
-            "format_version": "1.20.0",
-            "minecraft:entity": {
-                "description": {
-                    "identifier": identifier,
-                    "is_spawnable": self.entity_spawnable.get(),
-                    "is_summonable": True,
-                    "is_experimental": False
-                },
-                "component_groups": {},
-                "components": {
-                    "minecraft:type_family": {
-                        "family": [self.entity_type.get()]
-                    },
-                    "minecraft:health": {
-                        "value": int(self.entity_health.get() or 20),
-                        "max": int(self.entity_health.get() or 20)
-                    },
-                    "minecraft:movement": {
-                        "value": float(self.entity_speed.get() or 0.25)
-                    },
-                    "minecraft:attack": {
-                        "damage": int(self.entity_damage.get() or 0)
-                    },
-                    "minecraft:knockback_resistance": {
-                        "value": float(self.entity_knockback_resistance.get() or 0)
-                    },
-                    "minecraft:nameable": {
-                        "always_show": True,
-                        "allow_name_tag_renaming": True
-                    },
-                    "minecraft:despawn": {
-                        "despawn_from_distance": {
-                            "min_distance": 128,
-                            "max_distance": 256
-                        }
-                    }
-                },
-                "events": {}
-            }
-        }
-        
-        # 添加行为
-        if self.entity_behavior.get():
-            behavior_map = {
-                "idle": "minecraft:behavior.look_around",
-                "walk": "minecraft:behavior.random_stroll",
-                "look": "minecraft:behavior.look_at_player",
-                "panic": "minecraft:behavior.panic",
-                "follow_owner": "minecraft:behavior.follow_owner"
-            }
-            
-            if self.entity_behavior.get() in behavior_map:
-                entity_config["minecraft:entity"]["components"][behavior_map[self.entity_behavior.get()]] = {}
-        
-        # 添加装备
-        if self.entity_equipment.get() and self.entity_equipment_table.get().strip():
-            entity_config["minecraft:entity"]["components"]["minecraft:equipment"] = {
-                "table": self.entity_equipment_table.get().strip()
-            }
-        
-        # 添加掉落表
-        if self.entity_loot_table.get().strip():
-            entity_config["minecraft:entity"]["components"]["minecraft:loot"] = {
-                "table": self.entity_loot_table.get().strip()
-            }
-        
-        # 添加繁殖组件
-        if self.entity_baby.get():
-            entity_config["minecraft:entity"]["components"]["minecraft:breedable"] = {
-                "require_tame": False,
-                "breeds_with": [],
-                "breed_items": []
-            }
+        spec = self.get_entity_spec()
+        entity_config = build_entity(spec)
         
         # 转换为JSON字符串
-        json_str = json.dumps(entity_config, indent=2, ensure_ascii=False)
+        json_str = to_json(entity_config)
         
         # 显示在预览框中
         self.entity_json_preview.delete(1.0, tk.END)
         self.entity_json_preview.insert(1.0, json_str)
         
+        # 检查对项目中其他内容的引用
+        self.warn_unknown_references(entity_references(spec))
+        
         # 自动生成文件名
         if not self.entity_filename.get().strip():
-            name_parts = identifier.split(":")
-            if len(name_parts) > 1:
-                suggested_name = name_parts[1]
-            else:
-                suggested_name = identifier.replace(":", "_")
-            
             self.entity_filename.delete(0, tk.END)
-            self.entity_filename.insert(0, suggested_name)
+            self.entity_filename.insert(0, suggest_filename(identifier))
     
     def save_entity_to_behavior(self):
         """保存实体JSON到行为包"""
@@ -1826,6 +2263,10 @@ class Editor:
             messagebox.showerror("错误", f"JSON格式错误: {str(e)}")
             return
         
+        # 按文件类型的架构检查
+        if not self.check_schema("entity", json_obj):
+            return
+        
         # 获取文件名
         filename = self.entity_filename.get().strip()
         if not filename:
@@ -1849,7 +2290,7 @@ class Editor:
             display_name = self.entity_display_name.get().strip()
             
             if identifier and display_name:
-                name_key = f"entity.{identifier.replace(':', '.')}.name"
+                name_key = display_name_key("entity", identifier)
                 self.update_language_files_custom(name_key, display_name)
             
             # 如果有生成规则，保存生成规则
@@ -1859,187 +2300,84 @@ class Editor:
             messagebox.showinfo("成功", f"实体配置已保存到行为包:\n{file_path}")
             
             # 刷新文件树
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("错误", f"保存失败: {str(e)}")
     
     def save_spawn_rules(self, entity_id):
         """保存生成规则"""
-        spawn_config = {
-            "format_version": "1.8.0",
-            "minecraft:spawn_rules": {
-                "description": {
-                    "identifier": entity_id,
-                    "population_control": self.entity_type.get()
-                },
-                "conditions": [
-                    {
-                        "minecraft:spawns_on_surface": {},
-                        "minecraft:weight": {
-                            "default": int(self.entity_spawn_weight.get() or 10)
-                        },
-                        "minecraft:herd": {
-                            "min_size": int(self.entity_spawn_min.get() or 2),
-                            "max_size": int(self.entity_spawn_max.get() or 4)
-                        },
-                        "minecraft:biome_filter": {
-                            "test": "has_biome_tag",
-                            "operator": "==",
-                            "value": self.entity_biome.get()
-                        }
-                    }
-                ]
-            }
-        }
+        spec = self.get_entity_spec()
+        spec.identifier = entity_id
+        spawn_config = build_spawn_rules(spec)
         
         # 保存到spawn_rules文件夹
         spawn_path = self.bp_path / "spawn_rules"
         spawn_path.mkdir(exist_ok=True)
         
-        name_parts = entity_id.split(":")
-        filename = f"{name_parts[1] if len(name_parts) > 1 else entity_id}.json"
+        filename = f"{suggest_filename(entity_id)}.json"
         
         with open(spawn_path / filename, "w", encoding="utf-8") as f:
             json.dump(spawn_config, f, indent=2)
+        
+        # 刷新文件树
+        self.refresh_file_tree(spawn_path / filename)
     
     # ==================== 配方相关方法 ====================
+    def get_recipe_spec(self):
+        """根据表单内容生成配方描述"""
+        return RecipeSpec(
+            recipe_type=self.recipe_type.get(),
+            output=self.recipe_output.get().strip(),
+            output_count=int(self.recipe_output_count.get() or 1),
+            identifier=self.recipe_identifier.get().strip(),
+            grid=[[self.recipe_grid[i][j].get().strip() for j in range(3)] for i in range(3)],
+            input=self.furnace_input.get().strip() if self.recipe_type.get() == "furnace" and hasattr(self, 'furnace_input') else
+                  self.brewing_input.get().strip() if self.recipe_type.get() == "brewing" and hasattr(self, 'brewing_input') else "",
+            reagent=self.brewing_reagent.get().strip() if hasattr(self, 'brewing_reagent') else ""
+        )
+    
     def generate_recipe_json(self):
         """生成配方JSON配置"""
-        recipe_type = self.recipe_type.get()
-        output = self.recipe_output.get().strip()
-        output_count = self.recipe_output_count.get() or "1"
+        spec = self.get_recipe_spec()
         
-        if not output:
+        if not spec.output:
             messagebox.showwarning("警告", "请输入输出物品")
             return
         
-        # 构建配方配置
-        if recipe_type in ["crafting_shaped", "crafting_shapeless"]:
-            # 有序/无序合成
-            if recipe_type == "crafting_shaped":
-                # 有序合成
-                pattern = []
-                keys = {}
-                
-                # 读取3x3网格
-                for i in range(3):
-                    row = ""
-                    for j in range(3):
-                        item = self.recipe_grid[i][j].get().strip()
-                        if item:
-                            key = chr(65 + j)  # A, B, C, ...
-                            row += key
-                            keys[key] = {"item": item}
-                        else:
-                            row += " "
-                    if row.strip():
-                        pattern.append(row)
-                
-                if not pattern:
-                    messagebox.showwarning("警告", "请至少填入一个物品")
-                    return
-                
-                recipe_config = {
-                    "format_version": "1.20.0",
-                    "minecraft:recipe_shaped": {
-                        "description": {
-                            "identifier": self.recipe_identifier.get().strip() or f"wiki:recipe_{output.split(':')[-1]}"
-                        },
-                        "tags": ["crafting_table"],
-                        "pattern": pattern,
-                        "key": keys,
-                        "result": {
-                            "item": output,
-                            "count": int(output_count)
-                        }
-                    }
-                }
-            else:  # crafting_shapeless
-                # 无序合成
-                ingredients = []
-                for i in range(3):
-                    for j in range(3):
-                        item = self.recipe_grid[i][j].get().strip()
-                        if item:
-                            ingredients.append({"item": item})
-                
-                if not ingredients:
-                    messagebox.showwarning("警告", "请至少填入一个物品")
-                    return
-                
-                recipe_config = {
-                    "format_version": "1.20.0",
-                    "minecraft:recipe_shapeless": {
-                        "description": {
-                            "identifier": self.recipe_identifier.get().strip() or f"wiki:recipe_{output.split(':')[-1]}"
-                        },
-                        "tags": ["crafting_table"],
-                        "ingredients": ingredients,
-                        "result": {
-                            "item": output,
-                            "count": int(output_count)
-                        }
-                    }
-                }
-            
-        elif recipe_type == "furnace":
-            # 熔炉配方
-            if not hasattr(self, 'furnace_input') or not self.furnace_input.get().strip():
-                messagebox.showwarning("警告", "请输入输入物品")
+        # 检查所选配方类型的输入
+        if spec.recipe_type in ["crafting_shaped", "crafting_shapeless"]:
+            if not any(item for row in spec.grid for item in row):
+                messagebox.showwarning("警告", "请至少填入一个物品")
                 return
-            
-            recipe_config = {
-                "format_version": "1.20.0",
-                "minecraft:recipe_furnace": {
-                    "description": {
-                        "identifier": self.recipe_identifier.get().strip() or f"wiki:furnace_{output.split(':')[-1]}"
-                    },
-                    "tags": ["furnace", "blast_furnace", "smoker"],
-                    "input": self.furnace_input.get().strip(),
-                    "output": output,
-                    "output_count": int(output_count)
-                }
-            }
-            
-        elif recipe_type == "brewing":
-            # 酿造配方
-            if not hasattr(self, 'brewing_input') or not self.brewing_input.get().strip():
+        elif spec.recipe_type in ["furnace", "brewing"]:
+            if not spec.input:
                 messagebox.showwarning("警告", "请输入输入物品")
                 return
             
-            if not hasattr(self, 'brewing_reagent') or not self.brewing_reagent.get().strip():
+            if spec.recipe_type == "brewing" and not spec.reagent:
                 messagebox.showwarning("警告", "请输入试剂")
                 return
-            
-            recipe_config = {
-                "format_version": "1.20.0",
-                "minecraft:recipe_brewing_mix": {
-                    "description": {
-                        "identifier": self.recipe_identifier.get().strip() or f"wiki:brewing_{output.split(':')[-1]}"
-                    },
-                    "tags": ["brewing_stand"],
-                    "input": self.brewing_input.get().strip(),
-                    "reagent": self.brewing_reagent.get().strip(),
-                    "output": output
-                }
-            }
         else:
             messagebox.showwarning("警告", "请选择有效的配方类型")
             return
         
+        # 构建配方配置
+        recipe_config = build_recipe(spec)
+        
         # 转换为JSON字符串
-        json_str = json.dumps(recipe_config, indent=2, ensure_ascii=False)
+        json_str = to_json(recipe_config)
         
         # 显示在预览框中
         self.recipe_json_preview.delete(1.0, tk.END)
         self.recipe_json_preview.insert(1.0, json_str)
         
+        # 检查对项目中其他内容的引用
+        self.warn_unknown_references(recipe_references(spec))
+        
         # 自动生成文件名
         if not self.recipe_filename.get().strip():
-            suggested_name = f"{output.split(':')[-1]}_{recipe_type}"
+            suggested_name = f"{spec.output.split(':')[-1]}_{spec.recipe_type}"
             self.recipe_filename.delete(0, tk.END)
             self.recipe_filename.insert(0, suggested_name)
     
@@ -2057,6 +2395,10 @@ class Editor:
             messagebox.showerror("错误", f"JSON格式错误: {str(e)}")
             return
         
+        # 按文件类型的架构检查
+        if not self.check_schema("recipe", json_obj):
+            return
+        
         # 获取文件名
         filename = self.recipe_filename.get().strip()
         if not filename:
@@ -2078,9 +2420,7 @@ class Editor:
             messagebox.showinfo("成功", f"配方配置已保存到行为包:\n{file_path}")
             
             # 刷新文件树
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("错误", f"保存失败: {str(e)}")
@@ -2233,9 +2573,7 @@ class Editor:
             messagebox.showinfo("成功", f"物品分页配置已保存到行为包:\n{file_path}")
             
             # 刷新文件树
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("错误", f"保存失败: {str(e)}")
@@ -2333,6 +2671,13 @@ class Editor:
                 del self.loot_pools[pool_index]["entries"][entry_index]
                 self.loot_entries_listbox.delete(entry_index)
     
+    def get_loot_spec(self):
+        """根据掉落池生成掉落表描述"""
+        return LootSpec(
+            loot_type=self.loot_type.get(),
+            pools=[LootPool(entries=[LootEntry(**entry) for entry in pool["entries"]]) for pool in self.loot_pools]
+        )
+    
     def generate_loot_json(self):
         """生成掉落表JSON配置"""
         if not self.loot_pools:
@@ -2340,57 +2685,10 @@ class Editor:
             return
         
         # 构建掉落表配置
-        loot_config = {
-            "pools": []
-        }
-        
-        for pool in self.loot_pools:
-            if pool["entries"]:
-                pool_config = {
-                    "rolls": 1,
-                    "entries": []
-                }
-                
-                for entry in pool["entries"]:
-                    entry_config = {
-                        "type": "item",
-                        "name": entry["item"],
-                        "weight": entry["weight"]
-                    }
-                    
-                    # 添加数量范围
-                    if entry["min_count"] != entry["max_count"]:
-                        entry_config["functions"] = [
-                            {
-                                "function": "set_count",
-                                "count": {
-                                    "min": entry["min_count"],
-                                    "max": entry["max_count"]
-                                }
-                            }
-                        ]
-                    else:
-                        entry_config["functions"] = [
-                            {
-                                "function": "set_count",
-                                "count": entry["min_count"]
-                            }
-                        ]
-                    
-                    # 添加条件
-                    if entry.get("condition"):
-                        entry_config["conditions"] = [
-                            {
-                                "condition": entry["condition"]
-                            }
-                        ]
-                    
-                    pool_config["entries"].append(entry_config)
-                
-                loot_config["pools"].append(pool_config)
+        loot_config = build_loot_table(self.get_loot_spec())
         
         # 转换为JSON字符串
-        json_str = json.dumps(loot_config, indent=2, ensure_ascii=False)
+        json_str = to_json(loot_config)
         
         # 显示在预览框中
         self.loot_json_preview.delete(1.0, tk.END)
@@ -2417,6 +2715,10 @@ class Editor:
             messagebox.showerror("错误", f"JSON格式错误: {str(e)}")
             return
         
+        # 按文件类型的架构检查
+        if not self.check_schema("loot_table", json_obj):
+            return
+        
         # 获取文件名
         filename = self.loot_filename.get().strip()
         if not filename:
@@ -2445,9 +2747,7 @@ class Editor:
             messagebox.showinfo("成功", f"掉落表已保存到行为包:\n{file_path}")
             
             # 刷新文件树
-            if 'bp' in self.file_trees:
-                self.file_trees['bp'].delete(*self.file_trees['bp'].get_children())
-                self.load_file_tree_node(self.file_trees['bp'], "", self.bp_path, self.bp_path.name)
+            self.refresh_file_tree(file_path)
             
         except Exception as e:
             messagebox.showerror("错误", f"保存失败: {str(e)}")
@@ -2480,22 +2780,20 @@ class Editor:
             return
         
         # 构建本地化键
-        lang_key = f"item.{item_id.replace(':', '.')}.name"
+        lang_key = display_name_key("item", item_id)
         
         try:
-            # 更新英文语言文件
-            en_lang_path = self.rp_path / "texts" / "en_US.lang"
-            if en_lang_path.exists():
-                with open(en_lang_path, "a", encoding="utf-8") as f:
-                    f.write(f"\n{lang_key}={en_name}")
-            
-            # 更新中文语言文件
-            if zh_name:
-                zh_lang_path = self.rp_path / "texts" / "zh_CN.lang"
-                if zh_lang_path.exists():
-                    with open(zh_lang_path, "a", encoding="utf-8") as f:
-                        f.write(f"\n{lang_key}={zh_name}")
+            # 其他语言默认使用英文名称，已有的名称保持不变
+            self.lang_store.add(lang_key, {"": en_name})
+            
+            # 填写的名称替换已有的名称
+            names = {"en_US": en_name}
+            if zh_name and self.lang_locale.get():
+                names[self.lang_locale.get()] = zh_name
+            self.lang_store.add(lang_key, names, overwrite=True)
             
+            # 每个语言文件只写入一次
+            self.lang_store.save()
             messagebox.showinfo("成功", "已添加到语言文件")
             
             # 清空输入框
@@ -2506,6 +2804,13 @@ class Editor:
         except Exception as e:
             messagebox.showerror("错误", f"添加失败: {str(e)}")
     
+    def refresh_lang_locales(self):
+        """填充本地化名称的语言列表，英文有单独的输入框"""
+        locales = [locale for locale in self.lang_store.locales() if locale != "en_US"]
+        self.lang_locale["values"] = locales
+        if self.lang_locale.get() not in locales:
+            self.lang_locale.set("zh_CN" if "zh_CN" in locales else (locales[0] if locales else ""))
+    
     def generate_texture_json(self):
         """生成纹理定义文件"""
         # 获取所有纹理映射
@@ -2554,40 +2859,140 @@ class Editor:
         """保存所有纹理更改"""
         self.generate_texture_json()
     
+    # ==================== 批量导入 ====================
+    def show_bulk_import_dialog(self):
+        """从CSV或JSON表格导入物品、方块和实体"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("批量导入")
+        dialog.geometry("520x280")
+        dialog.transient(self.root)
+        
+        frame = ttk.Frame(dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text="表格文件:").grid(row=0, column=0, pady=5, sticky="w")
+        path_entry = ttk.Entry(frame, width=40)
+        path_entry.grid(row=0, column=1, pady=5, padx=5, sticky="ew")
+        
+        def browse():
+            filename = filedialog.askopenfilename(
+                title="选择表格",
+                filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json"), ("All files", "*.*")]
+            )
+            if filename:
+                path_entry.delete(0, tk.END)
+                path_entry.insert(0, filename)
+        
+        ttk.Button(frame, text="浏览", command=browse).grid(row=0, column=2, pady=5)
+        
+        ttk.Label(frame, text="默认类型:").grid(row=1, column=0, pady=5, sticky="w")
+        kind_combo = ttk.Combobox(frame, values=["item", "block", "entity"], width=15, state="readonly")
+        kind_combo.grid(row=1, column=1, pady=5, padx=5, sticky="w")
+        kind_combo.set("item")
+        ttk.Label(frame, text="用于没有type列的行", foreground="gray").grid(row=2, column=1, padx=5, sticky="w")
+        
+        ttk.Label(frame, text="列名使用配置页的字段名（identifier、display_name等）。\n可选列: type、filename、texture_path 以及 name_<语言>（例如 name_zh_CN）。", foreground="gray", justify=tk.LEFT).grid(row=3, column=0, columnspan=3, pady=10, sticky="w")
+        
+        progress_bar = ttk.Progressbar(frame, mode="determinate")
+        progress_bar.grid(row=4, column=0, columnspan=3, pady=5, sticky="ew")
+        status_label = ttk.Label(frame, text="")
+        status_label.grid(row=5, column=0, columnspan=3, sticky="w")
+        frame.columnconfigure(1, weight=1)
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.grid(row=6, column=0, columnspan=3, pady=(10, 0), sticky="e")
+        import_button = ttk.Button(btn_frame, text="导入")
+        import_button.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="关闭", command=dialog.destroy).pack(side=tk.RIGHT)
+        
+        def start():
+            from quickide.bulk import import_table
+            
+            table_path = path_entry.get().strip()
+            default_kind = kind_combo.get()
+            if not table_path:
+                messagebox.showwarning("警告", "请选择表格文件", parent=dialog)
+                return
+            
+            import_button.config(state=tk.DISABLED)
+            status_label.config(text="正在读取表格...")
+            
+            # 在后台线程中导入，对话框定时读取进度
+            messages = queue.Queue()
+            
+            def work():
+                try:
+                    report = import_table(table_path, self.bp_path, self.rp_path, default_kind=default_kind,
+                                          progress=lambda done, total: messages.put(("progress", done, total)))
+                    messages.put(("done", report))
+                except Exception as e:
+                    messages.put(("error", e))
+            
+            threading.Thread(target=work, name="BulkImport", daemon=True).start()
+            self.poll_bulk_import(dialog, messages, progress_bar, status_label, import_button)
+        
+        import_button.config(command=start)
+    
+    def poll_bulk_import(self, dialog, messages, progress_bar, status_label, import_button):
+        """显示导入进度和结果"""
+        if not dialog.winfo_exists():
+            return
+        
+        while True:
+            try:
+                message = messages.get_nowait()
+            except queue.Empty:
+                break
+            
+            if message[0] == "progress":
+                _, done, total = message
+                progress_bar.config(maximum=total, value=done)
+                status_label.config(text=f"正在生成: {done}/{total}")
+            elif message[0] == "error":
+                import_button.config(state=tk.NORMAL)
+                status_label.config(text="")
+                messagebox.showerror("错误", f"导入失败: {message[1]}", parent=dialog)
+                return
+            else:
+                report = message[1]
+                import_button.config(state=tk.NORMAL)
+                status_label.config(text="导入完成")
+                
+                # 刷新文件树
+                for path in report.written:
+                    self.refresh_file_tree(path)
+                
+                result = f"行数: {report.rows}\n写入文件: {len(report.written)}\n新增语言条目: {report.lang_entries}\n纹理条目: {report.textures}"
+                if report.errors:
+                    lines = [f"第{row}行: {error}" for row, error in report.errors[:20]]
+                    if len(report.errors) > 20:
+                        lines.append(f"... 还有{len(report.errors) - 20}行")
+                    result += f"\n\n出错的行（{len(report.errors)}）:\n" + "\n".join(lines)
+                    messagebox.showwarning("导入完成", result, parent=dialog)
+                else:
+                    messagebox.showinfo("导入完成", result, parent=dialog)
+                return
+        
+        dialog.after(100, lambda: self.poll_bulk_import(dialog, messages, progress_bar, status_label, import_button))
+    
     # ==================== 辅助方法 ====================
     def update_language_files(self, identifier, display_name):
         """更新语言文件（物品）"""
-        lang_key = f"item.{identifier.replace(':', '.')}.name"
+        lang_key = display_name_key("item", identifier)
         self.update_language_files_custom(lang_key, display_name)
     
     def update_language_files_custom(self, lang_key, display_name):
         """更新语言文件（自定义键）"""
         try:
-            # 更新英文语言文件
-            en_lang_path = self.rp_path / "texts" / "en_US.lang"
-            if en_lang_path.exists():
-                with open(en_lang_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                if lang_key not in content:
-                    with open(en_lang_path, "a", encoding="utf-8") as f:
-                        f.write(f"\n{lang_key}={display_name}")
-            
-            # 更新中文语言文件
-            zh_lang_path = self.rp_path / "texts" / "zh_CN.lang"
-            if zh_lang_path.exists():
-                with open(zh_lang_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                if lang_key not in content:
-                    with open(zh_lang_path, "a", encoding="utf-8") as f:
-                        f.write(f"\n{lang_key}={display_name}")
-                        
+            # languages.json中的每种语言都添加该键，已有的键保持不变
+            self.lang_store.add(lang_key, {"": display_name})
+            self.lang_store.save()
+            
         except Exception as e:
             print(f"更新语言文件失败: {e}")
     
     def validate_project(self):
-        """验证项目结构"""
+        """验证项目结构和文件"""
         issues = []
         
         # 检查必要文件夹
@@ -2614,12 +3019,58 @@ class Editor:
             if not (self.rp_path / "texts").exists():
                 issues.append("⚠️ 资源包缺少 texts 文件夹")
         
+        # 两个包都存在时才能检查文件
+        if not self.bp_path.exists() or not self.rp_path.exists():
+            messagebox.showinfo("项目验证", "项目检查结果:\n\n" + "\n".join(issues))
+            return
+        
+        # 在工作进程中解析并检查每个JSON文件，窗口保持响应
+        messages = queue.Queue()
+        
+        def work():
+            try:
+                messages.put(("done", validate_files(self.bp_path, self.rp_path, self.project_path)))
+            except Exception as e:
+                messages.put(("error", e))
+        
+        threading.Thread(target=work, name="ProjectValidation", daemon=True).start()
+        self.poll_validation(messages, issues)
+    
+    def poll_validation(self, messages, issues):
+        """文件检查完成后显示验证结果"""
+        try:
+            message = messages.get_nowait()
+        except queue.Empty:
+            self.root.after(100, lambda: self.poll_validation(messages, issues))
+            return
+        
+        if message[0] == "error":
+            messagebox.showerror("错误", f"验证失败: {message[1]}")
+            return
+        
+        result = message[1]
+        
+        # 同时刷新问题面板
+        by_file = {}
+        for diagnostic in result.diagnostics:
+            if diagnostic.path is not None:
+                by_file.setdefault(diagnostic.path, []).append(diagnostic)
+        self.show_problems(by_file, True)
+        
+        for diagnostic in result.diagnostics[:30]:
+            icon = "❌" if diagnostic.severity == "error" else "⚠️"
+            location = f"{diagnostic.path}:{diagnostic.line}" if diagnostic.line else diagnostic.path
+            issues.append(f"{icon} {location}: {diagnostic.message}")
+        if len(result.diagnostics) > 30:
+            issues.append(f"... 以及另外 {len(result.diagnostics) - 30} 个问题")
+        
         if issues:
-            result = "项目检查结果:\n\n" + "\n".join(issues)
+            summary = f"已检查 {result.files} 个JSON文件：{len(result.errors)} 个错误，{len(result.warnings)} 个警告"
+            text = "项目检查结果:\n\n" + "\n".join(issues) + "\n\n" + summary
         else:
-            result = "✅ 项目结构完整，没有发现问题"
+            text = f"✅ 项目有效，已检查 {result.files} 个JSON文件，没有发现问题"
         
-        messagebox.showinfo("项目验证", result)
+        messagebox.showinfo("项目验证", text)
     
     def regenerate_uuids(self):
         """重新生成UUID"""
@@ -2686,6 +3137,8 @@ class Editor:
     
     def open_folder(self, path):
         """打开文件夹"""
+        import platform
+        
         if platform.system() == "Windows":
             os.startfile(path)
         elif platform.system() == "Darwin":  # macOS
@@ -2763,6 +3216,7 @@ class Editor:
     def export_addon(self):
         """导出Addon"""
         from datetime import datetime
+        from quickide.export import write_addon
         
         # 选择导出位置
         filename = filedialog.asksaveasfilename(
@@ -2775,32 +3229,54 @@ class Editor:
             return
         
         try:
-            # 创建临时目录
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # 复制行为包和资源包到临时目录
-                if self.bp_path.exists():
-                    shutil.copytree(self.bp_path, temp_path / "behavior_pack")
-                
-                if self.rp_path.exists():
-                    shutil.copytree(self.rp_path, temp_path / "resource_pack")
-                
-                # 创建ZIP文件
-                with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # 添加所有文件
-                    for file in temp_path.rglob("*"):
-                        if file.is_file():
-                            arcname = file.relative_to(temp_path)
-                            zipf.write(file, arcname)
+            # 将行为包和资源包写入压缩包
+            result = write_addon(self.bp_path, self.rp_path, filename, cache_dir=cache_path(self.project_path, "export-cache"),
+                                 minify=self.minify_export.get(), optimize_textures=self.optimize_textures_export.get())
+            
+            messagebox.showinfo("成功", f"Addon已导出到:\n{filename}{self.export_summary(result)}")
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"导出失败: {str(e)}")
+    
+    def export_packs(self):
+        """将每个包单独导出为.mcpack(可复现)"""
+        from quickide.export import write_packs
+        
+        # 选择输出文件夹
+        folder = filedialog.askdirectory(title="导出包")
+        
+        if not folder:
+            return
+        
+        try:
+            # 成员排序并固定时间戳，相同的包得到相同的文件
+            result = write_packs(self.bp_path, self.rp_path, folder, cache_dir=cache_path(self.project_path, "export-cache"),
+                                 reproducible=True, minify=self.minify_export.get(),
+                                 optimize_textures=self.optimize_textures_export.get())
             
-            messagebox.showinfo("成功", f"Addon已导出到:\n{filename}")
+            packs = "\n".join(str(pack) for pack in result.packs)
+            messagebox.showinfo("成功", f"包已导出到:\n{packs}{self.export_summary(result)}")
             
         except Exception as e:
             messagebox.showerror("错误", f"导出失败: {str(e)}")
     
+    def export_summary(self, result):
+        """导出提示中的JSON压缩、纹理与重复说明"""
+        summary = ""
+        if result.minified_saved:
+            summary += f"\n\n压缩JSON节省了 {result.minified_saved} 字节"
+        if result.textures_saved:
+            summary += f"\n\n优化纹理节省了 {result.textures_saved} 字节"
+        if result.warnings:
+            summary += f"\n\n{len(result.warnings)} 个文件保持不变:\n" + "\n".join(result.warnings[:5])
+        if result.duplicates:
+            summary += f"\n\n{len(result.duplicates)} 组相同的纹理:\n" + "\n".join(", ".join(group) for group in result.duplicates[:5])
+        return summary
+    
     def open_docs(self):
         """打开官方文档"""
+        import webbrowser
+        
         webbrowser.open("https://learn.microsoft.com/zh-cn/minecraft/creator/")
     
     def show_about(self):
@@ -2833,6 +3309,12 @@ https://learn.microsoft.com/zh-cn/minecraft/creator/
 
 
 if __name__ == "__main__":
+    # 打包后的程序中，校验和批量导入启动的工作进程不能再次启动整个程序；
+    # 只在打包时导入 multiprocessing，普通启动不必为它花时间
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+        freeze_support()
+    
     # 测试代码
     root = tk.Tk()
     root.geometry("1200x700")
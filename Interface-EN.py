@@ -1,14 +1,19 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+import sys
 import json
 from pathlib import Path
-import shutil
-import uuid
+import importlib
+import threading
 from datetime import datetime
-from Editor import Editor
+from quickide.project import create_project_structure as build_project_structure
+from quickide.projectlist import ProjectList, filter_entries, sort_key
 
 class QuickIDE:
+    # Language files created for new projects
+    LANGUAGES = {"en_US": "Resource Pack"}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Quick IDE - Minecraft Bedrock Edition Addons Editor")
@@ -22,6 +27,11 @@ class QuickIDE:
         # Create necessary folders
         self.create_directories()
         
+        # Projects found last time, shown before the folder is scanned again
+        self.project_list = ProjectList(self.projects_path)
+        self.project_entries = []
+        self.shown_projects = []
+        
         # Set up styles
         self.setup_styles()
         
@@ -31,6 +41,19 @@ class QuickIDE:
         # Load project list
         self.load_projects()
         
+        # Import the editor in the background once the launcher is on screen
+        self.root.after_idle(lambda: self.root.after(0, self.preload_editor))
+    
+    def preload_editor(self):
+        """Import the editor module on a worker thread so opening a project does not wait for it"""
+        def load():
+            try:
+                importlib.import_module("Editor")
+            except Exception as e:
+                print(f"Failed to preload editor: {e}")
+        
+        threading.Thread(target=load, name="PreloadEditor", daemon=True).start()
+        
     def create_directories(self):
         """Create necessary folders"""
         try:
@@ -67,6 +90,11 @@ class QuickIDE:
         projects_header = ttk.Label(left_frame, text="Projects", style="Heading.TLabel")
         projects_header.pack(anchor=tk.W, pady=(0, 5))
         
+        # Type to filter the projects
+        self.filter_entry = ttk.Entry(left_frame)
+        self.filter_entry.pack(fill=tk.X, pady=(0, 5))
+        self.filter_entry.bind("<KeyRelease>", lambda e: self.show_projects())
+        
         # Project list frame
         list_frame = ttk.Frame(left_frame)
         list_frame.pack(fill=tk.BOTH, expand=True)
@@ -83,6 +111,10 @@ class QuickIDE:
         # Bind double-click event
         self.projects_listbox.bind("<Double-Button-1>", self.open_project)
         
+        # Typing in the list goes to the filter, selecting a project shows its details
+        self.projects_listbox.bind("<Key>", self.type_to_filter)
+        self.projects_listbox.bind("<<ListboxSelect>>", self.show_project_info)
+        
         # Project operation buttons
         btn_frame = ttk.Frame(left_frame)
         btn_frame.pack(fill=tk.X, pady=(10, 0))
@@ -104,167 +136,79 @@ class QuickIDE:
         self.info_frame = ttk.Frame(right_frame)
         
     def load_projects(self):
-        """Load project list"""
+        """Load project list: the cached projects right away, then the result of a background scan"""
+        self.project_entries = self.project_list.cached()
+        self.show_projects()
+        self.project_list.refresh(self.root, self.add_projects, self.set_projects)
+    
+    def add_projects(self, entries):
+        """Add projects found by the background scan"""
+        by_name = {entry.name: entry for entry in self.project_entries}
+        by_name.update((entry.name, entry) for entry in entries)
+        self.project_entries = sorted(by_name.values(), key=sort_key)
+        self.show_projects()
+    
+    def set_projects(self, entries):
+        """Replace the list with the complete scan result"""
+        self.project_entries = entries
+        self.show_projects()
+    
+    def show_projects(self):
+        """Show the projects matching the filter, keeping the selection"""
+        # Recently opened projects are listed first
+        names = [entry.name for entry in filter_entries(self.project_entries, self.filter_entry.get())]
+        # Scan results usually change nothing
+        if names == self.shown_projects:
+            return
+        
+        selection = self.projects_listbox.curselection()
+        selected = self.projects_listbox.get(selection[0]) if selection else None
+        
         self.projects_listbox.delete(0, tk.END)
+        self.projects_listbox.insert(tk.END, *names)
+        self.shown_projects = names
+        if selected in names:
+            index = names.index(selected)
+            self.projects_listbox.selection_set(index)
+            self.projects_listbox.see(index)
+    
+    def type_to_filter(self, event):
+        """Send characters typed in the list to the filter"""
+        # Ctrl and Alt combinations keep their usual meaning
+        if not event.char or not event.char.isprintable() or event.state & 0x000C:
+            return None
+        self.filter_entry.insert(tk.END, event.char)
+        self.filter_entry.focus_set()
+        self.show_projects()
+        return "break"
+    
+    def show_project_info(self, event=None):
+        """Show the details of the selected project"""
+        selection = self.projects_listbox.curselection()
+        if not selection:
+            return
+        name = self.projects_listbox.get(selection[0])
+        entry = next((entry for entry in self.project_entries if entry.name == name), None)
+        if entry is None:
+            return
         
-        try:
-            projects = [p for p in self.projects_path.iterdir() if p.is_dir()]
-            for project in projects:
-                # Check if it's a valid project (contains project.json)
-                if (project / "project.json").exists():
-                    self.projects_listbox.insert(tk.END, project.name)
-        except Exception as e:
-            messagebox.showerror("Error", f"Unable to load project list: {str(e)}")
+        version = ".".join(str(part) for part in entry.version) if entry.version else "-"
+        if entry.last_opened:
+            opened = datetime.fromtimestamp(entry.last_opened).strftime("%Y-%m-%d %H:%M")
+        else:
+            opened = "never"
+        self.welcome_label.config(text=f"{entry.name}\n\nVersion: {version}\nLast opened: {opened}")
     
     def generate_uuid(self):
         """Generate UUID"""
-        return str(uuid.uuid4())
-    
-    def create_manifest(self, pack_type, pack_name, description, uuid_dict):
-        """Create manifest file"""
-        if pack_type == "behavior":
-            manifest = {
-                "format_version": 2,
-                "header": {
-                    "name": f"{pack_name} Behavior Pack",
-                    "description": description,
-                    "uuid": uuid_dict["header_uuid"],
-                    "version": [1, 0, 0],
-                    "min_engine_version": [1, 20, 0]
-                },
-                "modules": [
-                    {
-                        "type": "data",
-                        "uuid": uuid_dict["module_uuid"],
-                        "version": [1, 0, 0]
-                    }
-                ],
-                "dependencies": [
-                    {
-                        "uuid": uuid_dict["resource_uuid"],
-                        "version": [1, 0, 0]
-                    }
-                ]
-            }
-        else:  # resource pack
-            manifest = {
-                "format_version": 2,
-                "header": {
-                    "name": f"{pack_name} Resource Pack",
-                    "description": description,
-                    "uuid": uuid_dict["header_uuid"],
-                    "version": [1, 0, 0],
-                    "min_engine_version": [1, 20, 0]
-                },
-                "modules": [
-                    {
-                        "type": "resources",
-                        "uuid": uuid_dict["module_uuid"],
-                        "version": [1, 0, 0]
-                    }
-                ]
-            }
+        import uuid
         
-        return manifest
+        return str(uuid.uuid4())
     
-    def create_project_structure(self, project_path, project_name, description):
+    def create_project_structure(self, project_path, project_name, description, **options):
         """Create complete project structure (BP and RP separate)"""
         try:
-            # Create behavior pack and resource pack folders
-            bp_path = project_path / "behavior_pack"
-            rp_path = project_path / "resource_pack"
-            
-            bp_path.mkdir(exist_ok=True)
-            rp_path.mkdir(exist_ok=True)
-            
-            # Generate UUIDs
-            bp_header_uuid = self.generate_uuid()
-            bp_module_uuid = self.generate_uuid()
-            rp_header_uuid = self.generate_uuid()
-            rp_module_uuid = self.generate_uuid()
-            
-            # Create behavior pack manifest.json
-            bp_manifest = self.create_manifest("behavior", project_name, description, {
-                "header_uuid": bp_header_uuid,
-                "module_uuid": bp_module_uuid,
-                "resource_uuid": rp_header_uuid
-            })
-            
-            with open(bp_path / "manifest.json", "w", encoding="utf-8") as f:
-                json.dump(bp_manifest, f, indent=2)
-            
-            # Create resource pack manifest.json
-            rp_manifest = self.create_manifest("resource", project_name, description, {
-                "header_uuid": rp_header_uuid,
-                "module_uuid": rp_module_uuid
-            })
-            
-            with open(rp_path / "manifest.json", "w", encoding="utf-8") as f:
-                json.dump(rp_manifest, f, indent=2)
-            
-            # Create default pack icons (can be placeholder files)
-            with open(bp_path / "pack_icon.txt", "w") as f:
-                f.write("Place pack_icon.png here")
-            
-            with open(rp_path / "pack_icon.txt", "w") as f:
-                f.write("Place pack_icon.png here")
-            
-            # Create behavior pack subfolders
-            bp_subfolders = [
-                "items", "entities", "blocks", "recipes", 
-                "scripts", "animations", "animation_controllers",
-                "functions", "loot_tables", "trading"
-            ]
-            
-            for folder in bp_subfolders:
-                (bp_path / folder).mkdir(exist_ok=True)
-            
-            # Create resource pack subfolders
-            rp_subfolders = [
-                "textures/items", "textures/entities", "textures/blocks",
-                "textures/ui", "textures/particle",
-                "models/entities", "models/blocks",
-                "sounds", "sounds/music", "sounds/ambient",
-                "texts", "font", "particles"
-            ]
-            
-            for folder in rp_subfolders:
-                (rp_path / folder).mkdir(parents=True, exist_ok=True)
-            
-            # Create language files
-            languages_file = rp_path / "texts" / "languages.json"
-            with open(languages_file, "w", encoding="utf-8") as f:
-                json.dump(["en_US"], f, indent=2)  # Only English for English version
-            
-            # Create English language file
-            en_file = rp_path / "texts" / "en_US.lang"
-            with open(en_file, "w", encoding="utf-8") as f:
-                f.write(f"## {project_name} Resource Pack\n")
-            
-            # Create project configuration file
-            project_config = {
-                "name": project_name,
-                "description": description,
-                "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "last_modified": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "type": "addon",
-                "version": [1, 0, 0],
-                "uuids": {
-                    "behavior_pack": {
-                        "header": bp_header_uuid,
-                        "module": bp_module_uuid
-                    },
-                    "resource_pack": {
-                        "header": rp_header_uuid,
-                        "module": rp_module_uuid
-                    }
-                },
-                "min_engine_version": [1, 20, 0]
-            }
-            
-            with open(project_path / "project.json", "w", encoding="utf-8") as f:
-                json.dump(project_config, f, indent=2, ensure_ascii=False)
-            
+            build_project_structure(project_path, project_name, description, languages=self.LANGUAGES, **options)
             return True
             
         except Exception as e:
@@ -378,33 +322,13 @@ class QuickIDE:
                 self.create_project_structure(
                     project_path, 
                     name, 
-                    desc_entry.get().strip()
+                    desc_entry.get().strip(),
+                    version=version,
+                    min_engine_version=engine_version,
+                    scripts=self.create_scripts.get(),
+                    functions=self.create_functions.get()
                 )
                 
-                # Update project configuration file with version information
-                config_path = project_path / "project.json"
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                
-                config["version"] = version
-                config["min_engine_version"] = engine_version
-                
-                # If not including scripts, delete scripts folder
-                if not self.create_scripts.get():
-                    scripts_path = project_path / "behavior_pack" / "scripts"
-                    if scripts_path.exists():
-                        shutil.rmtree(scripts_path)
-                
-                # If not including functions, delete functions folder
-                if not self.create_functions.get():
-                    functions_path = project_path / "behavior_pack" / "functions"
-                    if functions_path.exists():
-                        shutil.rmtree(functions_path)
-                
-                # Save updated configuration
-                with open(config_path, "w", encoding="utf-8") as f:
-                    json.dump(config, f, indent=2, ensure_ascii=False)
-                
                 dialog.destroy()
                 self.load_projects()
                 messagebox.showinfo("Success", f"Project '{name}' created successfully\n\n"
@@ -417,6 +341,7 @@ class QuickIDE:
                 messagebox.showerror("Error", f"Failed to create project: {str(e)}")
                 # Clean up created folder
                 if project_path.exists():
+                    import shutil
                     shutil.rmtree(project_path)
         
         # Buttons
@@ -449,7 +374,11 @@ class QuickIDE:
             else:
                 return
         
+        self.project_list.mark_opened(project_name)
+        
         # Open editor window
+        from Editor import Editor
+        
         editor_window = tk.Toplevel(self.root)
         editor_window.title(f"Quick IDE - {project_name}")
         editor_window.geometry("1200x700")
@@ -546,7 +475,9 @@ class QuickIDE:
         if messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete project '{project_name}'?\nThis action cannot be undone!"):
             project_path = self.projects_path / project_name
             try:
+                import shutil
                 shutil.rmtree(project_path)
+                self.project_list.forget(project_name)
                 self.load_projects()
                 messagebox.showinfo("Success", f"Project '{project_name}' has been deleted")
             except Exception as e:
@@ -558,4 +489,10 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # In a frozen build, spawned validation and bulk import workers must not start the app again;
+    # multiprocessing is only imported there so a normal start does not pay for it
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+        freeze_support()
+    
     main()
\ No newline at end of file
@@ -1,14 +1,19 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+import sys
 import json
 from pathlib import Path
-import shutil
-import uuid
+import importlib
+import threading
 from datetime import datetime
-from Editor import Editor
+from quickide.project import create_project_structure as build_project_structure
+from quickide.projectlist import ProjectList, filter_entries, sort_key
 
 class QuickIDE:
+    # 新项目创建的语言文件
+    LANGUAGES = {"en_US": "Resource Pack", "zh_CN": "资源包"}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Quick IDE - Minecraft基岩版Addons编辑器")
@@ -22,6 +27,11 @@ class QuickIDE:
         # 创建必要的文件夹
         self.create_directories()
         
+        # 上次找到的项目，在重新扫描文件夹之前显示
+        self.project_list = ProjectList(self.projects_path)
+        self.project_entries = []
+        self.shown_projects = []
+        
         # 设置样式
         self.setup_styles()
         
@@ -31,6 +41,19 @@ class QuickIDE:
         # 加载项目列表
         self.load_projects()
         
+        # 启动器显示后在后台导入编辑器
+        self.root.after_idle(lambda: self.root.after(0, self.preload_editor))
+    
+    def preload_editor(self):
+        """在后台线程中导入编辑器模块，打开项目时不必再等待"""
+        def load():
+            try:
+                importlib.import_module("Editor")
+            except Exception as e:
+                print(f"Failed to preload editor: {e}")
+        
+        threading.Thread(target=load, name="PreloadEditor", daemon=True).start()
+        
     def create_directories(self):
         """创建必要的文件夹"""
         try:
@@ -67,6 +90,11 @@ class QuickIDE:
         projects_header = ttk.Label(left_frame, text="项目列表", style="Heading.TLabel")
         projects_header.pack(anchor=tk.W, pady=(0, 5))
         
+        # 输入即可筛选项目
+        self.filter_entry = ttk.Entry(left_frame)
+        self.filter_entry.pack(fill=tk.X, pady=(0, 5))
+        self.filter_entry.bind("<KeyRelease>", lambda e: self.show_projects())
+        
         # 项目列表框架
         list_frame = ttk.Frame(left_frame)
         list_frame.pack(fill=tk.BOTH, expand=True)
@@ -83,6 +111,10 @@ class QuickIDE:
         # 绑定双击事件
         self.projects_listbox.bind("<Double-Button-1>", self.open_project)
         
+        # 在列表中输入会转到筛选框，选中项目时显示其信息
+        self.projects_listbox.bind("<Key>", self.type_to_filter)
+        self.projects_listbox.bind("<<ListboxSelect>>", self.show_project_info)
+        
         # 项目操作按钮
         btn_frame = ttk.Frame(left_frame)
         btn_frame.pack(fill=tk.X, pady=(10, 0))
@@ -104,173 +136,79 @@ class QuickIDE:
         self.info_frame = ttk.Frame(right_frame)
         
     def load_projects(self):
-        """加载项目列表"""
+        """加载项目列表：先显示缓存的项目，再显示后台扫描的结果"""
+        self.project_entries = self.project_list.cached()
+        self.show_projects()
+        self.project_list.refresh(self.root, self.add_projects, self.set_projects)
+    
+    def add_projects(self, entries):
+        """添加后台扫描找到的项目"""
+        by_name = {entry.name: entry for entry in self.project_entries}
+        by_name.update((entry.name, entry) for entry in entries)
+        self.project_entries = sorted(by_name.values(), key=sort_key)
+        self.show_projects()
+    
+    def set_projects(self, entries):
+        """用完整的扫描结果替换列表"""
+        self.project_entries = entries
+        self.show_projects()
+    
+    def show_projects(self):
+        """显示与筛选条件匹配的项目，保留选择"""
+        # 最近打开的项目排在前面
+        names = [entry.name for entry in filter_entries(self.project_entries, self.filter_entry.get())]
+        # 扫描结果通常没有变化
+        if names == self.shown_projects:
+            return
+        
+        selection = self.projects_listbox.curselection()
+        selected = self.projects_listbox.get(selection[0]) if selection else None
+        
         self.projects_listbox.delete(0, tk.END)
+        self.projects_listbox.insert(tk.END, *names)
+        self.shown_projects = names
+        if selected in names:
+            index = names.index(selected)
+            self.projects_listbox.selection_set(index)
+            self.projects_listbox.see(index)
+    
+    def type_to_filter(self, event):
+        """将在列表中输入的字符发送到筛选框"""
+        # Ctrl 和 Alt 组合键保持原有作用
+        if not event.char or not event.char.isprintable() or event.state & 0x000C:
+            return None
+        self.filter_entry.insert(tk.END, event.char)
+        self.filter_entry.focus_set()
+        self.show_projects()
+        return "break"
+    
+    def show_project_info(self, event=None):
+        """显示所选项目的信息"""
+        selection = self.projects_listbox.curselection()
+        if not selection:
+            return
+        name = self.projects_listbox.get(selection[0])
+        entry = next((entry for entry in self.project_entries if entry.name == name), None)
+        if entry is None:
+            return
         
-        try:
-            projects = [p for p in self.projects_path.iterdir() if p.is_dir()]
-            for project in projects:
-                # 检查是否是有效的项目（包含project.json）
-                if (project / "project.json").exists():
-                    self.projects_listbox.insert(tk.END, project.name)
-        except Exception as e:
-            messagebox.showerror("错误", f"无法加载项目列表: {str(e)}")
+        version = ".".join(str(part) for part in entry.version) if entry.version else "-"
+        if entry.last_opened:
+            opened = datetime.fromtimestamp(entry.last_opened).strftime("%Y-%m-%d %H:%M")
+        else:
+            opened = "从未"
+        self.welcome_label.config(text=f"{entry.name}\n\n版本: {version}\n上次打开: {opened}")
     
     def generate_uuid(self):
         """生成UUID"""
-        return str(uuid.uuid4())
-    
-    def create_manifest(self, pack_type, pack_name, description, uuid_dict):
-        """创建清单文件"""
-        if pack_type == "behavior":
-            manifest = {
-                "format_version": 2,
-                "header": {
-                    "name": f"{pack_name} Behavior Pack",
-                    "description": description,
-                    "uuid": uuid_dict["header_uuid"],
-                    "version": [1, 0, 0],
-                    "min_engine_version": [1, 20, 0]
-                },
-                "modules": [
-                    {
-                        "type": "data",
-                        "uuid": uuid_dict["module_uuid"],
-                        "version": [1, 0, 0]
-                    }
-                ],
-                "dependencies": [
-                    {
-                        "uuid": uuid_dict["resource_uuid"],
-                        "version": [1, 0, 0]
-                    }
-                ]
-            }
-        else:  # resource pack
-            manifest = {
-                "format_version": 2,
-                "header": {
-                    "name": f"{pack_name} Resource Pack",
-                    "description": description,
-                    "uuid": uuid_dict["header_uuid"],
-                    "version": [1, 0, 0],
-                    "min_engine_version": [1, 20, 0]
-                },
-                "modules": [
-                    {
-                        "type": "resources",
-                        "uuid": uuid_dict["module_uuid"],
-                        "version": [1, 0, 0]
-                    }
-                ]
-            }
+        import uuid
         
-        return manifest
+        return str(uuid.uuid4())
     
-    def create_project_structure(self, project_path, project_name, description):
+    def create_project_structure(self, project_path, project_name, description, **options):
         """创建完整的项目结构（BP和RP分离）"""
         try:
-            # 创建行为包和资源包文件夹
-            bp_path = project_path / "behavior_pack"
-            rp_path = project_path / "resource_pack"
-            
-            bp_path.mkdir(exist_ok=True)
-            rp_path.mkdir(exist_ok=True)
-            
-            # 生成UUID
-            bp_header_uuid = self.generate_uuid()
-            bp_module_uuid = self.generate_uuid()
-            rp_header_uuid = self.generate_uuid()
-            rp_module_uuid = self.generate_uuid()
-            
-            # 创建行为包的manifest.json
-            bp_manifest = self.create_manifest("behavior", project_name, description, {
-                "header_uuid": bp_header_uuid,
-                "module_uuid": bp_module_uuid,
-                "resource_uuid": rp_header_uuid
-            })
-            
-            with open(bp_path / "manifest.json", "w", encoding="utf-8") as f:
-                json.dump(bp_manifest, f, indent=2)
-            
-            # 创建资源包的manifest.json
-            rp_manifest = self.create_manifest("resource", project_name, description, {
-                "header_uuid": rp_header_uuid,
-                "module_uuid": rp_module_uuid
-            })
-            
-            with open(rp_path / "manifest.json", "w", encoding="utf-8") as f:
-                json.dump(rp_manifest, f, indent=2)
-            
-            # 创建默认的包图标（可以是一个简单的默认图标）
-            # 这里我们创建一个简单的文本文件作为占位符
-            with open(bp_path / "pack_icon.txt", "w") as f:
-                f.write("Place pack_icon.png here")
-            
-            with open(rp_path / "pack_icon.txt", "w") as f:
-                f.write("Place pack_icon.png here")
-            
-            # 创建行为包子文件夹
-            bp_subfolders = [
-                "items", "entities", "blocks", "recipes", 
-                "scripts", "animations", "animation_controllers",
-                "functions", "loot_tables", "trading"
-            ]
-            
-            for folder in bp_subfolders:
-                (bp_path / folder).mkdir(exist_ok=True)
-            
-            # 创建资源包子文件夹
-            rp_subfolders = [
-                "textures/items", "textures/entities", "textures/blocks",
-                "textures/ui", "textures/particle",
-                "models/entities", "models/blocks",
-                "sounds", "sounds/music", "sounds/ambient",
-                "texts", "font", "particles"
-            ]
-            
-            for folder in rp_subfolders:
-                (rp_path / folder).mkdir(parents=True, exist_ok=True)
-            
-            # 创建语言文件
-            languages_file = rp_path / "texts" / "languages.json"
-            with open(languages_file, "w", encoding="utf-8") as f:
-                json.dump(["en_US", "zh_CN"], f, indent=2)
-            
-            # 创建英文语言文件
-            en_file = rp_path / "texts" / "en_US.lang"
-            with open(en_file, "w", encoding="utf-8") as f:
-                f.write(f"## {project_name} Resource Pack\n")
-            
-            # 创建中文语言文件
-            zh_file = rp_path / "texts" / "zh_CN.lang"
-            with open(zh_file, "w", encoding="utf-8") as f:
-                f.write(f"## {project_name} 资源包\n")
-            
-            # 创建项目配置文件
-            project_config = {
-                "name": project_name,
-                "description": description,
-                "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "last_modified": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "type": "addon",
-                "version": [1, 0, 0],
-                "uuids": {
-                    "behavior_pack": {
-                        "header": bp_header_uuid,
-                        "module": bp_module_uuid
-                    },
-                    "resource_pack": {
-                        "header": rp_header_uuid,
-                        "module": rp_module_uuid
-                    }
-                },
-                "min_engine_version": [1, 20, 0]
-            }
-            
-            with open(project_path / "project.json", "w", encoding="utf-8") as f:
-                json.dump(project_config, f, indent=2, ensure_ascii=False)
-            
+            build_project_structure(project_path, project_name, description, languages=self.LANGUAGES, **options)
             return True
             
         except Exception as e:
@@ -384,33 +322,13 @@ class QuickIDE:
                 self.create_project_structure(
                     project_path, 
                     name, 
-                    desc_entry.get().strip()
+                    desc_entry.get().strip(),
+                    version=version,
+                    min_engine_version=engine_version,
+                    scripts=self.create_scripts.get(),
+                    functions=self.create_functions.get()
                 )
                 
-                # 更新项目配置文件中的版本信息
-                config_path = project_path / "project.json"
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                
-                config["version"] = version
-                config["min_engine_version"] = engine_version
-                
-                # 如果不包含脚本，可以删除scripts文件夹
-                if not self.create_scripts.get():
-                    scripts_path = project_path / "behavior_pack" / "scripts"
-                    if scripts_path.exists():
-                        shutil.rmtree(scripts_path)
-                
-                # 如果不包含函数，可以删除functions文件夹
-                if not self.create_functions.get():
-                    functions_path = project_path / "behavior_pack" / "functions"
-                    if functions_path.exists():
-                        shutil.rmtree(functions_path)
-                
-                # 保存更新后的配置
-                with open(config_path, "w", encoding="utf-8") as f:
-                    json.dump(config, f, indent=2, ensure_ascii=False)
-                
                 dialog.destroy()
                 self.load_projects()
                 messagebox.showinfo("成功", f"项目 '{name}' 创建成功\n\n"
@@ -423,6 +341,7 @@ class QuickIDE:
                 messagebox.showerror("错误", f"创建项目失败: {str(e)}")
                 # 清理已创建的文件夹
                 if project_path.exists():
+                    import shutil
                     shutil.rmtree(project_path)
         
         # 按钮
@@ -455,7 +374,11 @@ class QuickIDE:
             else:
                 return
         
+        self.project_list.mark_opened(project_name)
+        
         # 打开编辑器窗口
+        from Editor import Editor
+        
         editor_window = tk.Toplevel(self.root)
         editor_window.title(f"Quick IDE - {project_name}")
         editor_window.geometry("1200x700")
@@ -552,7 +475,9 @@ class QuickIDE:
         if messagebox.askyesno("确认删除", f"确定要删除项目 '{project_name}' 吗？\n此操作不可恢复！"):
             project_path = self.projects_path / project_name
             try:
+                import shutil
                 shutil.rmtree(project_path)
+                self.project_list.forget(project_name)
                 self.load_projects()
                 messagebox.showinfo("成功", f"项目 '{project_name}' 已删除")
             except Exception as e:
@@ -564,4 +489,10 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # 打包后的程序中，校验和批量导入启动的工作进程不能再次启动整个程序；
+    # 只在打包时导入 multiprocessing，普通启动不必为它花时间
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+        freeze_support()
+    
     main()
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""Benchmark: time to first frame of the launcher and the editor window
+
+Each run starts a fresh interpreter, so module imports are paid again the
+way they are when Quick IDE is started. The child reports when its window
+is mapped and drawn; for the editor it also reports when both file trees
+have been filled, which happens after the first frame.
+
+Usage: python benchmarks/bench_startup.py [runs] [projects] [files]
+Needs a display, since it opens real windows.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter as tk
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def make_projects(home, project_count, file_count, files_per_folder=200):
+    """Create a projects folder, the first project gets file_count item files"""
+    projects_path = home / "Documents" / "Quick" / "projects"
+    for i in range(project_count):
+        project_path = projects_path / f"project_{i:03d}"
+        for pack in ("behavior_pack", "resource_pack"):
+            (project_path / pack).mkdir(parents=True)
+        (project_path / "project.json").write_text(f'{{"name": "project_{i:03d}", "version": [1, 0, 0]}}', encoding="utf-8")
+    
+    items_path = projects_path / "project_000" / "behavior_pack" / "items"
+    for i in range(file_count):
+        folder = items_path / f"group_{i // files_per_folder:04d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"item_{i:06d}.json").write_text('{"format_version": "1.20.0"}', encoding="utf-8")
+    return projects_path
+
+
+def child(window, project_path):
+    """Child process: open one window and report its milestones on stdout"""
+    sys.path.insert(0, str(ROOT))
+    
+    if window == "launcher":
+        from Interface import QuickIDE
+        root = tk.Tk()
+        QuickIDE(root)
+    else:
+        from Editor import Editor
+        root = tk.Tk()
+        root.geometry("1200x700")
+        editor = Editor(root, Path(project_path))
+    
+    root.wait_visibility()
+    root.update_idletasks()
+    print("shown", flush=True)
+    
+    if window == "editor":
+        while not all(model.nodes for model in editor.file_tree_models.values()):
+            root.update()
+        print("filled", flush=True)
+    
+    root.destroy()
+    return 0
+
+
+def time_window(window, home, project_path):
+    """Seconds from spawning a child until each milestone it reports"""
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, __file__, "--child", window, str(project_path)],
+                               stdout=subprocess.PIPE, text=True, env=env)
+    milestones = {}
+    for line in process.stdout:
+        milestones[line.strip()] = time.perf_counter() - start
+    process.wait()
+    return milestones
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        return child(sys.argv[2], sys.argv[3])
+    
+    defaults = [5, 50, 2000]
+    args = [int(arg) for arg in sys.argv[1:4]]
+    runs, project_count, file_count = args + defaults[len(args):]
+    
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as e:
+        print(f"Tk is not available: {e}")
+        return 1
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        home = Path(temp_dir)
+        projects_path = make_projects(home, project_count, file_count)
+        
+        print(f"{'window':>10} {'milestone':>10} {'median (ms)':>12} {'min (ms)':>10}")
+        for window in ("launcher", "editor"):
+            results = [time_window(window, home, projects_path / "project_000") for _ in range(runs)]
+            for milestone in results[0]:
+                times = [result[milestone] * 1000 for result in results if milestone in result]
+                print(f"{window:>10} {milestone:>10} {statistics.median(times):>12.1f} {min(times):>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
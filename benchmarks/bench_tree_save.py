@@ -0,0 +1,80 @@
+"""Benchmark: file tree refresh cost of a single save as the project grows
+
+Compares the old behaviour (delete every node and rescan the whole pack)
+with FileTreeModel.add(), which only touches the saved file's node.
+
+Usage: python benchmarks/bench_tree_save.py [file counts...]
+Needs a display, since it drives a real ttk.Treeview.
+"""
+import sys
+import tempfile
+import time
+import tkinter as tk
+from pathlib import Path
+from tkinter import ttk
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quickide.filetree import FileTreeModel
+
+
+def make_pack(root, file_count, files_per_folder=200):
+    """Create a behavior pack with file_count JSON files spread over folders"""
+    items_path = root / "items"
+    items_path.mkdir(parents=True)
+    for i in range(file_count):
+        folder = items_path / f"group_{i // files_per_folder:04d}"
+        folder.mkdir(exist_ok=True)
+        (folder / f"item_{i:06d}.json").write_text("{}", encoding="utf-8")
+
+
+def time_full_rebuild(tree, pack_path, saved_file):
+    """Old behaviour: clear the tree and load every node again"""
+    saved_file.write_text("{}", encoding="utf-8")
+    model = FileTreeModel(tree, pack_path, lazy=False)
+    start = time.perf_counter()
+    model.load()
+    return time.perf_counter() - start
+
+
+def time_incremental(tree, pack_path, saved_file):
+    """New behaviour: insert or update exactly one node"""
+    model = FileTreeModel(tree, pack_path, lazy=True)
+    model.load()
+    
+    # Expand the folder the save goes into, as a user editing it would
+    model.expand(model.nodes[pack_path / "items"])
+    
+    saved_file.write_text("{}", encoding="utf-8")
+    start = time.perf_counter()
+    model.add(saved_file)
+    return time.perf_counter() - start
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 5000, 20000, 40000]
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Tk is not available: {e}")
+        return 1
+    root.withdraw()
+    tree = ttk.Treeview(root, show="tree")
+    
+    print(f"{'files':>8} {'full rebuild (ms)':>18} {'model.add (ms)':>15}")
+    for count in counts:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pack_path = Path(temp_dir) / "behavior_pack"
+            make_pack(pack_path, count)
+            
+            full = time_full_rebuild(tree, pack_path, pack_path / "items" / "saved_a.json")
+            incremental = time_incremental(tree, pack_path, pack_path / "items" / "saved_b.json")
+            print(f"{count:>8} {full * 1000:>18.1f} {incremental * 1000:>15.2f}")
+    
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Quick IDE support modules shared by the Chinese and English editors"""
@@ -0,0 +1,5 @@
+import sys
+
+from quickide.cli import main
+
+sys.exit(main())
@@ -0,0 +1,347 @@
+"""Bulk import of items, blocks and entities from CSV or JSON tables
+
+Each row is turned into a spec from quickide.core with the same rules as
+the configuration tabs. Rows are built in a process pool for large sheets,
+and rows with errors are reported without stopping the others. All files
+(definitions, texture atlases and .lang files) are staged first and then
+moved into the packs together, so a failed import leaves the packs as
+they were.
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+from quickide.core import (ItemSpec, BlockSpec, EntitySpec, build_item, build_block, build_entity,
+                           build_spawn_rules, display_name_key, suggest_filename, to_bytes)
+from quickide.lang import LangStore
+
+# Row type -> (spec class, build function, behavior pack folder, language key prefix)
+KINDS = {
+    "item": (ItemSpec, build_item, "items", "item"),
+    "block": (BlockSpec, build_block, "blocks", "tile"),
+    "entity": (EntitySpec, build_entity, "entities", "entity")
+}
+
+# Texture atlas in the resource pack for each row type that has one
+TEXTURE_ATLASES = {
+    "item": "textures/item_texture.json",
+    "block": "textures/terrain_texture.json"
+}
+
+# Columns that are not spec fields
+TYPE_COLUMN = "type"
+FILENAME_COLUMN = "filename"
+TEXTURE_PATH_COLUMN = "texture_path"
+# name_<locale> columns override display_name for one language, e.g. name_zh_CN
+NAME_COLUMN_PREFIX = "name_"
+
+TRUE_VALUES = {"1", "true", "yes", "y", "x"}
+FALSE_VALUES = {"0", "false", "no", "n"}
+
+# Sheets smaller than this are built in the calling process
+POOL_THRESHOLD = 200
+
+
+@dataclass
+class RowResult:
+    """Files and language entries produced by one row"""
+    row: int
+    kind: str
+    identifier: str
+    # Pack relative path ("BP/items/ruby.json") -> file content
+    files: dict = field(default_factory=dict)
+    lang_key: str = ""
+    # Locale -> name, "" is the default for every language file
+    names: dict = field(default_factory=dict)
+    texture: Optional[Tuple[str, str, str]] = None
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import"""
+    written: List[Path] = field(default_factory=list)
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    rows: int = 0
+    lang_entries: int = 0
+    textures: int = 0
+
+
+def read_table(path, default_kind=None):
+    """Read a CSV or JSON table into a list of (row number, kind, values)
+    
+    CSV row numbers match the spreadsheet, with the header on row 1. JSON
+    tables are either a list of objects or an object with "items",
+    "blocks" and "entities" lists.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        
+        if isinstance(data, dict):
+            folders = {folder: kind for kind, (_, _, folder, _) in KINDS.items()}
+            records = []
+            for key, values in data.items():
+                if key not in folders:
+                    raise ValueError(f"Unknown section '{key}', expected one of: {', '.join(folders)}")
+                records.extend(dict(value, **{TYPE_COLUMN: folders[key]}) for value in values)
+        else:
+            records = data
+        numbered = enumerate(records, start=1)
+    else:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            numbered = list(enumerate(csv.DictReader(f), start=2))
+    
+    rows = []
+    for number, record in numbered:
+        if not isinstance(record, dict):
+            raise ValueError(f"Row {number} is not an object")
+        values = {str(key).strip(): value for key, value in record.items() if key is not None}
+        # Skip blank spreadsheet lines
+        if not any(str(value).strip() for value in values.values() if value is not None):
+            continue
+        kind = str(values.pop(TYPE_COLUMN, "") or default_kind or "").strip().lower()
+        rows.append((number, kind, values))
+    return rows
+
+
+def convert_value(value, annotation):
+    """Convert a cell to the type of a spec field"""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    
+    if annotation is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in TRUE_VALUES:
+            return True
+        if text in FALSE_VALUES:
+            return False
+        raise ValueError(f"expected yes/no, got '{value}'")
+    if annotation is int:
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return int(str(value).strip())
+    if annotation is float:
+        return float(str(value).strip())
+    return str(value).strip()
+
+
+def row_to_spec(kind, values):
+    """Build the spec for a row, empty cells keep the spec defaults"""
+    spec_class = KINDS[kind][0]
+    hints = get_type_hints(spec_class)
+    names = {spec_field.name for spec_field in fields(spec_class)}
+    
+    arguments = {}
+    for column, value in values.items():
+        if column in (FILENAME_COLUMN, TEXTURE_PATH_COLUMN) or column.startswith(NAME_COLUMN_PREFIX):
+            continue
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        # Mixed sheets have columns of other kinds, those are only wrong when filled in
+        if column not in names:
+            raise ValueError(f"Unknown column '{column}' for {kind}")
+        try:
+            arguments[column] = convert_value(value, hints[column])
+        except ValueError as e:
+            raise ValueError(f"Invalid value for '{column}': {e}") from None
+    
+    for required in ("identifier", "display_name"):
+        if not arguments.get(required):
+            raise ValueError(f"Missing {required}")
+    return spec_class(**arguments)
+
+
+def build_row(task):
+    """Build every file for one row, runs in a worker process"""
+    number, kind, values = task
+    if kind not in KINDS:
+        raise ValueError(f"Unknown type '{kind}', expected item, block or entity")
+    
+    spec = row_to_spec(kind, values)
+    _, build, folder, lang_prefix = KINDS[kind]
+    filename = str(values.get(FILENAME_COLUMN) or "").strip() or suggest_filename(spec.identifier)
+    # The file has to stay inside its pack folder
+    if "/" in filename or "\\" in filename or ".." in filename:
+        raise ValueError(f"Invalid filename '{filename}', it must not contain a path")
+    if not filename.endswith(".json"):
+        filename += ".json"
+    
+    result = RowResult(number, kind, spec.identifier)
+    result.files[f"BP/{folder}/{filename}"] = to_bytes(build(spec))
+    
+    # Spawnable entities with a biome also get spawn rules, like the entity tab
+    if kind == "entity" and spec.spawnable and spec.biome:
+        result.files[f"BP/spawn_rules/{suggest_filename(spec.identifier)}.json"] = to_bytes(build_spawn_rules(spec))
+    
+    result.lang_key = display_name_key(lang_prefix, spec.identifier)
+    result.names[""] = spec.display_name
+    for column, value in values.items():
+        if column.startswith(NAME_COLUMN_PREFIX) and value is not None and str(value).strip():
+            result.names[column[len(NAME_COLUMN_PREFIX):]] = str(value).strip()
+    
+    texture_path = str(values.get(TEXTURE_PATH_COLUMN) or "").strip()
+    if texture_path and kind in TEXTURE_ATLASES:
+        texture_key = spec.texture if kind == "block" and spec.texture else spec.identifier
+        result.texture = (TEXTURE_ATLASES[kind], texture_key, texture_path)
+    
+    return result
+
+
+def build_row_safe(task):
+    """build_row that returns the error message instead of raising"""
+    try:
+        return build_row(task)
+    except Exception as e:
+        return task[0], str(e)
+
+
+def build_rows(tasks, workers=None, progress=None):
+    """Build all rows, in a process pool when the sheet is large"""
+    results = []
+    if len(tasks) < POOL_THRESHOLD or workers == 1:
+        for task in tasks:
+            results.append(build_row_safe(task))
+            if progress is not None:
+                progress(len(results), len(tasks))
+        return results
+    
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 4))
+    # spawn keeps the workers independent of the Tk threads in the parent
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        for result in executor.map(build_row_safe, tasks, chunksize=chunksize):
+            results.append(result)
+            if progress is not None:
+                progress(len(results), len(tasks))
+    return results
+
+
+def merge_texture_atlas(path, textures):
+    """New content for a texture atlas with the given key -> path entries"""
+    atlas = {"texture_data": {}}
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            atlas = json.load(f)
+        atlas.setdefault("texture_data", {})
+    
+    for key, texture_path in textures:
+        atlas["texture_data"][key] = {"textures": texture_path}
+    return json.dumps(atlas, indent=2)
+
+
+def stage_files(results, bp_path, rp_path, report):
+    """Final path -> content for everything the import writes"""
+    roots = {"BP": Path(bp_path), "RP": Path(rp_path)}
+    staged = {}
+    for result in results:
+        for relative, content in result.files.items():
+            pack, _, rest = relative.partition("/")
+            staged[roots[pack] / rest] = content
+    
+    # Texture atlases
+    atlases = {}
+    for result in results:
+        if result.texture is not None:
+            atlas, key, texture_path = result.texture
+            atlases.setdefault(atlas, []).append((key, texture_path))
+    for atlas, textures in atlases.items():
+        staged[roots["RP"] / atlas] = merge_texture_atlas(roots["RP"] / atlas, textures).encode("utf-8")
+        report.textures += len(textures)
+    
+    # Every language of the pack gets the new keys, each file is written once
+    texts_path = roots["RP"] / "texts"
+    if texts_path.is_dir():
+        store = LangStore(texts_path)
+        report.lang_entries += store.update((result.lang_key, result.names) for result in results)
+        for lang in store.files.values():
+            if lang.dirty:
+                staged[lang.path] = lang.content().encode("utf-8")
+    
+    return staged
+
+
+def commit_files(staged, staging_root):
+    """Move staged files into place, restoring the originals on failure"""
+    staging_root = Path(staging_root)
+    pending = []
+    for index, (target, content) in enumerate(staged.items()):
+        temp_path = staging_root / f"{index}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        pending.append((temp_path, target))
+    
+    # (target, backup or None for new files) for everything already replaced
+    done = []
+    try:
+        for index, (temp_path, target) in enumerate(pending):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            backup = None
+            if target.exists():
+                backup = staging_root / f"{index}.bak"
+                shutil.copy2(target, backup)
+            os.replace(temp_path, target)
+            done.append((target, backup))
+    except Exception:
+        for target, backup in reversed(done):
+            try:
+                if backup is None:
+                    target.unlink()
+                else:
+                    os.replace(backup, target)
+            except OSError as e:
+                print(f"Failed to roll back {target}: {e}")
+        raise
+
+
+def import_table(path, bp_path, rp_path, default_kind=None, workers=None, progress=None):
+    """Import a CSV/JSON table into the packs and return an ImportReport
+    
+    progress(done, total) is called on the calling thread while the rows
+    are built.
+    """
+    report = ImportReport()
+    tasks = read_table(path, default_kind)
+    report.rows = len(tasks)
+    
+    results = []
+    seen = {}
+    for result in build_rows(tasks, workers, progress):
+        if not isinstance(result, RowResult):
+            report.errors.append(result)
+            continue
+        
+        # Later rows must not silently replace earlier ones
+        for relative in result.files:
+            if relative in seen:
+                report.errors.append((result.row, f"Same file as row {seen[relative]}: {relative}"))
+                break
+        else:
+            for relative in result.files:
+                seen[relative] = result.row
+            results.append(result)
+    
+    if not results:
+        return report
+    
+    staged = stage_files(results, bp_path, rp_path, report)
+    
+    # Stage next to the packs so the final moves stay on one file system
+    staging_root = tempfile.mkdtemp(prefix=".quick-import-", dir=Path(bp_path).parent)
+    try:
+        commit_files(staged, staging_root)
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
+    
+    report.written = list(staged)
+    return report
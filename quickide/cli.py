@@ -0,0 +1,226 @@
+"""Command line interface: python -m quickide <command>
+
+Commands:
+    new       create a project
+    validate  check the project structure and every JSON file of the packs
+    build     validate and copy the packs into a build folder
+    export    validate and write a .mcaddon archive, or one .mcpack per pack
+
+Pass --json for machine-readable output. Exit codes: 0 on success, 1 when
+the command failed or validation found errors, 2 for usage errors.
+tkinter is never imported, so the CLI works on headless build servers.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from quickide.export import build_packs, write_addon, write_packs
+from quickide.project import DEFAULT_PROJECTS_PATH, DEFAULT_LANGUAGES, cache_path, new_project, pack_paths
+from quickide.validate import validate_project
+from quickide.zipwriter import DEFAULT_LEVEL, parse_level
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+MINIFY_HELP = "write .json files compact and without // comments"
+OPTIMIZE_TEXTURES_HELP = "re-encode .png files losslessly at the highest zlib level without metadata"
+
+
+class CommandError(Exception):
+    """A command failed in an expected way, reported without a traceback"""
+
+
+def parse_version(text):
+    """Parse 1.20.0 into [1, 20, 0]"""
+    try:
+        version = [int(part) for part in text.split(".")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid version '{text}', expected e.g. 1.20.0") from None
+    if len(version) != 3:
+        raise argparse.ArgumentTypeError(f"invalid version '{text}', expected three numbers")
+    return version
+
+
+def parse_language(text):
+    """Parse LOCALE or LOCALE=TITLE"""
+    locale, _, title = text.partition("=")
+    return locale.strip(), title.strip() or DEFAULT_LANGUAGES.get(locale.strip(), "Resource Pack")
+
+
+def resolve_project(args):
+    """Project folder from a path or a project name"""
+    path = Path(args.project)
+    if not path.is_dir():
+        path = Path(args.projects_dir) / args.project
+    if not path.is_dir():
+        raise CommandError(f"Project not found: {args.project}")
+    return path
+
+
+def validate(project_path, workers=None):
+    """Diagnostics as dicts, and whether any of them is an error"""
+    result = validate_project(project_path, workers)
+    return [diagnostic.to_dict() for diagnostic in result.diagnostics], bool(result.errors)
+
+
+def command_new(args):
+    """Create a project"""
+    languages = dict(args.language) if args.language else None
+    project_path = new_project(args.projects_dir, args.name, args.description, languages=languages,
+                               version=args.version, min_engine_version=args.min_engine_version,
+                               scripts=not args.no_scripts, functions=not args.no_functions)
+    return EXIT_OK, {"project": str(project_path)}
+
+
+def command_validate(args):
+    """Check the project structure and files"""
+    project_path = resolve_project(args)
+    issues, failed = validate(project_path, args.workers)
+    return (EXIT_FAILED if failed else EXIT_OK), {"project": str(project_path), "issues": issues}
+
+
+def command_build(args):
+    """Validate and copy the packs into a build folder"""
+    project_path = resolve_project(args)
+    issues, failed = validate(project_path)
+    if failed:
+        return EXIT_FAILED, {"project": str(project_path), "issues": issues}
+    
+    output_dir = Path(args.output) if args.output else project_path / "build"
+    result = build_packs(*pack_paths(project_path), output_dir, args.minify, args.optimize_textures)
+    return EXIT_OK, {"project": str(project_path), "issues": issues, "build": result.to_dict()}
+
+
+def command_export(args):
+    """Validate and write a .mcaddon archive or .mcpack files"""
+    project_path = resolve_project(args)
+    issues, failed = validate(project_path)
+    if failed:
+        return EXIT_FAILED, {"project": str(project_path), "issues": issues}
+    
+    addon_name = f"{project_path.name}_{datetime.now().strftime('%Y%m%d')}.mcaddon"
+    cache_dir = None if args.no_cache else cache_path(project_path, "export-cache")
+    if args.packs:
+        result = write_packs(*pack_paths(project_path), Path(args.output or "."), args.level, args.workers, cache_dir,
+                             args.reproducible, args.minify, args.optimize_textures, addon_name if args.bundle else None)
+    else:
+        output_path = Path(args.output or addon_name)
+        if output_path.is_dir():
+            output_path = output_path / addon_name
+        result = write_addon(*pack_paths(project_path), output_path, args.level, args.workers, cache_dir,
+                             args.reproducible, args.minify, args.optimize_textures)
+    return EXIT_OK, {"project": str(project_path), "issues": issues, "export": result.to_dict()}
+
+
+def create_parser():
+    """Argument parser for all commands"""
+    parser = argparse.ArgumentParser(prog="quickide", description="Quick IDE command line tools")
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    parser.add_argument("--projects-dir", default=str(DEFAULT_PROJECTS_PATH),
+                        help="folder holding the projects (default: %(default)s)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    new_parser = subparsers.add_parser("new", help="create a project")
+    new_parser.add_argument("name")
+    new_parser.add_argument("--description", default="")
+    new_parser.add_argument("--language", action="append", type=parse_language, metavar="LOCALE[=TITLE]",
+                            help="language file to create, can be repeated (default: en_US)")
+    new_parser.add_argument("--version", type=parse_version, default=[1, 0, 0])
+    new_parser.add_argument("--min-engine-version", type=parse_version, default=[1, 20, 0])
+    new_parser.add_argument("--no-scripts", action="store_true", help="leave out the scripts folder")
+    new_parser.add_argument("--no-functions", action="store_true", help="leave out the functions folder")
+    new_parser.set_defaults(handler=command_new)
+    
+    validate_parser = subparsers.add_parser("validate", help="check the project structure and every JSON file")
+    validate_parser.add_argument("project", help="project folder or name")
+    validate_parser.add_argument("--workers", type=int, default=None,
+                                 help="validation processes (default: one per core)")
+    validate_parser.set_defaults(handler=command_validate)
+    
+    build_parser = subparsers.add_parser("build", help="validate and copy the packs into a build folder")
+    build_parser.add_argument("project", help="project folder or name")
+    build_parser.add_argument("-o", "--output", help="build folder (default: <project>/build)")
+    build_parser.add_argument("--minify", action="store_true", help=MINIFY_HELP)
+    build_parser.add_argument("--optimize-textures", action="store_true", help=OPTIMIZE_TEXTURES_HELP)
+    build_parser.set_defaults(handler=command_build)
+    
+    export_parser = subparsers.add_parser("export", help="validate and write a .mcaddon archive or .mcpack files")
+    export_parser.add_argument("project", help="project folder or name")
+    export_parser.add_argument("-o", "--output",
+                               help="archive path or folder (default: <name>_<date>.mcaddon), "
+                                    "the folder for --packs (default: current folder)")
+    export_parser.add_argument("--packs", action="store_true",
+                               help="write behavior_pack.mcpack and resource_pack.mcpack instead")
+    export_parser.add_argument("--bundle", action="store_true",
+                               help="with --packs, also wrap both .mcpack files into <name>_<date>.mcaddon")
+    export_parser.add_argument("--reproducible", action="store_true",
+                               help="sorted members with fixed timestamps and permissions, "
+                                    "identical input gives identical bytes")
+    export_parser.add_argument("--minify", action="store_true", help=MINIFY_HELP)
+    export_parser.add_argument("--optimize-textures", action="store_true", help=OPTIMIZE_TEXTURES_HELP)
+    export_parser.add_argument("--level", type=parse_level, default=DEFAULT_LEVEL,
+                               help="compression level 0-9, or store/fast/default/small (default: %(default)s)")
+    export_parser.add_argument("--workers", type=int, default=None,
+                               help="compression threads (default: one per core)")
+    export_parser.add_argument("--no-cache", action="store_true",
+                               help="compress every member again instead of using <project>/.quick/export-cache")
+    export_parser.set_defaults(handler=command_export)
+    
+    return parser
+
+
+def print_text(command, code, payload):
+    """Human readable output"""
+    for issue in payload.get("issues", []):
+        location = issue.get("path", "")
+        if location and issue.get("line"):
+            location += f":{issue['line']}"
+        print(f"{issue['severity']}: {location + ': ' if location else ''}{issue['message']}")
+    
+    if "error" in payload:
+        print(f"error: {payload['error']}", file=sys.stderr)
+    elif command == "new":
+        print(f"Created {payload['project']}")
+    elif command == "validate" and code == EXIT_OK and not payload["issues"]:
+        print("Project is valid, no issues found")
+    elif "build" in payload or "export" in payload:
+        result = payload.get("build") or payload.get("export")
+        print(f"Wrote {result['files']} files to {result['output']} "
+              f"({result['bytes_in']} -> {result['bytes_out']} bytes, {result['seconds']}s)")
+        for pack in result.get("packs", []):
+            print(f"  {pack}")
+        for warning in result.get("warnings", []):
+            print(f"warning: left unchanged, {warning}")
+        if result.get("minified_saved"):
+            print(f"Minifying JSON saved {result['minified_saved']} bytes")
+        if result.get("textures_saved"):
+            print(f"Optimizing textures saved {result['textures_saved']} bytes")
+        for group in result.get("duplicates", []):
+            print(f"duplicate textures: {', '.join(group)}")
+        if result.get("cached"):
+            print(f"{result['cached']} files reused from the export cache")
+
+
+def main(argv=None):
+    """Run a command and return the exit code"""
+    parser = create_parser()
+    args = parser.parse_args(argv)
+    
+    try:
+        code, payload = args.handler(args)
+    except (CommandError, OSError, ValueError) as e:
+        code, payload = EXIT_FAILED, {"error": str(e)}
+    except Exception as e:
+        # Still answer in the requested format, scripts read stdout
+        code, payload = EXIT_FAILED, {"error": f"{type(e).__name__}: {e}"}
+    
+    payload = dict({"command": args.command, "ok": code == EXIT_OK}, **payload)
+    if args.json:
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+    else:
+        print_text(args.command, code, payload)
+    return code
@@ -0,0 +1,464 @@
+"""Headless generation of addon definitions
+
+Every build_* function takes a spec and returns the JSON document as a
+dict, without touching tkinter. The editors only turn widget values into
+specs, so the same code can run in batches or from the command line.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+FORMAT_VERSION = "1.20.0"
+SPAWN_RULES_FORMAT_VERSION = "1.8.0"
+
+# Entity behavior names shown in the editor -> behavior components
+BEHAVIOR_COMPONENTS = {
+    "idle": "minecraft:behavior.look_around",
+    "walk": "minecraft:behavior.random_stroll",
+    "look": "minecraft:behavior.look_at_player",
+    "panic": "minecraft:behavior.panic",
+    "follow_owner": "minecraft:behavior.follow_owner"
+}
+
+RECIPE_TYPES = ("crafting_shaped", "crafting_shapeless", "furnace", "brewing")
+
+
+@dataclass
+class ItemSpec:
+    identifier: str
+    display_name: str
+    category: str = "items"
+    max_stack_size: Optional[int] = 64
+    hand_equipped: bool = True
+    max_durability: Optional[int] = None
+    nutrition: Optional[int] = None
+    saturation: Optional[float] = None
+    damage: Optional[int] = None
+
+
+@dataclass
+class BlockSpec:
+    identifier: str
+    display_name: str
+    category: str = "construction"
+    light_emission: float = 0.0
+    destroy_time: float = 1.5
+    explosion_resistance: float = 10.0
+    flammable: bool = False
+    texture: str = ""
+    render_method: str = "opaque"
+    unit_cube: bool = True
+    geometry: str = ""
+    transparent: bool = False
+    replaceable: bool = False
+    loot: str = ""
+
+
+@dataclass
+class EntitySpec:
+    identifier: str
+    display_name: str
+    family: str = "animal"
+    health: int = 20
+    speed: float = 0.25
+    damage: int = 0
+    knockback_resistance: float = 0.0
+    behavior: str = ""
+    equipment_table: str = ""
+    loot_table: str = ""
+    breedable: bool = False
+    spawnable: bool = True
+    biome: str = ""
+    spawn_weight: int = 10
+    spawn_min: int = 2
+    spawn_max: int = 4
+
+
+@dataclass
+class RecipeSpec:
+    recipe_type: str
+    output: str
+    output_count: int = 1
+    identifier: str = ""
+    # 3x3 crafting grid, "" for empty slots
+    grid: List[List[str]] = field(default_factory=lambda: [["", "", ""] for _ in range(3)])
+    input: str = ""
+    reagent: str = ""
+
+
+@dataclass
+class LootEntry:
+    item: str
+    weight: int = 1
+    min_count: int = 1
+    max_count: int = 1
+    condition: str = ""
+
+
+@dataclass
+class LootPool:
+    entries: List[LootEntry] = field(default_factory=list)
+    rolls: int = 1
+
+
+@dataclass
+class LootSpec:
+    loot_type: str = "entity"
+    pools: List[LootPool] = field(default_factory=list)
+
+
+def display_name_key(kind, identifier):
+    """Language file key for a definition, kind is item, tile or entity"""
+    return f"{kind}.{identifier.replace(':', '.')}.name"
+
+
+def suggest_filename(identifier):
+    """File name (without extension) for an identifier like wiki:ruby"""
+    name_parts = identifier.split(":")
+    if len(name_parts) > 1:
+        return name_parts[1]
+    return identifier.replace(":", "_")
+
+
+def to_json(config):
+    """Format a document the way the editors write it"""
+    return json.dumps(config, indent=2, ensure_ascii=False)
+
+
+def to_bytes(config):
+    """UTF-8 encoded JSON document"""
+    return to_json(config).encode("utf-8")
+
+
+def build_item(spec: ItemSpec) -> dict:
+    """minecraft:item document for an item"""
+    if not spec.identifier:
+        raise ValueError("Item identifier is required")
+    
+    components = {
+        "minecraft:display_name": {
+            "value": display_name_key("item", spec.identifier)
+        },
+        "minecraft:icon": {
+            "texture": spec.identifier
+        }
+    }
+    
+    if spec.max_stack_size is not None:
+        components["minecraft:max_stack_size"] = int(spec.max_stack_size)
+    
+    if spec.hand_equipped:
+        components["minecraft:hand_equipped"] = True
+    
+    if spec.max_durability is not None:
+        components["minecraft:durability"] = {
+            "max_durability": int(spec.max_durability)
+        }
+    
+    if spec.nutrition is not None and spec.saturation is not None:
+        components["minecraft:food"] = {
+            "nutrition": int(spec.nutrition),
+            "saturation_modifier": float(spec.saturation) / float(spec.nutrition) if float(spec.nutrition) > 0 else 0.5
+        }
+    
+    if spec.damage is not None:
+        components["minecraft:damage"] = int(spec.damage)
+    
+    return {
+        "format_version": FORMAT_VERSION,
+        "minecraft:item": {
+            "description": {
+                "identifier": spec.identifier,
+                "category": spec.category or "items"
+            },
+            "components": components
+        }
+    }
+
+
+def build_block(spec: BlockSpec) -> dict:
+    """minecraft:block document for a block"""
+    if not spec.identifier:
+        raise ValueError("Block identifier is required")
+    
+    components = {
+        "minecraft:block_light_emission": float(spec.light_emission),
+        "minecraft:destroy_time": float(spec.destroy_time),
+        "minecraft:explosion_resistance": float(spec.explosion_resistance),
+        "minecraft:friction": 0.6,
+        "minecraft:flammable": {
+            "burn_odds": 5 if spec.flammable else 0
+        },
+        "minecraft:map_color": "#ffffff",
+        "minecraft:material_instances": {
+            "*": {
+                "texture": spec.texture or spec.identifier,
+                "render_method": spec.render_method or "opaque"
+            }
+        }
+    }
+    
+    if spec.unit_cube:
+        components["minecraft:geometry"] = "minecraft:geometry.full_block"
+    elif spec.geometry:
+        components["minecraft:geometry"] = spec.geometry
+    
+    if spec.transparent:
+        components["minecraft:breathability"] = "air"
+    
+    if spec.replaceable:
+        components["minecraft:replaceable"] = True
+    
+    if spec.loot:
+        components["minecraft:loot"] = spec.loot
+    
+    return {
+        "format_version": FORMAT_VERSION,
+        "minecraft:block": {
+            "description": {
+                "identifier": spec.identifier,
+                "category": spec.category or "construction"
+            },
+            "components": components
+        }
+    }
+
+
+def build_entity(spec: EntitySpec) -> dict:
+    """minecraft:entity document for an entity"""
+    if not spec.identifier:
+        raise ValueError("Entity identifier is required")
+    
+    components = {
+        "minecraft:type_family": {
+            "family": [spec.family]
+        },
+        "minecraft:health": {
+            "value": int(spec.health),
+            "max": int(spec.health)
+        },
+        "minecraft:movement": {
+            "value": float(spec.speed)
+        },
+        "minecraft:attack": {
+            "damage": int(spec.damage)
+        },
+        "minecraft:knockback_resistance": {
+            "value": float(spec.knockback_resistance)
+        },
+        "minecraft:nameable": {
+            "always_show": True,
+            "allow_name_tag_renaming": True
+        },
+        "minecraft:despawn": {
+            "despawn_from_distance": {
+                "min_distance": 128,
+                "max_distance": 256
+            }
+        }
+    }
+    
+    if spec.behavior in BEHAVIOR_COMPONENTS:
+        components[BEHAVIOR_COMPONENTS[spec.behavior]] = {}
+    
+    if spec.equipment_table:
+        components["minecraft:equipment"] = {
+            "table": spec.equipment_table
+        }
+    
+    if spec.loot_table:
+        components["minecraft:loot"] = {
+            "table": spec.loot_table
+        }
+    
+    if spec.breedable:
+        components["minecraft:breedable"] = {
+            "require_tame": False,
+            "breeds_with": [],
+            "breed_items": []
+        }
+    
+    return {
+        "format_version": FORMAT_VERSION,
+        "minecraft:entity": {
+            "description": {
+                "identifier": spec.identifier,
+                "is_spawnable": spec.spawnable,
+                "is_summonable": True,
+                "is_experimental": False
+            },
+            "component_groups": {},
+            "components": components,
+            "events": {}
+        }
+    }
+
+
+def build_spawn_rules(spec: EntitySpec) -> dict:
+    """minecraft:spawn_rules document for a spawnable entity"""
+    return {
+        "format_version": SPAWN_RULES_FORMAT_VERSION,
+        "minecraft:spawn_rules": {
+            "description": {
+                "identifier": spec.identifier,
+                "population_control": spec.family
+            },
+            "conditions": [
+                {
+                    "minecraft:spawns_on_surface": {},
+                    "minecraft:weight": {
+                        "default": int(spec.spawn_weight)
+                    },
+                    "minecraft:herd": {
+                        "min_size": int(spec.spawn_min),
+                        "max_size": int(spec.spawn_max)
+                    },
+                    "minecraft:biome_filter": {
+                        "test": "has_biome_tag",
+                        "operator": "==",
+                        "value": spec.biome
+                    }
+                }
+            ]
+        }
+    }
+
+
+def build_recipe(spec: RecipeSpec) -> dict:
+    """Recipe document for any of the RECIPE_TYPES"""
+    if not spec.output:
+        raise ValueError("Recipe output item is required")
+    
+    output_name = spec.output.split(":")[-1]
+    
+    if spec.recipe_type == "crafting_shaped":
+        pattern = []
+        keys = {}
+        for grid_row in spec.grid[:3]:
+            row = ""
+            for j, item in enumerate(grid_row[:3]):
+                item = item.strip()
+                if item:
+                    key = chr(65 + j)  # A, B, C, ...
+                    row += key
+                    keys[key] = {"item": item}
+                else:
+                    row += " "
+            if row.strip():
+                pattern.append(row)
+        
+        if not pattern:
+            raise ValueError("Recipe needs at least one ingredient")
+        
+        return {
+            "format_version": FORMAT_VERSION,
+            "minecraft:recipe_shaped": {
+                "description": {
+                    "identifier": spec.identifier or f"wiki:recipe_{output_name}"
+                },
+                "tags": ["crafting_table"],
+                "pattern": pattern,
+                "key": keys,
+                "result": {
+                    "item": spec.output,
+                    "count": int(spec.output_count)
+                }
+            }
+        }
+    
+    if spec.recipe_type == "crafting_shapeless":
+        ingredients = [{"item": item.strip()} for grid_row in spec.grid[:3] for item in grid_row[:3] if item.strip()]
+        if not ingredients:
+            raise ValueError("Recipe needs at least one ingredient")
+        
+        return {
+            "format_version": FORMAT_VERSION,
+            "minecraft:recipe_shapeless": {
+                "description": {
+                    "identifier": spec.identifier or f"wiki:recipe_{output_name}"
+                },
+                "tags": ["crafting_table"],
+                "ingredients": ingredients,
+                "result": {
+                    "item": spec.output,
+                    "count": int(spec.output_count)
+                }
+            }
+        }
+    
+    if spec.recipe_type == "furnace":
+        if not spec.input:
+            raise ValueError("Furnace recipe input item is required")
+        
+        return {
+            "format_version": FORMAT_VERSION,
+            "minecraft:recipe_furnace": {
+                "description": {
+                    "identifier": spec.identifier or f"wiki:furnace_{output_name}"
+                },
+                "tags": ["furnace", "blast_furnace", "smoker"],
+                "input": spec.input,
+                "output": spec.output,
+                "output_count": int(spec.output_count)
+            }
+        }
+    
+    if spec.recipe_type == "brewing":
+        if not spec.input:
+            raise ValueError("Brewing recipe input item is required")
+        
+        return {
+            "format_version": FORMAT_VERSION,
+            "minecraft:recipe_brewing_mix": {
+                "description": {
+                    "identifier": spec.identifier or f"wiki:brewing_{output_name}"
+                },
+                "tags": ["brewing_stand"],
+                "input": spec.input,
+                "reagent": spec.reagent,
+                "output": spec.output
+            }
+        }
+    
+    raise ValueError(f"Unknown recipe type: {spec.recipe_type}")
+
+
+def build_loot_table(spec: LootSpec) -> dict:
+    """Loot table document, empty pools are left out"""
+    pools = []
+    for pool in spec.pools:
+        if not pool.entries:
+            continue
+        
+        entries = []
+        for entry in pool.entries:
+            entry_config = {
+                "type": "item",
+                "name": entry.item,
+                "weight": entry.weight
+            }
+            
+            if entry.min_count != entry.max_count:
+                count = {"min": entry.min_count, "max": entry.max_count}
+            else:
+                count = entry.min_count
+            entry_config["functions"] = [
+                {
+                    "function": "set_count",
+                    "count": count
+                }
+            ]
+            
+            if entry.condition:
+                entry_config["conditions"] = [
+                    {
+                        "condition": entry.condition
+                    }
+                ]
+            
+            entries.append(entry_config)
+        
+        pools.append({"rolls": pool.rolls, "entries": entries})
+    
+    return {"pools": pools}
@@ -0,0 +1,244 @@
+"""Building and exporting the packs of a project, without any UI"""
+
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from quickide.exportcache import ExportCache
+from quickide.minify import minify_member
+from quickide.pngopt import find_duplicates, optimize_member
+from quickide.project import BP_FOLDER, RP_FOLDER
+from quickide.zipwriter import DEFAULT_LEVEL, Member, write_archive
+
+# Optional stages rewriting member data, by the name of their cache folder
+STAGES = (("minified", minify_member), ("textures", optimize_member))
+
+
+@dataclass
+class ExportResult:
+    """What an export or build produced"""
+    output: Path
+    files: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    seconds: float = 0.0
+    # Members copied from the export cache
+    cached: int = 0
+    # .mcpack files written next to (or into) the output
+    packs: list = field(default_factory=list)
+    # Bytes removed by minifying JSON and optimizing PNGs, and files the stages left as they were
+    minified_saved: int = 0
+    textures_saved: int = 0
+    warnings: list = field(default_factory=list)
+    # Groups of byte-identical textures
+    duplicates: list = field(default_factory=list)
+    
+    def to_dict(self):
+        """JSON friendly form for the command line"""
+        return {
+            "output": str(self.output),
+            "files": self.files,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "seconds": round(self.seconds, 3),
+            "cached": self.cached,
+            "packs": [str(pack) for pack in self.packs],
+            "minified_saved": self.minified_saved,
+            "textures_saved": self.textures_saved,
+            "warnings": self.warnings,
+            "duplicates": self.duplicates
+        }
+
+
+def select_stages(minify, optimize_textures):
+    """The (name, transform) stages that are switched on"""
+    return [stage for stage, enabled in zip(STAGES, (minify, optimize_textures)) if enabled]
+
+
+def chain_stages(stages):
+    """One transform running all stages, or None without stages"""
+    if not stages:
+        return None
+    
+    def transform(arcname, data):
+        for _, stage in stages:
+            data = stage(arcname, data)
+        return data
+    return transform
+
+
+def count_saved(arcname, saved, result):
+    """Add bytes a stage removed from a file to the matching total"""
+    if arcname.lower().endswith(".png"):
+        result.textures_saved += saved
+    else:
+        result.minified_saved += saved
+
+
+def build_packs(bp_path, rp_path, output_dir, minify=False, optimize_textures=False):
+    """Copy both packs into output_dir/behavior_pack and output_dir/resource_pack
+    
+    minify rewrites the JSON compact and optimize_textures re-encodes the
+    PNGs, both in the copied files.
+    """
+    start = time.perf_counter()
+    output_dir = Path(output_dir)
+    result = ExportResult(output_dir)
+    transform = chain_stages(select_stages(minify, optimize_textures))
+    
+    for pack_path, folder in ((Path(bp_path), BP_FOLDER), (Path(rp_path), RP_FOLDER)):
+        target = output_dir / folder
+        if target.exists():
+            shutil.rmtree(target)
+        if not pack_path.exists():
+            continue
+        shutil.copytree(pack_path, target)
+        for file in target.rglob("*"):
+            if file.is_file():
+                result.files += 1
+                result.bytes_in += file.stat().st_size
+                if transform is not None:
+                    transform_file(file, file.relative_to(output_dir).as_posix(), transform, result)
+    
+    result.bytes_out = result.bytes_in - result.minified_saved - result.textures_saved
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def transform_file(path, arcname, transform, result):
+    """Run the stages on a copied file in place"""
+    data = path.read_bytes()
+    try:
+        transformed = transform(arcname, data)
+    except ValueError as e:
+        result.warnings.append(str(e))
+        return
+    if transformed is not data:
+        path.write_bytes(transformed)
+        count_saved(arcname, len(data) - len(transformed), result)
+
+
+def iter_folder_files(folder_path, prefix=""):
+    """Yield (path, arcname, size) for every file below folder_path, arcnames start with prefix"""
+    # (folder on disk, folder inside the archive)
+    stack = [(str(folder_path), prefix)]
+    while stack:
+        directory, arc_directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                arcname = f"{arc_directory}/{entry.name}" if arc_directory else entry.name
+                if entry.is_dir():
+                    stack.append((entry.path, arcname))
+                elif entry.is_file():
+                    yield entry.path, arcname, entry.stat().st_size
+
+
+def iter_pack_files(bp_path, rp_path):
+    """Yield (path, arcname, size) for every file of both packs in one walk"""
+    for pack_path, folder in ((Path(bp_path), BP_FOLDER), (Path(rp_path), RP_FOLDER)):
+        if pack_path.is_dir():
+            yield from iter_folder_files(pack_path, folder)
+
+
+def collect_members(files, output_paths):
+    """Members for (path, arcname, size) tuples, leaving out the archives being written"""
+    # The archives may be written inside a pack folder
+    skipped = {os.path.abspath(path) for path in output_paths}
+    return [Member(path, arcname, size) for path, arcname, size in files if os.path.abspath(path) not in skipped]
+
+
+def write_member_archive(members, output_path, level, workers, cache_dir, reproducible, stages, result):
+    """Write one archive, removing it again if that fails, and add its numbers to result"""
+    output_path = Path(output_path)
+    # Each combination of stages is cached apart, so switching back and forth keeps all caches
+    if stages and cache_dir is not None:
+        cache_dir = Path(cache_dir) / "-".join(name for name, _ in stages)
+    cache = ExportCache(cache_dir) if cache_dir is not None else None
+    try:
+        written = write_archive(members, output_path, level, workers, cache, reproducible, chain_stages(stages))
+    except Exception:
+        # Do not leave a truncated archive behind
+        if output_path.exists():
+            output_path.unlink()
+        raise
+    
+    result.cached += cache.hits if cache is not None else 0
+    for item in written:
+        if stages and item.size != item.member.size:
+            count_saved(item.member.arcname, item.member.size - item.size, result)
+        if item.warning:
+            result.warnings.append(item.warning)
+
+
+def write_addon(bp_path, rp_path, output_path, level=DEFAULT_LEVEL, workers=None, cache_dir=None,
+                reproducible=False, minify=False, optimize_textures=False):
+    """Stream both packs into a .mcaddon archive
+    
+    level is 0-9 or one of "store", "fast", "default" and "small". Members
+    are compressed on workers threads (all cores by default). With a
+    cache_dir, members that did not change since the last export are
+    copied from the cache instead of being compressed again. reproducible
+    archives have sorted members with fixed timestamps and permissions.
+    minify writes .json files compact and without comments, and
+    optimize_textures re-encodes PNGs losslessly; files the stages cannot
+    handle are archived as they are and listed in the result's warnings.
+    Byte-identical textures are always listed in the result's duplicates.
+    """
+    start = time.perf_counter()
+    output_path = Path(output_path)
+    result = ExportResult(output_path)
+    
+    members = collect_members(iter_pack_files(bp_path, rp_path), [output_path])
+    stages = select_stages(minify, optimize_textures)
+    write_member_archive(members, output_path, level, workers, cache_dir, reproducible, stages, result)
+    result.duplicates = find_duplicates((member.path, member.arcname, member.size) for member in members)
+    
+    result.files = len(members)
+    result.bytes_in = sum(member.size for member in members)
+    result.bytes_out = output_path.stat().st_size
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def write_packs(bp_path, rp_path, output_dir, level=DEFAULT_LEVEL, workers=None, cache_dir=None,
+                reproducible=False, minify=False, optimize_textures=False, addon_name=None):
+    """Write behavior_pack.mcpack and resource_pack.mcpack into output_dir
+    
+    Each .mcpack holds its pack folder's files at the top level. With an
+    addon_name, both .mcpack files are also wrapped (stored, not compressed
+    again) into output_dir/addon_name, which becomes the result's output.
+    The cache keeps one subfolder per pack.
+    """
+    start = time.perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    addon_path = output_dir / addon_name if addon_name else None
+    result = ExportResult(addon_path or output_dir)
+    
+    pack_outputs = [(Path(bp_path), output_dir / f"{BP_FOLDER}.mcpack", BP_FOLDER),
+                    (Path(rp_path), output_dir / f"{RP_FOLDER}.mcpack", RP_FOLDER)]
+    skipped = [pack_output for _, pack_output, _ in pack_outputs] + ([addon_path] if addon_path else [])
+    stages = select_stages(minify, optimize_textures)
+    
+    for pack_path, pack_output, folder in pack_outputs:
+        if not pack_path.is_dir():
+            continue
+        members = collect_members(iter_folder_files(pack_path), skipped)
+        pack_cache = Path(cache_dir) / folder if cache_dir is not None else None
+        write_member_archive(members, pack_output, level, workers, pack_cache, reproducible, stages, result)
+        result.duplicates += find_duplicates((member.path, f"{folder}/{member.arcname}", member.size)
+                                             for member in members)
+        result.files += len(members)
+        result.bytes_in += sum(member.size for member in members)
+        result.bytes_out += pack_output.stat().st_size
+        result.packs.append(pack_output)
+    
+    if addon_path:
+        members = [Member(str(pack), pack.name, pack.stat().st_size) for pack in result.packs]
+        write_member_archive(members, addon_path, level, workers, None, reproducible, [], ExportResult(addon_path))
+        result.bytes_out = addon_path.stat().st_size
+    
+    result.seconds = time.perf_counter() - start
+    return result
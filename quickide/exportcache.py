@@ -0,0 +1,174 @@
+"""Cache of compressed export members between runs
+
+The manifest maps each archive member to the size, mtime, compression
+level, CRC and content hash it had when it was last exported, and to the
+place of its data in a single pack file. A member whose file did not
+change is copied into the next archive without reading or compressing
+the source again. A file that was only touched (or renamed) is recognized
+by its hash and reuses the cached data as well. Members archived exactly
+as they are on disk are not kept in the pack but read from the source.
+
+Every export writes a fresh pack holding just the members it used, which
+replaces the old one in save(), so the cache never grows past one export.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+MANIFEST_VERSION = 3
+
+# Positions in a manifest entry
+SIZE, MTIME, LEVEL, METHOD, CRC, HASH, OFFSET, LENGTH, DATA_SIZE = range(9)
+
+
+def content_hash(data):
+    """Hash identifying some file content"""
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+class ExportCache:
+    """Per-project store of compressed members, safe to use from worker threads"""
+    
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / "manifest.json"
+        self.pack_path = self.cache_dir / "data.pack"
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        # arcname -> [size, mtime_ns, level, method, crc, hash, offset, length, data_size] from the last
+        # export, offset is -1 for members read from the source
+        self.entries = {}
+        # Entries of the export in progress, saved by save()
+        self.current = {}
+        self.load()
+        
+        # (hash, level) -> entry, to find cached data by content
+        self.by_hash = {(entry[HASH], entry[LEVEL]): entry for entry in self.entries.values()}
+        
+        # Pack of the last export, shared by the threads under the lock
+        self.old_pack = None
+        if self.entries:
+            try:
+                self.old_pack = open(self.pack_path, "rb")
+            except OSError:
+                self.entries, self.by_hash = {}, {}
+        
+        # Pack of this export, created on the first write
+        self.new_pack = None
+        self.new_offset = 0
+        # hash, level -> (offset, length) in the new pack, so equal files are written once
+        self.written = {}
+    
+    def load(self):
+        """Read the manifest of the last export, a broken one is ignored"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.entries = manifest["entries"]
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+    
+    def read_data(self, entry):
+        """Compressed data of an entry from the old pack, or None if it is gone"""
+        if self.old_pack is None:
+            return None
+        try:
+            with self.lock:
+                self.old_pack.seek(entry[OFFSET])
+                data = self.old_pack.read(entry[LENGTH])
+        except OSError:
+            return None
+        return data if len(data) == entry[LENGTH] else None
+    
+    def add(self, arcname, stat, level, method, crc, digest, data_size, data):
+        """Record a member of this export, appending data (unless None) to the new pack"""
+        with self.lock:
+            offset, length = -1, 0
+            if data is not None:
+                key = (digest, level)
+                if key not in self.written:
+                    if self.new_pack is None:
+                        self.cache_dir.mkdir(parents=True, exist_ok=True)
+                        self.new_pack = open(self.pack_path.with_suffix(".tmp"), "wb")
+                    self.new_pack.write(data)
+                    self.written[key] = (self.new_offset, len(data))
+                    self.new_offset += len(data)
+                offset, length = self.written[key]
+            self.current[arcname] = [stat.st_size, stat.st_mtime_ns, level, method, crc, digest, offset, length,
+                                     data_size]
+    
+    def reuse(self, arcname, stat, level, entry):
+        """Record entry for this export and return (method, crc, data_size, data)"""
+        data = None
+        if entry[OFFSET] >= 0:
+            data = self.read_data(entry)
+            if data is None:
+                return None
+        
+        self.add(arcname, stat, level, entry[METHOD], entry[CRC], entry[HASH], entry[DATA_SIZE], data)
+        with self.lock:
+            self.hits += 1
+        return entry[METHOD], entry[CRC], entry[DATA_SIZE], data
+    
+    def lookup(self, arcname, stat, level):
+        """Cached (method, crc, data_size, data) for an unchanged file, data is None if the source is stored"""
+        entry = self.entries.get(arcname)
+        if entry is None or entry[SIZE] != stat.st_size or entry[MTIME] != stat.st_mtime_ns or entry[LEVEL] != level:
+            return None
+        return self.reuse(arcname, stat, level, entry)
+    
+    def lookup_content(self, arcname, stat, level, digest):
+        """Cached (method, crc, data_size, data) for content seen before under any name"""
+        entry = self.by_hash.get((digest, level))
+        if entry is None:
+            return None
+        return self.reuse(arcname, stat, level, entry)
+    
+    def store(self, arcname, stat, level, digest, method, crc, data_size, data):
+        """Remember a freshly compressed member, data is None if the source is stored as it is"""
+        self.add(arcname, stat, level, method, crc, digest, data_size, data)
+        with self.lock:
+            self.misses += 1
+    
+    def close(self):
+        """Close both packs, the new one is left unused"""
+        if self.old_pack is not None:
+            self.old_pack.close()
+            self.old_pack = None
+        if self.new_pack is not None:
+            self.new_pack.close()
+            self.new_pack = None
+            try:
+                os.remove(self.pack_path.with_suffix(".tmp"))
+            except OSError:
+                pass
+    
+    def save(self):
+        """Make this export's pack and manifest the cache for the next one"""
+        if self.old_pack is not None:
+            self.old_pack.close()
+            self.old_pack = None
+        
+        # The old manifest points into the old pack, drop it before the pack is replaced
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if self.manifest_path.exists():
+            self.manifest_path.unlink()
+        if self.new_pack is not None:
+            self.new_pack.close()
+            self.new_pack = None
+            os.replace(self.pack_path.with_suffix(".tmp"), self.pack_path)
+        elif self.pack_path.exists():
+            # Nothing was deflated this time
+            self.pack_path.unlink()
+        
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            # dumps runs the C encoder, dump would encode in Python
+            f.write(json.dumps({"version": MANIFEST_VERSION, "entries": self.current}, separators=(",", ":")))
+        os.replace(temp_path, self.manifest_path)
@@ -0,0 +1,256 @@
+import os
+from pathlib import Path
+
+
+class FileTreeModel:
+    """Path-keyed model for a ttk.Treeview file tree
+    
+    Nodes are inserted, updated and removed one path at a time so a save
+    never has to rebuild the whole tree, and expand/scroll state is kept.
+    """
+    
+    PLACEHOLDER_TAG = "placeholder"
+    
+    def __init__(self, tree, root_path, lazy=True, missing_text="(does not exist)"):
+        self.tree = tree
+        self.root_path = Path(root_path)
+        self.lazy = lazy
+        self.missing_text = missing_text
+        
+        # Path -> item id and item id -> Path
+        self.nodes = {}
+        self.paths = {}
+        
+        # Paths of folder nodes
+        self.folders = set()
+    
+    # ==================== Loading ====================
+    def load(self):
+        """Load the tree from scratch"""
+        self.tree.delete(*self.tree.get_children())
+        self.nodes.clear()
+        self.paths.clear()
+        self.folders.clear()
+        
+        if not self.root_path.exists():
+            self.tree.insert("", "end", text=f"{self.root_path.name} {self.missing_text}", open=True)
+            return
+        
+        node = self._insert("", "end", self.root_path, True, open=True)
+        self.load_children(node, self.root_path)
+    
+    def load_children(self, node, path):
+        """Load the direct children of a folder node"""
+        try:
+            # Add folders first
+            folders = []
+            files = []
+            
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        folders.append(entry)
+                    else:
+                        files.append(entry)
+            
+            # Sort
+            folders.sort(key=lambda x: x.name)
+            files.sort(key=lambda x: x.name)
+            
+            # Add folders
+            for folder in folders:
+                folder_path = Path(folder.path)
+                child = self._insert(node, "end", folder_path, True, open=not self.lazy)
+                if not self.lazy:
+                    self.load_children(child, folder_path)
+            
+            # Add files
+            for file in files:
+                self._insert(node, "end", Path(file.path), False)
+        
+        except Exception as e:
+            print(f"Failed to load file tree: {e}")
+    
+    def expand(self, node):
+        """Fill in a folder node when it is expanded"""
+        if node and self.is_unloaded(node):
+            self.tree.delete(*self.tree.get_children(node))
+            self.load_children(node, self.paths[node])
+    
+    def reveal(self, path):
+        """Expand the folders leading to a path and select its node"""
+        path = Path(path)
+        if not self.contains(path):
+            return None
+        
+        # Walk down from the root, loading each folder on the way
+        node = None
+        for current in [p for p in reversed(path.parents) if self.contains(p)] + [path]:
+            node = self.nodes.get(current)
+            if node is None:
+                node = self.add(current)
+                if node is None:
+                    return None
+            if current != path:
+                self.expand(node)
+                self.tree.item(node, open=True)
+        
+        self.tree.selection_set(node)
+        self.tree.focus(node)
+        self.tree.see(node)
+        return node
+    
+    def path_of(self, node):
+        """Get the path shown by a node, or None for placeholders"""
+        return self.paths.get(node)
+    
+    def node_of(self, path):
+        """Get the node showing a path, or None if it is not loaded"""
+        return self.nodes.get(Path(path))
+    
+    def is_folder(self, path):
+        """Check whether a path is shown as a folder node"""
+        return Path(path) in self.folders
+    
+    def is_unloaded(self, node):
+        """Check whether a folder node still only holds its placeholder"""
+        children = self.tree.get_children(node)
+        return len(children) == 1 and self.PLACEHOLDER_TAG in self.tree.item(children[0], "tags")
+    
+    # ==================== Incremental Updates ====================
+    def contains(self, path):
+        """Check whether a path lies inside this tree's root"""
+        path = Path(path)
+        return path == self.root_path or self.root_path in path.parents
+    
+    def add(self, path):
+        """Insert the node for a new path, or update it if it is already shown
+        
+        Returns the item id, or None when the path is inside a folder that
+        has not been expanded yet (it will be read on expand).
+        """
+        path = Path(path)
+        if path in self.nodes:
+            return self.update(path)
+        
+        if not path.exists() or not self.contains(path) or path == self.root_path:
+            return None
+        
+        # Make sure the parent folder node exists first
+        parent = path.parent
+        if parent not in self.nodes:
+            self.add(parent)
+            if parent not in self.nodes:
+                return None
+        
+        parent_node = self.nodes[parent]
+        if self.is_unloaded(parent_node):
+            return None
+        
+        is_dir = path.is_dir()
+        index = self._sorted_index(parent_node, path.name, is_dir)
+        node = self._insert(parent_node, index, path, is_dir, open=False)
+        if is_dir and not self.lazy:
+            self.load_children(node, path)
+        return node
+    
+    def remove(self, path):
+        """Remove the node for a path together with its descendants"""
+        node = self.nodes.get(Path(path))
+        if node is None:
+            return
+        
+        self._forget(node)
+        self.tree.delete(node)
+    
+    def update(self, path):
+        """Bring the node for a path in line with the file system
+        
+        Files only get their tags refreshed. Loaded folders are rescanned
+        one level deep so new and deleted children show up.
+        """
+        path = Path(path)
+        node = self.nodes.get(path)
+        if node is None:
+            return self.add(path)
+        
+        if not path.exists():
+            self.remove(path)
+            return None
+        
+        if path not in self.folders:
+            self.tree.item(node, tags=self.get_tags(path.name))
+            return node
+        
+        if self.is_unloaded(node):
+            return node
+        
+        # Sync the children of a loaded folder
+        on_disk = set()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                on_disk.add(Path(entry.path))
+        
+        for child in self.tree.get_children(node):
+            child_path = self.paths.get(child)
+            if child_path is not None and child_path not in on_disk:
+                self.remove(child_path)
+        
+        for child_path in sorted(on_disk - set(self.nodes)):
+            self.add(child_path)
+        
+        return node
+    
+    # ==================== Helper Methods ====================
+    def get_tags(self, file_name):
+        """Get file tree tags based on file type"""
+        # Set different icon tags based on file type
+        suffix = os.path.splitext(file_name)[1]
+        tags = []
+        if suffix == '.json':
+            tags.append('json')
+        elif suffix in ['.png', '.jpg', '.tga']:
+            tags.append('image')
+        elif suffix == '.lang':
+            tags.append('lang')
+        elif suffix == '.js':
+            tags.append('script')
+        elif suffix == '.mcfunction':
+            tags.append('function')
+        return tags
+    
+    def _insert(self, parent, index, path, is_dir, open=False):
+        """Insert a node and record it in the path maps"""
+        if is_dir:
+            node = self.tree.insert(parent, index, text=path.name, open=open)
+            self.folders.add(path)
+            # In lazy mode, add a placeholder child so the folder can be expanded
+            if self.lazy and not open:
+                self.tree.insert(node, "end", text="", tags=(self.PLACEHOLDER_TAG,))
+        else:
+            node = self.tree.insert(parent, index, text=path.name, tags=self.get_tags(path.name))
+        
+        self.nodes[path] = node
+        self.paths[node] = path
+        return node
+    
+    def _forget(self, node):
+        """Drop a node and its descendants from the path maps"""
+        for child in self.tree.get_children(node):
+            self._forget(child)
+        
+        path = self.paths.pop(node, None)
+        if path is not None:
+            self.nodes.pop(path, None)
+            self.folders.discard(path)
+    
+    def _sorted_index(self, parent_node, name, is_dir):
+        """Find where a new child goes so folders stay first and names stay sorted"""
+        key = (not is_dir, name)
+        for index, child in enumerate(self.tree.get_children(parent_node)):
+            child_path = self.paths.get(child)
+            if child_path is None:
+                continue
+            if (child_path not in self.folders, child_path.name) > key:
+                return index
+        return "end"
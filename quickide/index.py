@@ -0,0 +1,384 @@
+"""Index of everything a project defines
+
+ProjectIndex maps each kind of symbol to the names defined in the packs
+and the files defining them:
+
+    item, block, entity, recipe, spawn_rule   identifiers of BP definitions
+    loot_table, trade_table                   BP paths, e.g. loot_tables/blocks/ore.json
+    item_texture, terrain_texture             keys of the RP texture atlases
+    texture                                   RP texture paths without extension
+    lang                                      keys of any RP .lang file
+
+Lookups are dict lookups. The full scan runs on a background thread;
+afterwards single files are scanned again as they are saved or change
+on disk, so the project is never walked twice. With an IndexCache the
+scan only reads files whose mtime or size changed since the last one.
+"""
+
+import bisect
+import json
+import os
+import threading
+from pathlib import Path
+
+from quickide.indexcache import IndexCache
+from quickide.lang import parse_line
+from quickide.minify import strip_comments
+from quickide.pngopt import TEXTURE_EXTENSIONS
+from quickide.watcher import DELETED, RESCAN
+
+# Behavior pack folder -> symbol kind of the identifiers defined in it
+DEFINITION_FOLDERS = {
+    "items": "item",
+    "blocks": "block",
+    "entities": "entity",
+    "recipes": "recipe",
+    "spawn_rules": "spawn_rule"
+}
+
+# Behavior pack folders whose files are referenced by path
+TABLE_FOLDERS = {
+    "loot_tables": "loot_table",
+    "trading": "trade_table"
+}
+
+# Resource pack texture atlases -> symbol kind of their keys
+ATLAS_FILES = {
+    "item_texture.json": "item_texture",
+    "terrain_texture.json": "terrain_texture"
+}
+
+
+def load_json(path):
+    """Parse a pack JSON file, comments allowed; None if it cannot be read"""
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return json.loads(strip_comments(text))
+    except ValueError:
+        return None
+
+
+def definition_identifiers(document):
+    """description.identifier of every minecraft:* section of a definition"""
+    identifiers = []
+    if isinstance(document, dict):
+        for key, section in document.items():
+            if key.startswith("minecraft:") and isinstance(section, dict):
+                description = section.get("description")
+                if isinstance(description, dict) and isinstance(description.get("identifier"), str):
+                    identifiers.append(description["identifier"])
+    return identifiers
+
+
+def scan_file(path, bp_path, rp_path):
+    """(kind, name) symbols defined by one file"""
+    path = Path(path)
+    for pack_path, is_bp in ((Path(bp_path), True), (Path(rp_path), False)):
+        try:
+            relative = path.relative_to(pack_path)
+        except ValueError:
+            continue
+        parts = relative.parts
+        if not parts:
+            return []
+        suffix = path.suffix.lower()
+        
+        if is_bp:
+            if parts[0] in DEFINITION_FOLDERS and suffix == ".json":
+                kind = DEFINITION_FOLDERS[parts[0]]
+                return [(kind, identifier) for identifier in definition_identifiers(load_json(path))]
+            if parts[0] in TABLE_FOLDERS and suffix == ".json":
+                return [(TABLE_FOLDERS[parts[0]], relative.as_posix())]
+            return []
+        
+        if parts[0] == "textures":
+            if len(parts) == 2 and parts[1] in ATLAS_FILES:
+                atlas = load_json(path)
+                texture_data = atlas.get("texture_data") if isinstance(atlas, dict) else None
+                if isinstance(texture_data, dict):
+                    return [(ATLAS_FILES[parts[1]], key) for key in texture_data]
+                return []
+            if suffix in TEXTURE_EXTENSIONS:
+                return [("texture", relative.with_suffix("").as_posix())]
+            return []
+        
+        if parts[0] == "texts" and suffix == ".lang":
+            try:
+                with open(path, "r", encoding="utf-8-sig") as f:
+                    entries = (parse_line(line) for line in f)
+                    return [("lang", entry[0]) for entry in entries if entry is not None]
+            except (OSError, UnicodeDecodeError):
+                return []
+        return []
+    return []
+
+
+def iter_index_files(bp_path, rp_path):
+    """DirEntry of every file below the folders the index reads"""
+    folders = [Path(bp_path) / folder for folder in (*DEFINITION_FOLDERS, *TABLE_FOLDERS)]
+    folders += [Path(rp_path) / "textures", Path(rp_path) / "texts"]
+    for folder in folders:
+        stack = [str(folder)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
+
+
+class ProjectIndex:
+    """Symbols of a project with O(1) lookup, kept current one file at a time"""
+    
+    def __init__(self, bp_path, rp_path, cache_path=None):
+        self.bp_path = Path(bp_path)
+        self.rp_path = Path(rp_path)
+        # Cached paths are relative to the project so it can be moved
+        self.root = Path(os.path.commonpath([self.bp_path, self.rp_path]))
+        self.cache = IndexCache(cache_path) if cache_path is not None else None
+        self.lock = threading.Lock()
+        # kind -> name -> set of defining files, files are str paths
+        self.symbols = {}
+        # file -> symbols it defines
+        self.by_file = {}
+        # kind -> sorted names for completion, rebuilt when the kind changes
+        self.sorted_names = {}
+        self.ready = False
+        # Files changed while the full scan was running
+        self.changed_during_build = set()
+        self.building = False
+    
+    # ==================== Building ====================
+    def build(self):
+        """Scan the whole project, returns the number of files read"""
+        with self.lock:
+            self.building = True
+            self.changed_during_build = set()
+        
+        cached = self.cache.load() if self.cache is not None else {}
+        prefix_length = len(os.path.join(str(self.root), ""))
+        by_file = {}
+        # Rows for the cache of files that were read
+        changed = []
+        seen = set()
+        for entry in iter_index_files(self.bp_path, self.rp_path):
+            key = entry.path[prefix_length:]
+            seen.add(key)
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            row = cached.get(key)
+            if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+                symbols = row[2]
+            else:
+                symbols = scan_file(entry.path, self.bp_path, self.rp_path)
+                changed.append((key, stat.st_mtime_ns, stat.st_size, symbols))
+            if symbols:
+                by_file[entry.path] = symbols
+        
+        if self.cache is not None:
+            self.cache.save(changed, [key for key in cached if key not in seen])
+        
+        with self.lock:
+            self.by_file = {}
+            self.symbols = {}
+            self.sorted_names = {}
+            for path, symbols in by_file.items():
+                self.add_symbols(path, symbols)
+            changed_during_build = self.changed_during_build
+            self.building = False
+            self.ready = True
+        
+        # Files saved during the scan may have been read before the change
+        for path in changed_during_build:
+            self.update_file(path)
+        return len(changed)
+    
+    def build_async(self, callback=None):
+        """Run build() on a background thread, callback(index) runs on that thread when done"""
+        def run():
+            try:
+                self.build()
+            except Exception as e:
+                print(f"Failed to build project index: {e}")
+                return
+            if callback is not None:
+                callback(self)
+        
+        thread = threading.Thread(target=run, name="ProjectIndex", daemon=True)
+        thread.start()
+        return thread
+    
+    # ==================== Updates ====================
+    def add_symbols(self, path, symbols):
+        """Register the symbols of a file, the lock is held"""
+        self.by_file[path] = symbols
+        for kind, name in symbols:
+            self.symbols.setdefault(kind, {}).setdefault(name, set()).add(path)
+            self.sorted_names.pop(kind, None)
+    
+    def remove_file_symbols(self, path):
+        """Forget the symbols of a file, the lock is held"""
+        for kind, name in self.by_file.pop(path, []):
+            files = self.symbols.get(kind, {}).get(name)
+            if files is None:
+                continue
+            files.discard(path)
+            if not files:
+                del self.symbols[kind][name]
+            self.sorted_names.pop(kind, None)
+    
+    def update_file(self, path):
+        """Scan one file again after it was saved, created or deleted"""
+        path = str(path)
+        symbols = scan_file(path, self.bp_path, self.rp_path) if os.path.isfile(path) else []
+        with self.lock:
+            if self.building:
+                self.changed_during_build.add(path)
+            self.remove_file_symbols(path)
+            if symbols:
+                self.add_symbols(path, symbols)
+    
+    def remove_tree(self, path):
+        """Forget every file below a deleted folder"""
+        path = str(path)
+        prefix = os.path.join(path, "")
+        with self.lock:
+            for file_path in [file_path for file_path in self.by_file if file_path == path or file_path.startswith(prefix)]:
+                self.remove_file_symbols(file_path)
+    
+    def apply_changes(self, changes):
+        """Apply a batch of changes reported by ProjectWatcher"""
+        for path, kind in changes.items():
+            path = str(path)
+            if kind == RESCAN:
+                # Events were lost, only a full scan is reliable
+                self.build_async()
+                return
+            if kind == DELETED:
+                self.remove_tree(path)
+            elif os.path.isdir(path):
+                for file_path in iter_folder(path):
+                    self.update_file(file_path)
+            else:
+                self.update_file(path)
+    
+    # ==================== Queries ====================
+    def has(self, kind, name):
+        """Whether name is defined as kind"""
+        return name in self.symbols.get(kind, {})
+    
+    def locations(self, kind, name):
+        """Files defining name as kind"""
+        with self.lock:
+            return sorted(self.symbols.get(kind, {}).get(name, ()))
+    
+    def names(self, kind):
+        """Sorted names of a kind"""
+        with self.lock:
+            names = self.sorted_names.get(kind)
+            if names is None:
+                names = self.sorted_names[kind] = sorted(self.symbols.get(kind, {}))
+            return names
+    
+    def complete(self, kind, prefix, limit=20):
+        """Names of a kind starting with prefix, for autocompletion"""
+        names = self.names(kind)
+        start = bisect.bisect_left(names, prefix)
+        matches = []
+        for name in names[start:start + limit]:
+            if not name.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
+    
+    def suggest(self, kinds, name, limit=3):
+        """Defined names of the given kinds closest to a name that is not defined"""
+        # Only needed once a reference is missing, kept out of the editor's start-up
+        import difflib
+        
+        candidates = [candidate for kind in kinds for candidate in self.names(kind)]
+        return difflib.get_close_matches(name, candidates, n=limit)
+    
+    def unknown_references(self, references):
+        """(field, name, suggestions) for every reference that is not defined
+        
+        references are (field, kinds, name) tuples, as returned by
+        block_references() and friends; a name is known if any of its kinds
+        defines it.
+        """
+        unknown = []
+        for field, kinds, name in references:
+            if not any(self.has(kind, name) for kind in kinds):
+                unknown.append((field, name, self.suggest(kinds, name)))
+        return unknown
+    
+    def count(self, kind=None):
+        """Number of names of a kind, or of all symbols"""
+        if kind is not None:
+            return len(self.symbols.get(kind, {}))
+        return sum(len(names) for names in self.symbols.values())
+
+
+def iter_folder(path):
+    """Every file below a folder"""
+    for dir_path, _, file_names in os.walk(path):
+        for name in file_names:
+            yield os.path.join(dir_path, name)
+
+
+def item_reference(item):
+    """namespace:name of an item id that the project has to define, None for vanilla ids"""
+    parts = item.strip().split(":")
+    # Ids without namespace and minecraft: ids come with the game, a third part is a data value
+    if len(parts) < 2 or parts[0] in ("", "minecraft"):
+        return None
+    return f"{parts[0]}:{parts[1]}"
+
+
+def block_references(spec):
+    """References of a BlockSpec to other project content"""
+    references = []
+    if spec.loot:
+        references.append(("loot", ("loot_table",), spec.loot))
+    if spec.texture:
+        references.append(("texture", ("terrain_texture",), spec.texture))
+    return references
+
+
+def entity_references(spec):
+    """References of an EntitySpec to other project content"""
+    references = []
+    if spec.equipment_table:
+        references.append(("equipment_table", ("loot_table",), spec.equipment_table))
+    if spec.loot_table:
+        references.append(("loot_table", ("loot_table",), spec.loot_table))
+    return references
+
+
+def recipe_references(spec):
+    """References of a RecipeSpec to items and blocks of the project"""
+    items = [("output", spec.output), ("input", spec.input), ("reagent", spec.reagent)]
+    items += [("ingredient", item) for grid_row in spec.grid for item in grid_row]
+    
+    references = []
+    seen = set()
+    for field, item in items:
+        name = item_reference(item or "")
+        if name is not None and name not in seen:
+            seen.add(name)
+            references.append((field, ("item", "block"), name))
+    return references
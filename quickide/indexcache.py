@@ -0,0 +1,84 @@
+"""On-disk cache of the project index
+
+An SQLite database under the project's .quick folder keeps the symbols
+of every indexed file together with the mtime and size it had when it
+was scanned. Opening a project only has to list the folders and compare
+stamps; files whose stamp still matches are not read again.
+
+sqlite3 is imported by the methods, which run on the indexing thread, so
+it is not loaded while the editor window is being built.
+"""
+
+import json
+from pathlib import Path
+
+# Bump when scan_file() changes what it extracts, older caches are dropped
+SCHEMA_VERSION = 1
+
+
+class IndexCache:
+    """path -> (mtime, size, symbols) rows of one project"""
+    
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+    
+    def connect(self):
+        """Open the database, creating or resetting it if needed"""
+        import sqlite3
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS files")
+                connection.execute("CREATE TABLE files (path TEXT PRIMARY KEY, mtime INTEGER NOT NULL, "
+                                   "size INTEGER NOT NULL, symbols TEXT NOT NULL)")
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return connection
+    
+    def load(self):
+        """Dict of path -> (mtime, size, symbols), empty if the cache cannot be read"""
+        import sqlite3
+        
+        try:
+            connection = self.connect()
+            try:
+                rows = connection.execute("SELECT path, mtime, size, symbols FROM files").fetchall()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Failed to read index cache: {e}")
+            self.reset()
+            return {}
+        
+        entries = {}
+        for path, mtime, size, symbols in rows:
+            entries[path] = (mtime, size, [tuple(symbol) for symbol in json.loads(symbols)])
+        return entries
+    
+    def save(self, changed, removed):
+        """Store changed (path, mtime, size, symbols) rows and drop removed paths in one transaction"""
+        if not changed and not removed:
+            return
+        import sqlite3
+        
+        try:
+            connection = self.connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                        [(path, mtime, size, json.dumps(symbols, ensure_ascii=False, separators=(",", ":")))
+                         for path, mtime, size, symbols in changed])
+                    connection.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in removed])
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Failed to write index cache: {e}")
+    
+    def reset(self):
+        """Delete a damaged cache so the next save starts over"""
+        try:
+            self.db_path.unlink()
+        except OSError:
+            pass
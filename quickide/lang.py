@@ -0,0 +1,209 @@
+""".lang files kept in memory
+
+A LangFile parses a file once into a key -> line dict, so looking up or
+adding a key does not read the file again. The original lines (comments,
+blank lines, trailing "\t#" notes) are kept and written back unchanged.
+Changes are collected and written in one atomic replace by save(). A
+file that changed on disk is parsed again the next time it is used.
+
+A LangStore covers every locale of a texts folder: the ones listed in
+languages.json and any other .lang file found there. A batch of
+(key, {locale: value}) updates touches each file once in memory and
+writes it once on save().
+"""
+
+import json
+import os
+from pathlib import Path
+
+LANGUAGES_FILE = "languages.json"
+
+
+def parse_line(line):
+    """(key, value) of a key=value line, None for comments and blank lines"""
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#") or "=" not in stripped:
+        return None
+    key, value = stripped.split("=", 1)
+    # Values may end in a tab and a comment
+    return key.strip(), value.split("\t#", 1)[0].rstrip()
+
+
+def disk_stamp(path):
+    """(mtime, size) of a file, None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class LangFile:
+    """One .lang file with O(1) key lookup and batched, atomic writes"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.locale = self.path.stem
+        self.lines = []
+        # key -> index in lines
+        self.index = {}
+        self.newline = "\n"
+        self.bom = False
+        self.trailing_newline = False
+        self.dirty = False
+        self.stamp = None
+        self.load()
+    
+    def load(self):
+        """Parse the file, a missing file is empty"""
+        self.lines, self.index = [], {}
+        self.dirty = False
+        self.stamp = disk_stamp(self.path)
+        if self.stamp is None:
+            return
+        
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            content = f.read()
+        self.bom = content.startswith("\ufeff")
+        content = content.lstrip("\ufeff")
+        self.newline = "\r\n" if "\r\n" in content else "\n"
+        self.trailing_newline = content.endswith("\n")
+        
+        # Split on line breaks only, values may contain other separators
+        self.lines = content.replace("\r\n", "\n").split("\n")
+        if self.trailing_newline:
+            self.lines.pop()
+        for number, line in enumerate(self.lines):
+            entry = parse_line(line)
+            if entry is not None:
+                # The game uses the last definition of a key
+                self.index[entry[0]] = number
+    
+    def refresh(self):
+        """Parse the file again if it changed on disk, unsaved changes win"""
+        if not self.dirty and disk_stamp(self.path) != self.stamp:
+            self.load()
+    
+    def exists(self):
+        """Whether the file is on disk"""
+        return self.stamp is not None
+    
+    def __contains__(self, key):
+        return key in self.index
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def get(self, key, default=None):
+        """Value of a key"""
+        if key not in self.index:
+            return default
+        return parse_line(self.lines[self.index[key]])[1]
+    
+    def keys(self):
+        """All keys in file order"""
+        return list(self.index)
+    
+    def set(self, key, value, overwrite=True):
+        """Add or change a key, returns whether anything changed"""
+        if key in self.index:
+            if not overwrite or self.get(key) == value:
+                return False
+            self.lines[self.index[key]] = f"{key}={value}"
+        else:
+            self.index[key] = len(self.lines)
+            self.lines.append(f"{key}={value}")
+        self.dirty = True
+        return True
+    
+    def add(self, key, value):
+        """Add a key unless it is defined already, returns whether it was added"""
+        return self.set(key, value, overwrite=False)
+    
+    def content(self):
+        """Text of the file with all changes"""
+        text = self.newline.join(self.lines)
+        if self.trailing_newline and self.lines:
+            text += self.newline
+        return ("\ufeff" if self.bom else "") + text
+    
+    def save(self):
+        """Write pending changes in one atomic replace, returns whether the file was written"""
+        if not self.dirty:
+            return False
+        
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(self.content())
+        os.replace(temp_path, self.path)
+        self.dirty = False
+        self.stamp = disk_stamp(self.path)
+        return True
+
+
+class LangStore:
+    """The .lang files of a texts folder, each parsed once per session"""
+    
+    def __init__(self, texts_path):
+        self.texts_path = Path(texts_path)
+        self.files = {}
+        # Locales from languages.json, read again when the file changes
+        self.declared = []
+        self.declared_stamp = None
+    
+    def get(self, locale, create=False):
+        """LangFile for a locale, None if the file does not exist unless create is set"""
+        lang = self.files.get(locale)
+        if lang is None:
+            path = self.texts_path / f"{locale}.lang"
+            if not create and not path.exists():
+                return None
+            lang = self.files[locale] = LangFile(path)
+        lang.refresh()
+        return lang if create or lang.exists() or lang.dirty else None
+    
+    def declared_locales(self):
+        """Locales listed in languages.json"""
+        path = self.texts_path / LANGUAGES_FILE
+        stamp = disk_stamp(path)
+        if stamp != self.declared_stamp:
+            self.declared_stamp = stamp
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    declared = json.load(f)
+                self.declared = [locale for locale in declared if isinstance(locale, str)]
+            except (OSError, ValueError, TypeError):
+                self.declared = []
+        return self.declared
+    
+    def locales(self):
+        """Locales of languages.json and of every .lang file in the folder"""
+        if not self.texts_path.is_dir():
+            return []
+        return sorted(set(self.declared_locales()) | {path.stem for path in self.texts_path.glob("*.lang")})
+    
+    def update(self, batch, overwrite=False):
+        """Apply (key, names) pairs to every locale in memory, save() writes them
+        
+        names maps locales to values, "" is the value for locales without
+        their own name; locales without a value are left alone. A locale
+        from languages.json without a .lang file gets one. Existing keys
+        only change with overwrite. Returns the number of changed entries.
+        """
+        files = [(locale, self.get(locale, create=True)) for locale in self.locales()]
+        changed = 0
+        for key, names in batch:
+            default = names.get("")
+            for locale, lang in files:
+                value = names.get(locale, default)
+                if value is not None:
+                    changed += lang.set(key, value, overwrite)
+        return changed
+    
+    def add(self, key, names, overwrite=False):
+        """update() for a single key"""
+        return self.update([(key, names)], overwrite)
+    
+    def save(self):
+        """Write every file with pending changes"""
+        return sum(lang.save() for lang in self.files.values())
@@ -0,0 +1,96 @@
+import queue
+import threading
+
+
+class ChunkedTextLoader:
+    """Fill a tk.Text widget without blocking the Tk main loop
+    
+    The text is produced on a worker thread (reading, parsing and
+    formatting happen there) and inserted in chunks scheduled through
+    after(), so large files never freeze the window. Loading stops as
+    soon as cancel() is called or the widget is destroyed.
+    """
+    
+    def __init__(self, text_widget, produce, chunk_chars=64 * 1024, poll_ms=30,
+                 on_progress=None, on_done=None):
+        self.text_widget = text_widget
+        self.produce = produce
+        self.chunk_chars = chunk_chars
+        self.poll_ms = poll_ms
+        self.on_progress = on_progress
+        self.on_done = on_done
+        
+        self.cancelled = threading.Event()
+        self.result = queue.Queue(maxsize=1)
+        self.content = None
+        self.position = 0
+        self.done = False
+    
+    def start(self):
+        """Start producing the text on a worker thread"""
+        thread = threading.Thread(target=self._work, name="ChunkedTextLoader", daemon=True)
+        thread.start()
+        self.text_widget.after(self.poll_ms, self._wait_for_content)
+    
+    def cancel(self):
+        """Stop loading, e.g. because the tab was closed"""
+        self.cancelled.set()
+    
+    def is_cancelled(self):
+        """Check whether loading was cancelled or the widget is gone"""
+        if self.cancelled.is_set():
+            return True
+        try:
+            return not self.text_widget.winfo_exists()
+        except Exception:
+            return True
+    
+    def _work(self):
+        """Worker thread: produce the full text"""
+        try:
+            content = self.produce()
+        except Exception as e:
+            content = str(e)
+        if not self.cancelled.is_set():
+            self.result.put(content)
+    
+    def _wait_for_content(self):
+        """Main thread: wait until the worker has finished"""
+        if self.is_cancelled():
+            return
+        
+        try:
+            self.content = self.result.get_nowait()
+        except queue.Empty:
+            self.text_widget.after(self.poll_ms, self._wait_for_content)
+            return
+        
+        self._insert_chunk()
+    
+    def _insert_chunk(self):
+        """Main thread: insert the next chunk and schedule the one after it"""
+        if self.is_cancelled():
+            return
+        
+        content = self.content
+        end = min(self.position + self.chunk_chars, len(content))
+        
+        # End chunks on a line break so each insert stays cheap for Tk
+        if end < len(content):
+            newline = content.find("\n", end)
+            end = len(content) if newline == -1 else newline + 1
+        
+        self.text_widget.insert("end-1c", content[self.position:end])
+        self.position = end
+        
+        if self.on_progress is not None and content:
+            self.on_progress(self.position / len(content))
+        
+        if self.position < len(content):
+            self.text_widget.after(1, self._insert_chunk)
+            return
+        
+        self.done = True
+        self.content = None
+        if self.on_done is not None:
+            self.on_done()
@@ -0,0 +1,48 @@
+"""Compact JSON for exported packs
+
+Bedrock accepts // and /* */ comments in its JSON files, which the json
+module does not. minify_json() removes them, parses the file and writes
+it back without whitespace, then parses the result again to make sure
+nothing changed on the way.
+"""
+
+import json
+import os
+import re
+
+JSON_EXTENSIONS = {".json"}
+
+COMMENT_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+
+def strip_comments(text):
+    """Remove // and /* */ comments outside of strings, keeping their line breaks"""
+    if "/" not in text:
+        return text
+    # Strings are matched too so comment markers inside them are kept; line
+    # breaks of block comments stay so errors still point at the right line
+    return COMMENT_PATTERN.sub(lambda m: m.group() if m.group().startswith('"') else "\n" * m.group().count("\n"), text)
+
+
+def minify_json(data):
+    """Compact bytes for JSON data, raises ValueError if it cannot be parsed"""
+    text = data.decode("utf-8-sig")
+    try:
+        value = json.loads(text)
+    except ValueError:
+        # Most files have no comments, only pay for stripping when parsing fails
+        value = json.loads(strip_comments(text))
+    compact = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    if json.loads(compact) != value:
+        raise ValueError("Minified JSON does not match the original")
+    return compact.encode("utf-8")
+
+
+def minify_member(arcname, data):
+    """Archive transform: minified data for .json members, anything else as is"""
+    if os.path.splitext(arcname)[1].lower() not in JSON_EXTENSIONS:
+        return data
+    try:
+        return minify_json(data)
+    except ValueError as e:
+        raise ValueError(f"{arcname}: {e}") from None
@@ -0,0 +1,127 @@
+"""Lossless PNG optimization and duplicate texture detection
+
+optimize_png() keeps the pixel data exactly as it is: the filtered scan
+lines are inflated and deflated again at the highest zlib level, all
+IDAT chunks are merged into one and chunks that do not affect how the
+image looks (text, time, physical size) are dropped. Color management
+chunks stay, since they change how the colors are rendered. Nothing is
+decoded, so this works for every bit depth and color type without PIL.
+"""
+
+import os
+import struct
+import zlib
+
+from quickide.exportcache import content_hash
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Chunks that decide the pixels and how their colors are rendered, everything else is left out
+KEEP_CHUNKS = {b"IHDR", b"PLTE", b"tRNS", b"IDAT", b"IEND",
+               b"gAMA", b"cHRM", b"sRGB", b"iCCP", b"cICP", b"sBIT"}
+# Animated PNGs keep their frames in chunks the game does not read, they are left alone
+ANIMATION_CHUNKS = {b"acTL", b"fcTL", b"fdAT"}
+
+TEXTURE_EXTENSIONS = {".png", ".tga", ".jpg", ".jpeg"}
+
+# zlib strategies tried for the image data, the smallest result wins
+STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED)
+
+
+def read_chunks(data):
+    """List of (type, body) for the chunks of a PNG file"""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("Not a PNG file")
+    
+    chunks = []
+    offset = len(PNG_SIGNATURE)
+    while offset < len(data):
+        if offset + 8 > len(data):
+            raise ValueError("Truncated chunk header")
+        length, chunk_type = struct.unpack_from(">I4s", data, offset)
+        body = data[offset + 8:offset + 8 + length]
+        if len(body) != length:
+            raise ValueError(f"Truncated {chunk_type.decode('latin-1')} chunk")
+        chunks.append((chunk_type, body))
+        offset += 12 + length
+        if chunk_type == b"IEND":
+            break
+    return chunks
+
+
+def write_chunk(chunk_type, body):
+    """Chunk bytes with length and CRC"""
+    return struct.pack(">I", len(body)) + chunk_type + body + struct.pack(">I", zlib.crc32(chunk_type + body))
+
+
+def optimize_png(data):
+    """Smaller PNG with the same pixels, or data itself if it cannot be improved"""
+    chunks = read_chunks(data)
+    types = {chunk_type for chunk_type, _ in chunks}
+    if types & ANIMATION_CHUNKS:
+        return data
+    if b"IHDR" not in types or b"IDAT" not in types:
+        raise ValueError("PNG without IHDR or IDAT chunk")
+    
+    raw = zlib.decompress(b"".join(body for chunk_type, body in chunks if chunk_type == b"IDAT"))
+    
+    best = None
+    for strategy in STRATEGIES:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS, 9, strategy)
+        compressed = compressor.compress(raw) + compressor.flush()
+        if best is None or len(compressed) < len(best):
+            best = compressed
+    
+    parts = [PNG_SIGNATURE]
+    idat_written = False
+    for chunk_type, body in chunks:
+        if chunk_type not in KEEP_CHUNKS:
+            continue
+        if chunk_type == b"IDAT":
+            # All image data goes into the place of the first IDAT chunk
+            if not idat_written:
+                parts.append(write_chunk(b"IDAT", best))
+                idat_written = True
+            continue
+        parts.append(write_chunk(chunk_type, body))
+    optimized = b"".join(parts)
+    
+    if zlib.decompress(best) != raw:
+        raise ValueError("Re-encoded image data does not match")
+    return optimized if len(optimized) < len(data) else data
+
+
+def optimize_member(arcname, data):
+    """Archive transform: optimized data for .png members, anything else as is"""
+    if os.path.splitext(arcname)[1].lower() != ".png":
+        return data
+    try:
+        return optimize_png(data)
+    except (ValueError, zlib.error) as e:
+        raise ValueError(f"{arcname}: {e}") from None
+
+
+def find_duplicates(files):
+    """Groups of arcnames with byte-identical texture content
+    
+    files are (path, arcname, size) tuples. Only textures that share their
+    size with another one are read and hashed.
+    """
+    by_size = {}
+    for path, arcname, size in files:
+        if os.path.splitext(arcname)[1].lower() in TEXTURE_EXTENSIONS:
+            by_size.setdefault(size, []).append((path, arcname))
+    
+    by_hash = {}
+    for candidates in by_size.values():
+        if len(candidates) < 2:
+            continue
+        for path, arcname in candidates:
+            try:
+                with open(path, "rb") as f:
+                    digest = content_hash(f.read())
+            except OSError:
+                continue
+            by_hash.setdefault(digest, []).append(arcname)
+    
+    return sorted(sorted(group) for group in by_hash.values() if len(group) > 1)
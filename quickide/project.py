@@ -0,0 +1,238 @@
+"""Project scaffolding shared by the launchers and the command line"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+BP_FOLDER = "behavior_pack"
+RP_FOLDER = "resource_pack"
+PROJECT_FILE = "project.json"
+# Per-project caches, next to the packs so they are never exported
+CACHE_FOLDER = ".quick"
+
+# Where the launchers keep their projects
+DEFAULT_PROJECTS_PATH = Path.home() / "Documents" / "Quick" / "projects"
+
+BP_SUBFOLDERS = [
+    "items", "entities", "blocks", "recipes",
+    "scripts", "animations", "animation_controllers",
+    "functions", "loot_tables", "trading"
+]
+
+RP_SUBFOLDERS = [
+    "textures/items", "textures/entities", "textures/blocks",
+    "textures/ui", "textures/particle",
+    "models/entities", "models/blocks",
+    "sounds", "sounds/music", "sounds/ambient",
+    "texts", "font", "particles"
+]
+
+# Locale -> title used in the header of its .lang file
+DEFAULT_LANGUAGES = {"en_US": "Resource Pack"}
+
+
+def generate_uuid():
+    """Generate UUID"""
+    import uuid
+    
+    return str(uuid.uuid4())
+
+
+def cache_path(project_path, name):
+    """Folder or file for a cache of the project"""
+    return Path(project_path) / CACHE_FOLDER / name
+
+
+def pack_paths(project_path):
+    """Behavior pack and resource pack folders of a project"""
+    project_path = Path(project_path)
+    return project_path / BP_FOLDER, project_path / RP_FOLDER
+
+
+def create_manifest(pack_type, pack_name, description, uuid_dict, min_engine_version=(1, 20, 0)):
+    """Create manifest file"""
+    if pack_type == "behavior":
+        manifest = {
+            "format_version": 2,
+            "header": {
+                "name": f"{pack_name} Behavior Pack",
+                "description": description,
+                "uuid": uuid_dict["header_uuid"],
+                "version": [1, 0, 0],
+                "min_engine_version": list(min_engine_version)
+            },
+            "modules": [
+                {
+                    "type": "data",
+                    "uuid": uuid_dict["module_uuid"],
+                    "version": [1, 0, 0]
+                }
+            ],
+            "dependencies": [
+                {
+                    "uuid": uuid_dict["resource_uuid"],
+                    "version": [1, 0, 0]
+                }
+            ]
+        }
+    else:  # resource pack
+        manifest = {
+            "format_version": 2,
+            "header": {
+                "name": f"{pack_name} Resource Pack",
+                "description": description,
+                "uuid": uuid_dict["header_uuid"],
+                "version": [1, 0, 0],
+                "min_engine_version": list(min_engine_version)
+            },
+            "modules": [
+                {
+                    "type": "resources",
+                    "uuid": uuid_dict["module_uuid"],
+                    "version": [1, 0, 0]
+                }
+            ]
+        }
+    
+    return manifest
+
+
+def create_project_structure(project_path, project_name, description, languages=None,
+                             version=(1, 0, 0), min_engine_version=(1, 20, 0),
+                             scripts=True, functions=True):
+    """Create complete project structure (BP and RP separate)
+    
+    languages maps each locale to the title written at the top of its
+    .lang file, e.g. {"en_US": "Resource Pack", "zh_CN": "资源包"}.
+    Returns the project configuration written to project.json.
+    """
+    project_path = Path(project_path)
+    languages = languages or DEFAULT_LANGUAGES
+    
+    # Create behavior pack and resource pack folders
+    bp_path, rp_path = pack_paths(project_path)
+    bp_path.mkdir(exist_ok=True)
+    rp_path.mkdir(exist_ok=True)
+    
+    # Generate UUIDs
+    bp_header_uuid = generate_uuid()
+    bp_module_uuid = generate_uuid()
+    rp_header_uuid = generate_uuid()
+    rp_module_uuid = generate_uuid()
+    
+    # Create behavior pack manifest.json
+    bp_manifest = create_manifest("behavior", project_name, description, {
+        "header_uuid": bp_header_uuid,
+        "module_uuid": bp_module_uuid,
+        "resource_uuid": rp_header_uuid
+    }, min_engine_version)
+    
+    with open(bp_path / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(bp_manifest, f, indent=2)
+    
+    # Create resource pack manifest.json
+    rp_manifest = create_manifest("resource", project_name, description, {
+        "header_uuid": rp_header_uuid,
+        "module_uuid": rp_module_uuid
+    }, min_engine_version)
+    
+    with open(rp_path / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(rp_manifest, f, indent=2)
+    
+    # Create default pack icons (can be placeholder files)
+    with open(bp_path / "pack_icon.txt", "w") as f:
+        f.write("Place pack_icon.png here")
+    
+    with open(rp_path / "pack_icon.txt", "w") as f:
+        f.write("Place pack_icon.png here")
+    
+    # Create pack subfolders
+    for folder in BP_SUBFOLDERS:
+        if (folder == "scripts" and not scripts) or (folder == "functions" and not functions):
+            continue
+        (bp_path / folder).mkdir(exist_ok=True)
+    
+    for folder in RP_SUBFOLDERS:
+        (rp_path / folder).mkdir(parents=True, exist_ok=True)
+    
+    # Create language files
+    with open(rp_path / "texts" / "languages.json", "w", encoding="utf-8") as f:
+        json.dump(list(languages), f, indent=2)
+    
+    for locale, title in languages.items():
+        with open(rp_path / "texts" / f"{locale}.lang", "w", encoding="utf-8") as f:
+            f.write(f"## {project_name} {title}\n")
+    
+    # Create project configuration file
+    project_config = {
+        "name": project_name,
+        "description": description,
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "last_modified": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "type": "addon",
+        "version": list(version),
+        "uuids": {
+            "behavior_pack": {
+                "header": bp_header_uuid,
+                "module": bp_module_uuid
+            },
+            "resource_pack": {
+                "header": rp_header_uuid,
+                "module": rp_module_uuid
+            }
+        },
+        "min_engine_version": list(min_engine_version)
+    }
+    
+    with open(project_path / PROJECT_FILE, "w", encoding="utf-8") as f:
+        json.dump(project_config, f, indent=2, ensure_ascii=False)
+    
+    return project_config
+
+
+def new_project(projects_path, project_name, description="", **options):
+    """Create a project folder and its structure, removing it again on failure"""
+    project_path = Path(projects_path) / project_name
+    if project_path.exists():
+        raise FileExistsError(f"Project already exists: {project_path}")
+    
+    project_path.mkdir(parents=True)
+    try:
+        create_project_structure(project_path, project_name, description, **options)
+    except Exception:
+        import shutil
+        shutil.rmtree(project_path, ignore_errors=True)
+        raise
+    return project_path
+
+
+def check_structure(project_path):
+    """Structure problems as (severity, message) tuples, severity is error or warning"""
+    bp_path, rp_path = pack_paths(project_path)
+    issues = []
+    
+    # Check necessary folders
+    if not bp_path.exists():
+        issues.append(("error", "Behavior pack folder does not exist"))
+    else:
+        # Check manifest.json
+        if not (bp_path / "manifest.json").exists():
+            issues.append(("error", "Behavior pack missing manifest.json"))
+        
+        # Check necessary subfolders
+        for folder in ["items", "entities", "blocks", "recipes", "loot_tables"]:
+            if not (bp_path / folder).exists():
+                issues.append(("warning", f"Behavior pack missing {folder} folder"))
+    
+    if not rp_path.exists():
+        issues.append(("error", "Resource pack folder does not exist"))
+    else:
+        # Check manifest.json
+        if not (rp_path / "manifest.json").exists():
+            issues.append(("error", "Resource pack missing manifest.json"))
+        
+        # Check texts folder
+        if not (rp_path / "texts").exists():
+            issues.append(("warning", "Resource pack missing texts folder"))
+    
+    return issues
@@ -0,0 +1,203 @@
+"""Project list of the launcher
+
+The launcher keeps the projects it found last time in a small JSON file,
+so the list appears before the projects folder is read at all. The folder
+is then scanned again on a worker thread with one stat of project.json
+per project; project.json itself is only parsed when its mtime changed.
+Results are handed to the Tk main loop as they arrive.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+from quickide.project import CACHE_FOLDER, PROJECT_FILE
+
+CACHE_VERSION = 1
+
+
+@dataclass
+class ProjectEntry:
+    name: str
+    path: str
+    # mtime of project.json when its metadata was read
+    mtime: float
+    version: Optional[List[int]] = None
+    last_opened: Optional[float] = None
+
+
+def read_version(project_file):
+    """version of a project.json, None if it cannot be read"""
+    try:
+        with open(project_file, "r", encoding="utf-8") as f:
+            version = json.load(f).get("version")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return version if isinstance(version, list) else None
+
+
+def sort_key(entry):
+    """Recently opened projects first, then by name"""
+    return (-(entry.last_opened or 0), entry.name.lower())
+
+
+class ProjectList:
+    """Cached entries of a projects folder, refreshed on a worker thread"""
+    
+    def __init__(self, projects_path, cache_file=None):
+        self.projects_path = str(projects_path)
+        self.cache_file = str(cache_file or os.path.join(os.path.dirname(self.projects_path), CACHE_FOLDER, "projects.json"))
+        self.lock = threading.Lock()
+        # name -> ProjectEntry
+        self.entries = {}
+        self.generation = 0
+        self.load()
+    
+    # ==================== Cache ====================
+    def load(self):
+        """Read the entries of the last scan, a broken cache is ignored"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("version") == CACHE_VERSION:
+                self.entries = {row["name"]: ProjectEntry(**row) for row in cache["projects"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            self.entries = {}
+    
+    def save(self):
+        """Write the entries for the next start"""
+        with self.lock:
+            rows = [asdict(entry) for entry in self.entries.values()]
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            temp_path = self.cache_file + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"version": CACHE_VERSION, "projects": rows}, ensure_ascii=False))
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            print(f"Failed to write project list cache: {e}")
+    
+    def cached(self):
+        """Entries known so far, in display order"""
+        with self.lock:
+            return sorted(self.entries.values(), key=sort_key)
+    
+    def mark_opened(self, name):
+        """Remember that a project was opened now"""
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None:
+                return
+            entry.last_opened = time.time()
+        self.save()
+    
+    def forget(self, name):
+        """Drop a deleted project"""
+        with self.lock:
+            self.entries.pop(name, None)
+        self.save()
+    
+    # ==================== Scanning ====================
+    def scan(self, on_entry=None, cancelled=None):
+        """Read the projects folder again, returns the entries in display order
+        
+        on_entry(entry) is called for each project found, None if the scan
+        was cancelled.
+        """
+        with self.lock:
+            known = dict(self.entries)
+        
+        found = {}
+        with os.scandir(self.projects_path) as folders:
+            for folder in folders:
+                if cancelled is not None and cancelled():
+                    return None
+                if not folder.is_dir():
+                    continue
+                project_file = os.path.join(folder.path, PROJECT_FILE)
+                try:
+                    mtime = os.stat(project_file).st_mtime
+                except OSError:
+                    # Not a project
+                    continue
+                
+                old = known.get(folder.name)
+                if old is not None and old.mtime == mtime and old.path == folder.path:
+                    entry = old
+                else:
+                    entry = ProjectEntry(folder.name, folder.path, mtime, read_version(project_file),
+                                         old.last_opened if old is not None else None)
+                found[entry.name] = entry
+                if on_entry is not None:
+                    on_entry(entry)
+        
+        with self.lock:
+            # Keep what mark_opened() recorded during the scan
+            for name, entry in found.items():
+                current = self.entries.get(name)
+                if current is not None and current.last_opened != entry.last_opened:
+                    entry.last_opened = current.last_opened
+            self.entries = found
+        self.save()
+        return sorted(found.values(), key=sort_key)
+    
+    def refresh(self, widget, on_entries, on_done, poll_ms=50):
+        """Scan on a worker thread, replacing a scan still running
+        
+        On the main thread on_entries(entries) receives the projects found
+        since the last poll and on_done(entries) the complete list.
+        """
+        self.generation += 1
+        generation = self.generation
+        messages = queue.Queue()
+        
+        def run():
+            try:
+                entries = self.scan(lambda entry: messages.put(("entry", entry)),
+                                    cancelled=lambda: generation != self.generation)
+            except OSError as e:
+                print(f"Failed to scan projects: {e}")
+                entries = self.cached()
+            messages.put(("done", entries))
+        
+        def poll():
+            if generation != self.generation:
+                return
+            try:
+                if not widget.winfo_exists():
+                    return
+            except Exception:
+                return
+            
+            found = []
+            while True:
+                try:
+                    kind, value = messages.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "entry":
+                    found.append(value)
+                    continue
+                if found:
+                    on_entries(found)
+                if value is not None:
+                    on_done(value)
+                return
+            if found:
+                on_entries(found)
+            widget.after(poll_ms, poll)
+        
+        threading.Thread(target=run, name="ProjectList", daemon=True).start()
+        widget.after(poll_ms, poll)
+
+
+def filter_entries(entries, text):
+    """Entries whose name contains text, ignoring case"""
+    text = text.strip().lower()
+    if not text:
+        return list(entries)
+    return [entry for entry in entries if text in entry.name.lower()]
@@ -0,0 +1,664 @@
+"""JSON schemas of Bedrock pack files
+
+Schemas are plain dicts in the style of JSON Schema:
+
+    type              "object", "array", "string", "number", "integer",
+                      "boolean", or a tuple of them
+    required          keys an object must have
+    required_one_of   keys of which an object must have exactly one
+    properties        key -> schema of known keys, other keys are allowed
+    values            schema of every value of an object
+    items             schema of every element of an array
+    min_items, max_items, min_length, max_length, minimum, maximum
+    enum, pattern     allowed strings; format names the pattern in messages
+
+compile_schema() turns a schema into nested closures once, with the
+checks of each node and its children already bound, so checking a
+document only calls functions and never looks at the schema again.
+Children that only need a type check are checked inline by their parent
+object instead of through a call, and object nodes check their own type.
+Keywords only apply to values of the matching type, which makes unions
+such as ("boolean", "object") with properties work.
+"""
+
+import re
+from pathlib import Path
+
+from quickide.validate import IDENTIFIER_PATTERN, LOOT_ENTRY_TYPES, file_kind
+
+# Python types of each JSON type name, bool is excluded from the number types separately
+TYPES = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,)
+}
+
+MISSING = object()
+
+
+def format_path(path):
+    """JSON pointer of a path kept as nested (parent, key) pairs"""
+    keys = []
+    while path:
+        path, key = path
+        keys.append(str(key))
+    return "/" + "/".join(reversed(keys))
+
+
+def string_checks(schema):
+    """Checks of enum, pattern and length for string values"""
+    checks = []
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+        message = f"Must be one of {', '.join(schema['enum'])}"
+        
+        def check_enum(value, path, errors):
+            if value.__class__ is str and value not in allowed:
+                errors.append((path, message))
+        checks.append(check_enum)
+    
+    if "pattern" in schema:
+        fullmatch = re.compile(schema["pattern"]).fullmatch
+        message = f"Does not have the form {schema.get('format', schema['pattern'])}"
+        
+        def check_pattern(value, path, errors):
+            if value.__class__ is str and fullmatch(value) is None:
+                errors.append((path, message))
+        checks.append(check_pattern)
+    
+    if "min_length" in schema or "max_length" in schema:
+        min_length = schema.get("min_length", 0)
+        max_length = schema.get("max_length")
+        
+        def check_length(value, path, errors):
+            if value.__class__ is not str:
+                return
+            if len(value) < min_length:
+                errors.append((path, f"Needs at least {min_length} characters"))
+            elif max_length is not None and len(value) > max_length:
+                errors.append((path, f"Has more than {max_length} characters"))
+        checks.append(check_length)
+    return checks
+
+
+def number_checks(schema):
+    """Checks of minimum and maximum for number values"""
+    if "minimum" not in schema and "maximum" not in schema:
+        return []
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    
+    def check_range(value, path, errors):
+        if value.__class__ not in (int, float):
+            return
+        if minimum is not None and value < minimum:
+            errors.append((path, f"Must be at least {minimum}"))
+        elif maximum is not None and value > maximum:
+            errors.append((path, f"Must be at most {maximum}"))
+    return [check_range]
+
+
+def type_check(schema):
+    """(allowed Python types, whether bool is rejected, message) of a schema's type, None without one"""
+    names = schema.get("type")
+    if names is None:
+        return None
+    names = (names,) if isinstance(names, str) else tuple(names)
+    allowed = tuple({python_type for name in names for python_type in TYPES[name]})
+    # bool is a subclass of int but not a JSON number
+    return allowed, "boolean" not in names, f"Expected {' or '.join(names)}"
+
+
+def is_type_only(schema):
+    """Whether a schema checks nothing but its type"""
+    return schema.get("type") is not None and not (schema.keys() - {"type", "format"})
+
+
+def compile_child(schema):
+    """Check of a child schema, or its type_check() tuple when that is all it checks"""
+    return type_check(schema) if is_type_only(schema) else compile_schema(schema)
+
+
+def object_checks(schema, expected=None):
+    """Checks of required keys, known keys and values for objects
+    
+    With expected the check also reports values that are not objects.
+    """
+    required = tuple(schema.get("required", ()))
+    one_of = tuple(schema.get("required_one_of", ()))
+    # key -> check, or a type_check() tuple that is tested inline
+    properties = {key: compile_child(child) for key, child in schema.get("properties", {}).items()}
+    property_items = tuple(properties.items())
+    values = compile_child(schema["values"]) if "values" in schema else None
+    if not required and not one_of and not properties and values is None and expected is None:
+        return []
+    one_of_message = "Needs exactly one of " + ", ".join(f'"{key}"' for key in one_of)
+    
+    def check_values(value, path, errors):
+        if values.__class__ is not tuple:
+            for key, child in value.items():
+                values(child, (path, key), errors)
+            return
+        allowed, reject_bool, message = values
+        for key, child in value.items():
+            if not isinstance(child, allowed) or (reject_bool and child.__class__ is bool):
+                errors.append(((path, key), message))
+    
+    def check_object(value, path, errors):
+        if value.__class__ is not dict:
+            if expected is not None:
+                errors.append((path, expected))
+            return
+        for key in required:
+            if key not in value:
+                errors.append((path, f'Missing "{key}"'))
+        if one_of and sum(1 for key in one_of if key in value) != 1:
+            errors.append((path, one_of_message))
+        # Walk whichever side is smaller, objects usually set few of the known keys
+        if len(value) < len(property_items):
+            for key, child in value.items():
+                check = properties.get(key)
+                if check is None:
+                    continue
+                if check.__class__ is not tuple:
+                    check(child, (path, key), errors)
+                elif not isinstance(child, check[0]) or (check[1] and child.__class__ is bool):
+                    errors.append(((path, key), check[2]))
+        else:
+            for key, check in property_items:
+                child = value.get(key, MISSING)
+                if child is MISSING:
+                    continue
+                if check.__class__ is not tuple:
+                    check(child, (path, key), errors)
+                elif not isinstance(child, check[0]) or (check[1] and child.__class__ is bool):
+                    errors.append(((path, key), check[2]))
+        if values is not None:
+            check_values(value, path, errors)
+    return [check_object]
+
+
+def array_checks(schema):
+    """Checks of length and elements for arrays"""
+    min_items = schema.get("min_items", 0)
+    max_items = schema.get("max_items")
+    items = compile_schema(schema["items"]) if "items" in schema else None
+    if not min_items and max_items is None and items is None:
+        return []
+    
+    def check_array(value, path, errors):
+        if value.__class__ is not list:
+            return
+        if len(value) < min_items:
+            errors.append((path, f"Needs at least {min_items} entries"))
+        elif max_items is not None and len(value) > max_items:
+            errors.append((path, f"Has more than {max_items} entries"))
+        if items is not None:
+            for index, child in enumerate(value):
+                items(child, (path, index), errors)
+    return [check_array]
+
+
+def compile_schema(schema):
+    """Closure check(value, path, errors) for a schema, errors get (path, message) appended"""
+    if type_check(schema) is not None and type_check(schema)[0] == (dict,):
+        # Object nodes check their own type, one call per object instead of two
+        return object_checks(schema, type_check(schema)[2])[0]
+    
+    checks = string_checks(schema) + number_checks(schema) + object_checks(schema) + array_checks(schema)
+    names = schema.get("type")
+    if names is None:
+        def check(value, path, errors):
+            for child_check in checks:
+                child_check(value, path, errors)
+        return checks[0] if len(checks) == 1 else check
+    
+    allowed, reject_bool, expected = type_check(schema)
+    # Most nodes have at most one check, they get a closure without the loop
+    if not checks:
+        def check(value, path, errors):
+            if not isinstance(value, allowed) or (reject_bool and value.__class__ is bool):
+                errors.append((path, expected))
+    elif len(checks) == 1:
+        only_check = checks[0]
+        
+        def check(value, path, errors):
+            if not isinstance(value, allowed) or (reject_bool and value.__class__ is bool):
+                errors.append((path, expected))
+            else:
+                only_check(value, path, errors)
+    else:
+        def check(value, path, errors):
+            if not isinstance(value, allowed) or (reject_bool and value.__class__ is bool):
+                errors.append((path, expected))
+                return
+            for child_check in checks:
+                child_check(value, path, errors)
+    return check
+
+
+# ==================== Building blocks ====================
+STRING = {"type": "string"}
+BOOLEAN = {"type": "boolean"}
+NUMBER = {"type": "number"}
+INTEGER = {"type": "integer"}
+OBJECT = {"type": "object"}
+# Components that are switched on with true or configured with an object
+FLAG = {"type": ("boolean", "object")}
+
+FORMAT_VERSION = {"type": "string", "pattern": r"\d+(\.\d+){1,3}", "format": "1.20.0"}
+IDENTIFIER = {"type": "string", "pattern": IDENTIFIER_PATTERN.pattern, "format": "namespace:name"}
+MENU_CATEGORIES = ["construction", "equipment", "items", "nature", "none", "commands"]
+RENDER_METHODS = ["opaque", "double_sided", "blend", "alpha_test", "alpha_test_single_sided",
+                  "blend_to_opaque", "alpha_test_to_opaque", "alpha_test_single_sided_to_opaque"]
+
+
+def description(**properties):
+    """Schema of a description section with an identifier"""
+    return {"type": "object", "required": ["identifier"], "properties": {"identifier": IDENTIFIER, **properties}}
+
+
+def definition(root_key, section):
+    """Schema of a document with format_version and one root section"""
+    return {
+        "type": "object",
+        "required": ["format_version", root_key],
+        "properties": {"format_version": FORMAT_VERSION, root_key: section}
+    }
+
+
+def at_least(minimum, kind="number"):
+    """Schema of a number with a lower bound"""
+    return {"type": kind, "minimum": minimum}
+
+
+def between(minimum, maximum, kind="number"):
+    """Schema of a number in a range"""
+    return {"type": kind, "minimum": minimum, "maximum": maximum}
+
+
+MENU_CATEGORY = {
+    "type": "object",
+    "required": ["category"],
+    "properties": {
+        "category": {"type": "string", "enum": MENU_CATEGORIES},
+        "group": STRING,
+        "is_hidden_in_commands": BOOLEAN
+    }
+}
+
+# ==================== Items ====================
+ITEM_COMPONENTS = {
+    "minecraft:display_name": {"type": "object", "required": ["value"], "properties": {"value": STRING}},
+    "minecraft:icon": {
+        "type": ("string", "object"),
+        "properties": {"texture": STRING, "textures": {"type": "object", "values": STRING}}
+    },
+    "minecraft:max_stack_size": {
+        "type": ("integer", "object"), "minimum": 1, "maximum": 64,
+        "properties": {"value": between(1, 64, "integer")}
+    },
+    "minecraft:hand_equipped": {"type": ("boolean", "object"), "properties": {"value": BOOLEAN}},
+    "minecraft:glint": {"type": ("boolean", "object"), "properties": {"value": BOOLEAN}},
+    "minecraft:allow_off_hand": {"type": ("boolean", "object"), "properties": {"value": BOOLEAN}},
+    "minecraft:durability": {
+        "type": "object",
+        "required": ["max_durability"],
+        "properties": {
+            "max_durability": at_least(0, "integer"),
+            "damage_chance": {"type": "object", "properties": {"min": INTEGER, "max": INTEGER}}
+        }
+    },
+    "minecraft:food": {
+        "type": "object",
+        "properties": {
+            "nutrition": at_least(0, "integer"),
+            "saturation_modifier": {"type": ("number", "string")},
+            "can_always_eat": BOOLEAN
+        }
+    },
+    "minecraft:damage": {
+        "type": ("integer", "object"), "minimum": 0,
+        "properties": {"value": at_least(0, "integer")}
+    },
+    "minecraft:fuel": {"type": "object", "required": ["duration"], "properties": {"duration": at_least(0.05)}},
+    "minecraft:wearable": {
+        "type": "object",
+        "required": ["slot"],
+        "properties": {
+            "slot": {"type": "string", "pattern": r"slot\.[a-z_.]+", "format": "slot.armor.head"},
+            "protection": at_least(0, "integer")
+        }
+    }
+}
+
+ITEM_SCHEMA = definition("minecraft:item", {
+    "type": "object",
+    "required": ["description"],
+    "properties": {
+        "description": description(category={"type": "string", "enum": MENU_CATEGORIES}, menu_category=MENU_CATEGORY),
+        "components": {"type": "object", "properties": ITEM_COMPONENTS}
+    }
+})
+
+# ==================== Blocks ====================
+BLOCK_COMPONENTS = {
+    "minecraft:block_light_emission": at_least(0),
+    "minecraft:light_emission": between(0, 15, "integer"),
+    "minecraft:light_dampening": between(0, 15, "integer"),
+    "minecraft:destroy_time": at_least(0),
+    "minecraft:destructible_by_mining": {"type": ("boolean", "object"), "properties": {"seconds_to_destroy": at_least(0)}},
+    "minecraft:explosion_resistance": at_least(0),
+    "minecraft:destructible_by_explosion": {"type": ("boolean", "object"), "properties": {"explosion_resistance": at_least(0)}},
+    "minecraft:friction": between(0, 0.9),
+    "minecraft:flammable": {
+        "type": ("boolean", "object"),
+        "properties": {
+            "catch_chance_modifier": at_least(0, "integer"),
+            "destroy_chance_modifier": at_least(0, "integer"),
+            "burn_odds": at_least(0, "integer"),
+            "flame_odds": at_least(0, "integer")
+        }
+    },
+    "minecraft:map_color": {
+        "type": ("string", "array"), "pattern": r"#[0-9A-Fa-f]{6}", "format": "#rrggbb",
+        "min_items": 3, "max_items": 3, "items": between(0, 255, "integer")
+    },
+    "minecraft:material_instances": {
+        "type": "object",
+        "values": {
+            # A string refers to another instance, e.g. "up": "*"
+            "type": ("object", "string"),
+            "properties": {
+                "texture": STRING,
+                "render_method": {"type": "string", "enum": RENDER_METHODS},
+                "face_dimming": BOOLEAN,
+                "ambient_occlusion": {"type": ("boolean", "number")}
+            }
+        }
+    },
+    "minecraft:geometry": {"type": ("string", "object"), "required": ["identifier"], "properties": {"identifier": STRING}},
+    "minecraft:breathability": {"type": "string", "enum": ["solid", "air"]},
+    "minecraft:replaceable": FLAG,
+    "minecraft:loot": STRING,
+    "minecraft:collision_box": {
+        "type": ("boolean", "object"),
+        "properties": {
+            "origin": {"type": "array", "min_items": 3, "max_items": 3, "items": NUMBER},
+            "size": {"type": "array", "min_items": 3, "max_items": 3, "items": NUMBER}
+        }
+    },
+    "minecraft:selection_box": {
+        "type": ("boolean", "object"),
+        "properties": {
+            "origin": {"type": "array", "min_items": 3, "max_items": 3, "items": NUMBER},
+            "size": {"type": "array", "min_items": 3, "max_items": 3, "items": NUMBER}
+        }
+    }
+}
+
+BLOCK_SCHEMA = definition("minecraft:block", {
+    "type": "object",
+    "required": ["description"],
+    "properties": {
+        "description": description(category={"type": "string", "enum": MENU_CATEGORIES}, menu_category=MENU_CATEGORY,
+                                   states=OBJECT, traits=OBJECT),
+        "components": {"type": "object", "properties": BLOCK_COMPONENTS},
+        "permutations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["condition", "components"],
+                "properties": {"condition": STRING, "components": {"type": "object", "properties": BLOCK_COMPONENTS}}
+            }
+        }
+    }
+})
+
+# ==================== Entities ====================
+# value of health and movement is a number or a {range_min, range_max} object
+RANGED_VALUE = {
+    "type": "object",
+    "properties": {"value": {"type": ("number", "object"), "minimum": 0}, "max": at_least(0)}
+}
+
+ENTITY_COMPONENTS = {
+    "minecraft:type_family": {
+        "type": "object",
+        "required": ["family"],
+        "properties": {"family": {"type": "array", "items": STRING}}
+    },
+    "minecraft:health": RANGED_VALUE,
+    "minecraft:movement": RANGED_VALUE,
+    "minecraft:attack": {"type": "object", "required": ["damage"], "properties": {"damage": {"type": ("number", "array", "object")}}},
+    "minecraft:knockback_resistance": {"type": "object", "properties": {"value": between(0, 1)}},
+    "minecraft:collision_box": {"type": "object", "properties": {"width": at_least(0), "height": at_least(0)}},
+    "minecraft:scale": {"type": "object", "properties": {"value": at_least(0)}},
+    "minecraft:loot": {"type": "object", "required": ["table"], "properties": {"table": STRING}},
+    "minecraft:equipment": {
+        "type": "object",
+        "properties": {
+            "table": STRING,
+            "slot_drop_chance": {
+                "type": "array",
+                "items": {"type": "object", "properties": {"slot": STRING, "drop_chance": between(0, 1)}}
+            }
+        }
+    },
+    "minecraft:nameable": {"type": "object", "properties": {"always_show": BOOLEAN, "allow_name_tag_renaming": BOOLEAN}},
+    "minecraft:breedable": {
+        "type": "object",
+        "properties": {
+            "require_tame": BOOLEAN,
+            "breeds_with": {"type": ("array", "object")},
+            "breed_items": {"type": ("array", "string")}
+        }
+    },
+    "minecraft:physics": {"type": "object", "properties": {"has_gravity": BOOLEAN, "has_collision": BOOLEAN}},
+    "minecraft:pushable": {"type": "object", "properties": {"is_pushable": BOOLEAN, "is_pushable_by_piston": BOOLEAN}},
+    "minecraft:despawn": OBJECT
+}
+
+ENTITY_SCHEMA = definition("minecraft:entity", {
+    "type": "object",
+    "required": ["description"],
+    "properties": {
+        "description": description(is_spawnable=BOOLEAN, is_summonable=BOOLEAN, is_experimental=BOOLEAN,
+                                   runtime_identifier=STRING, properties=OBJECT),
+        "component_groups": {"type": "object", "values": {"type": "object", "properties": ENTITY_COMPONENTS}},
+        "components": {"type": "object", "properties": ENTITY_COMPONENTS},
+        "events": {"type": "object", "values": OBJECT}
+    }
+})
+
+# ==================== Recipes ====================
+# An item is its id or an {item, data, count} object
+ITEM_STACK = {
+    "type": ("string", "object"),
+    "properties": {"item": STRING, "data": INTEGER, "count": at_least(1, "integer"), "tag": STRING}
+}
+RECIPE_TAGS = {"type": "array", "min_items": 1, "items": STRING}
+
+
+def recipe(required, **properties):
+    """Schema of a recipe section, every recipe has a description and tags"""
+    return {
+        "type": "object",
+        "required": ["description", "tags", *required],
+        "properties": {"description": description(), "tags": RECIPE_TAGS, "priority": INTEGER, **properties}
+    }
+
+
+RECIPE_SECTIONS = {
+    "minecraft:recipe_shaped": recipe(
+        ["pattern", "key", "result"],
+        pattern={"type": "array", "min_items": 1, "max_items": 3,
+                 "items": {"type": "string", "min_length": 1, "max_length": 3}},
+        key={"type": "object", "values": ITEM_STACK},
+        result={"type": ("string", "object", "array"), "properties": ITEM_STACK["properties"], "items": ITEM_STACK}),
+    "minecraft:recipe_shapeless": recipe(
+        ["ingredients", "result"],
+        ingredients={"type": "array", "min_items": 1, "max_items": 9, "items": ITEM_STACK},
+        result={"type": ("string", "object", "array"), "properties": ITEM_STACK["properties"], "items": ITEM_STACK}),
+    "minecraft:recipe_furnace": recipe(["input", "output"], input=ITEM_STACK, output=ITEM_STACK),
+    "minecraft:recipe_brewing_mix": recipe(["input", "reagent", "output"], input=STRING, reagent=STRING, output=STRING),
+    "minecraft:recipe_brewing_container": recipe(["input", "reagent", "output"], input=STRING, reagent=STRING, output=STRING)
+}
+
+RECIPE_SCHEMA = {
+    "type": "object",
+    "required": ["format_version"],
+    "required_one_of": list(RECIPE_SECTIONS),
+    "properties": {"format_version": FORMAT_VERSION, **RECIPE_SECTIONS}
+}
+
+# ==================== Loot tables ====================
+# A count or roll is a number or a {min, max} range
+NUMBER_RANGE = {"type": ("number", "object"), "minimum": 0, "properties": {"min": NUMBER, "max": NUMBER}}
+CONDITIONS = {
+    "type": "array",
+    "items": {"type": "object", "required": ["condition"], "properties": {"condition": STRING}}
+}
+LOOT_ENTRY = {
+    "type": "object",
+    "required": ["type"],
+    "properties": {
+        "type": {"type": "string", "enum": list(LOOT_ENTRY_TYPES)},
+        "name": STRING,
+        "weight": at_least(0, "integer"),
+        "quality": INTEGER,
+        "functions": {
+            "type": "array",
+            "items": {"type": "object", "required": ["function"], "properties": {"function": STRING, "count": NUMBER_RANGE}}
+        },
+        "conditions": CONDITIONS
+    }
+}
+
+LOOT_TABLE_SCHEMA = {
+    "type": "object",
+    "required": ["pools"],
+    "properties": {
+        "pools": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["entries"],
+                "properties": {
+                    "rolls": NUMBER_RANGE,
+                    "entries": {"type": "array", "items": LOOT_ENTRY},
+                    "conditions": CONDITIONS,
+                    "tiers": OBJECT
+                }
+            }
+        }
+    }
+}
+
+# ==================== Spawn rules ====================
+SPAWN_CONDITION = {
+    "type": "object",
+    "properties": {
+        "minecraft:weight": {"type": "object", "properties": {"default": at_least(0, "integer")}},
+        "minecraft:herd": {
+            "type": ("object", "array"),
+            "properties": {"min_size": at_least(1, "integer"), "max_size": at_least(1, "integer")}
+        },
+        "minecraft:biome_filter": {"type": ("object", "array")},
+        "minecraft:brightness_filter": {
+            "type": "object",
+            "properties": {"min": between(0, 15, "integer"), "max": between(0, 15, "integer"), "adjust_for_weather": BOOLEAN}
+        },
+        "minecraft:height_filter": {"type": "object", "properties": {"min": INTEGER, "max": INTEGER}},
+        "minecraft:density_limit": {"type": "object", "properties": {"surface": INTEGER, "underground": INTEGER}}
+    }
+}
+
+SPAWN_RULE_SCHEMA = definition("minecraft:spawn_rules", {
+    "type": "object",
+    "required": ["description", "conditions"],
+    "properties": {
+        "description": {
+            "type": "object",
+            "required": ["identifier", "population_control"],
+            "properties": {"identifier": IDENTIFIER, "population_control": STRING}
+        },
+        "conditions": {"type": "array", "items": SPAWN_CONDITION}
+    }
+})
+
+# ==================== Texture atlases ====================
+TEXTURE_PATH = {"type": ("string", "object"), "required": ["path"], "properties": {"path": STRING}}
+
+
+def atlas(texture_name):
+    """Schema of item_texture.json or terrain_texture.json"""
+    return {
+        "type": "object",
+        "required": ["texture_data"],
+        "properties": {
+            "resource_pack_name": STRING,
+            "texture_name": {"type": "string", "enum": [texture_name]},
+            "padding": at_least(0, "integer"),
+            "num_mip_levels": at_least(0, "integer"),
+            "texture_data": {
+                "type": "object",
+                "values": {
+                    "type": "object",
+                    "required": ["textures"],
+                    "properties": {
+                        "textures": {"type": ("string", "object", "array"), "required": ["path"],
+                                     "properties": {"path": STRING}, "items": TEXTURE_PATH}
+                    }
+                }
+            }
+        }
+    }
+
+
+# File kind (see validate.file_kind()) -> schema
+SCHEMAS = {
+    "item": ITEM_SCHEMA,
+    "block": BLOCK_SCHEMA,
+    "entity": ENTITY_SCHEMA,
+    "recipe": RECIPE_SCHEMA,
+    "loot_table": LOOT_TABLE_SCHEMA,
+    "spawn_rule": SPAWN_RULE_SCHEMA,
+    "item_texture": atlas("atlas.items"),
+    "terrain_texture": atlas("atlas.terrain")
+}
+
+# File kind -> compiled check, filled on first use
+VALIDATORS = {}
+
+
+def validator_for(kind):
+    """Compiled check of a file kind, None for kinds without a schema"""
+    validator = VALIDATORS.get(kind)
+    if validator is None and kind in SCHEMAS:
+        validator = VALIDATORS[kind] = compile_schema(SCHEMAS[kind])
+    return validator
+
+
+def schema_errors(kind, document):
+    """(JSON pointer, message) of every place where a document breaks the schema of its kind"""
+    validator = validator_for(kind)
+    if validator is None:
+        return []
+    errors = []
+    validator(document, (), errors)
+    return [(format_path(path), message) for path, message in errors]
+
+
+def schema_kind(path, bp_path, rp_path):
+    """File kind of a file in one of the packs, None elsewhere"""
+    for pack, pack_path in (("behavior_pack", bp_path), ("resource_pack", rp_path)):
+        try:
+            parts = Path(path).relative_to(pack_path).parts
+        except ValueError:
+            continue
+        return file_kind(pack, parts) if parts else None
+    return None
@@ -0,0 +1,314 @@
+"""Find in Project
+
+SearchIndex keeps the set of lowercase trigrams of every text file in
+both packs. A query only reads the files whose trigram set contains all
+trigrams of the query, so most of the project is never touched; those
+candidates are then searched for the exact text to get lines and
+columns. Files are indexed again one at a time as they change, like the
+project index.
+
+SearchWorker runs queries on a worker thread and hands the results of
+the latest one back to the Tk main loop.
+"""
+
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from quickide.watcher import DELETED, RESCAN
+
+SEARCH_EXTENSIONS = {".json", ".lang", ".mcfunction", ".js"}
+
+# Larger files are left out of the index, they open in the read-only viewer anyway
+MAX_INDEXED_SIZE = 8 * 1024 * 1024
+
+# Stop reading candidates once this many matches were found
+MAX_HITS = 2000
+
+# Results returned by a search
+RESULT_LIMIT = 200
+
+# Longest line text kept for a result
+MAX_LINE_TEXT = 200
+
+
+@dataclass
+class SearchHit:
+    pack: str
+    path: str
+    relative: str
+    line: int
+    column: int
+    text: str
+    # Number of earlier matches in the same file, used to find the match in a reformatted view
+    occurrence: int
+    score: int
+
+
+def trigrams(text):
+    """Set of the three-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def read_text(path):
+    """Content of a text file, None if it cannot be read"""
+    try:
+        with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def is_word_char(char):
+    """Whether a character is part of an identifier"""
+    return char.isalnum() or char == "_"
+
+
+def find_hits(pack, path, relative, text, query, limit):
+    """Matches of query in one file, ignoring case"""
+    needle = query.lower()
+    lowered = text.lower()
+    # Lowercasing a few characters changes the length, exact case checks are skipped then
+    same_length = len(lowered) == len(text)
+    name_bonus = 3 if needle in os.path.basename(relative).lower() else 0
+    
+    hits = []
+    lines = None
+    line = 0
+    # Line breaks before this position are counted in line
+    counted = 0
+    position = lowered.find(needle)
+    while position != -1 and len(hits) < limit:
+        line += lowered.count("\n", counted, position)
+        counted = position
+        line_start = lowered.rfind("\n", 0, position) + 1
+        if lines is None:
+            lines = text.split("\n") if same_length else lowered.split("\n")
+        
+        score = 1 + name_bonus
+        end = position + len(needle)
+        if same_length and text.startswith(query, position):
+            score += 2
+        if (position == 0 or not is_word_char(lowered[position - 1])) and (end >= len(lowered) or not is_word_char(lowered[end])):
+            score += 1
+        
+        hits.append(SearchHit(pack, path, relative, line + 1, position - line_start + 1,
+                              lines[line].strip()[:MAX_LINE_TEXT], len(hits), score))
+        position = lowered.find(needle, end)
+    return hits
+
+
+class SearchIndex:
+    """Trigram sets of the text files of both packs"""
+    
+    def __init__(self, bp_path, rp_path):
+        self.packs = [("BP", Path(bp_path)), ("RP", Path(rp_path))]
+        self.lock = threading.Lock()
+        # path -> frozenset of trigrams
+        self.files = {}
+        # One shared string per trigram instead of one per file
+        self.shared = {}
+        self.ready = False
+        self.building = False
+        self.changed_during_build = set()
+    
+    def pack_of(self, path):
+        """(pack label, path relative to the pack) of a file, None outside the packs"""
+        for label, pack_path in self.packs:
+            prefix = os.path.join(str(pack_path), "")
+            if path.startswith(prefix):
+                return label, path[len(prefix):].replace(os.sep, "/")
+        return None
+    
+    def file_trigrams(self, path):
+        """Trigrams of a searchable file, None for anything else"""
+        if os.path.splitext(path)[1].lower() not in SEARCH_EXTENSIONS:
+            return None
+        try:
+            if os.path.getsize(path) > MAX_INDEXED_SIZE:
+                return None
+        except OSError:
+            return None
+        text = read_text(path)
+        if text is None:
+            return None
+        grams = trigrams(text.lower())
+        return frozenset(map(self.shared.setdefault, grams, grams))
+    
+    # ==================== Building ====================
+    def build(self):
+        """Index every text file of both packs, returns the number of files"""
+        with self.lock:
+            self.building = True
+            self.changed_during_build = set()
+        
+        files = {}
+        for _, pack_path in self.packs:
+            for dir_path, _, file_names in os.walk(pack_path):
+                for name in file_names:
+                    path = os.path.join(dir_path, name)
+                    grams = self.file_trigrams(path)
+                    if grams is not None:
+                        files[path] = grams
+        
+        with self.lock:
+            self.files = files
+            changed_during_build = self.changed_during_build
+            self.building = False
+            self.ready = True
+        
+        # Files saved during the scan may have been read before the change
+        for path in changed_during_build:
+            self.update_file(path)
+        return len(files)
+    
+    # ==================== Updates ====================
+    def update_file(self, path):
+        """Index one file again after it was saved, created or deleted"""
+        path = str(path)
+        if not self.ready and not self.building:
+            # The first build reads the current state anyway
+            return
+        grams = self.file_trigrams(path) if os.path.isfile(path) else None
+        with self.lock:
+            if self.building:
+                self.changed_during_build.add(path)
+            if grams is None:
+                self.files.pop(path, None)
+            else:
+                self.files[path] = grams
+    
+    def remove_tree(self, path):
+        """Forget every file below a deleted folder"""
+        path = str(path)
+        prefix = os.path.join(path, "")
+        with self.lock:
+            for file_path in [file_path for file_path in self.files if file_path == path or file_path.startswith(prefix)]:
+                del self.files[file_path]
+    
+    def apply_changes(self, changes):
+        """Apply a batch of changes reported by ProjectWatcher"""
+        if not self.ready:
+            return
+        for path, kind in changes.items():
+            path = str(path)
+            if kind == RESCAN:
+                # Events were lost, the next query builds the index again
+                self.ready = False
+                return
+            if kind == DELETED:
+                self.remove_tree(path)
+            elif os.path.isdir(path):
+                for dir_path, _, file_names in os.walk(path):
+                    for name in file_names:
+                        self.update_file(os.path.join(dir_path, name))
+            else:
+                self.update_file(path)
+    
+    # ==================== Queries ====================
+    def candidates(self, query):
+        """Files that may contain query, sorted by path"""
+        grams = trigrams(query.lower())
+        with self.lock:
+            if not grams:
+                # Too short for trigrams, every file has to be read
+                return sorted(self.files)
+            return sorted(path for path, file_grams in self.files.items() if grams <= file_grams)
+    
+    def search(self, query, limit=RESULT_LIMIT, cancelled=None):
+        """Best matches of query ignoring case, None if cancelled
+        
+        Exact-case matches, whole-word matches and matches in files whose
+        name contains the query rank first.
+        """
+        if not query.strip():
+            return []
+        
+        hits = []
+        for path in self.candidates(query):
+            if cancelled is not None and cancelled():
+                return None
+            location = self.pack_of(path)
+            text = read_text(path)
+            if location is None or text is None:
+                continue
+            hits.extend(find_hits(location[0], path, location[1], text, query, MAX_HITS - len(hits)))
+            if len(hits) >= MAX_HITS:
+                break
+        
+        hits.sort(key=lambda hit: (-hit.score, hit.pack, hit.relative, hit.line, hit.column))
+        return hits[:limit]
+
+
+class SearchWorker:
+    """Run queries on a worker thread, only the results of the latest one are delivered"""
+    
+    def __init__(self, index, widget, on_results, poll_ms=30):
+        self.index = index
+        self.widget = widget
+        self.on_results = on_results
+        self.poll_ms = poll_ms
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.results = queue.Queue()
+        self.generation = 0
+        self.pending = None
+        self.thread = None
+        self.polling = False
+    
+    def submit(self, query):
+        """Search for query, replacing any query still running"""
+        with self.lock:
+            self.generation += 1
+            self.pending = (self.generation, query)
+        self.wakeup.set()
+        
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="SearchWorker", daemon=True)
+            self.thread.start()
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.poll_ms, self.poll)
+    
+    def is_stale(self, generation):
+        """Whether a newer query was submitted"""
+        return generation != self.generation
+    
+    def run(self):
+        """Worker thread: run the latest pending query"""
+        while True:
+            self.wakeup.wait()
+            with self.lock:
+                self.wakeup.clear()
+                generation, query = self.pending
+            
+            try:
+                if not self.index.ready:
+                    self.index.build()
+                hits = self.index.search(query, cancelled=lambda: self.is_stale(generation))
+            except Exception as e:
+                print(f"Search failed: {e}")
+                hits = []
+            if hits is not None and not self.is_stale(generation):
+                self.results.put((generation, query, hits))
+    
+    def poll(self):
+        """Main thread: deliver finished results"""
+        try:
+            if not self.widget.winfo_exists():
+                return
+        except Exception:
+            return
+        
+        while True:
+            try:
+                generation, query, hits = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if not self.is_stale(generation):
+                self.polling = False
+                self.on_results(query, hits)
+                return
+        self.widget.after(self.poll_ms, self.poll)
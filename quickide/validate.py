@@ -0,0 +1,720 @@
+"""Project validation
+
+Every JSON file of both packs is parsed and checked against the rules of
+its type (manifest, item, block, entity, recipe, loot table, spawn rules,
+texture atlas). Files are independent, so they are checked in batches on
+a process pool. Each check also reports what the file defines and what it
+refers to, and the checks that need the whole project (duplicate
+identifiers and UUIDs, references to loot tables, items and textures that
+do not exist) run on those facts afterwards.
+
+Diagnostics carry the file relative to the project and, where it can be
+found, the line of the offending key or value.
+
+ProjectValidator keeps those facts between runs, so after a save only the
+saved file and the files depending on it are checked again; the editor
+runs it on a ValidationWorker thread.
+"""
+
+import json
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from quickide.index import ATLAS_FILES, DEFINITION_FOLDERS, TABLE_FOLDERS, item_reference
+from quickide.minify import strip_comments
+from quickide.pngopt import TEXTURE_EXTENSIONS
+from quickide.project import check_structure, pack_paths
+
+# Projects with fewer JSON files are checked in-process, starting workers would take longer
+PARALLEL_THRESHOLD = 400
+
+# Files per task sent to a worker process
+BATCH_SIZE = 100
+
+# Root key of each definition kind
+ROOT_KEYS = {
+    "item": "minecraft:item",
+    "block": "minecraft:block",
+    "entity": "minecraft:entity",
+    "spawn_rule": "minecraft:spawn_rules"
+}
+
+RECIPE_KEYS = (
+    "minecraft:recipe_shaped", "minecraft:recipe_shapeless", "minecraft:recipe_furnace",
+    "minecraft:recipe_brewing_mix", "minecraft:recipe_brewing_container", "minecraft:recipe_smithing_transform",
+    "minecraft:recipe_smithing_trim", "minecraft:recipe_material_reduction"
+)
+
+LOOT_ENTRY_TYPES = ("item", "loot_table", "empty")
+
+# Kinds whose names have to be unique across the project
+UNIQUE_KINDS = ("item", "block", "entity", "recipe", "spawn_rule", "uuid")
+
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z0-9_.\-]+:[A-Za-z0-9_.\-/]+$")
+UUID_PATTERN = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+
+
+@dataclass
+class Diagnostic:
+    severity: str
+    message: str
+    # File relative to the project, posix separators
+    path: str = None
+    line: int = None
+    code: str = None
+    
+    def to_dict(self):
+        """JSON friendly form, unknown fields left out"""
+        return {key: value for key, value in self.__dict__.items() if value is not None}
+
+
+@dataclass
+class ValidationResult:
+    """Diagnostics of a validation run"""
+    diagnostics: list = field(default_factory=list)
+    files: int = 0
+    seconds: float = 0.0
+    
+    @property
+    def errors(self):
+        """Diagnostics with error severity"""
+        return [diagnostic for diagnostic in self.diagnostics if diagnostic.severity == "error"]
+    
+    @property
+    def warnings(self):
+        """Diagnostics with warning severity"""
+        return [diagnostic for diagnostic in self.diagnostics if diagnostic.severity == "warning"]
+    
+    def to_dict(self):
+        """JSON friendly form for the command line"""
+        return {
+            "files": self.files,
+            "seconds": round(self.seconds, 3),
+            "errors": len(self.errors),
+            "warnings": len(self.warnings),
+            "diagnostics": [diagnostic.to_dict() for diagnostic in self.diagnostics]
+        }
+
+
+class FileChecker:
+    """Rules for one parsed file, collecting diagnostics and facts as plain tuples"""
+    
+    def __init__(self, text, kind):
+        self.text = text
+        self.kind = kind
+        # (severity, code, message, line)
+        self.diagnostics = []
+        # (kind, name, line)
+        self.definitions = []
+        # (field, kinds, name, line)
+        self.references = []
+    
+    def line_of(self, value):
+        """Line of the first occurrence of a JSON string, None if it is not found"""
+        index = self.text.find(json.dumps(value, ensure_ascii=False))
+        if index == -1:
+            return None
+        return self.text.count("\n", 0, index) + 1
+    
+    def report(self, severity, code, message, near=None):
+        """Add a diagnostic at the line of near"""
+        self.diagnostics.append((severity, code, message, self.line_of(near) if near is not None else None))
+    
+    def define(self, kind, name):
+        """Record a name this file defines"""
+        self.definitions.append((kind, name, self.line_of(name)))
+    
+    def refer(self, field_name, kinds, name):
+        """Record a reference to something another file has to define"""
+        if isinstance(name, str) and name:
+            self.references.append((field_name, kinds, name, self.line_of(name)))
+    
+    def refer_item(self, field_name, item):
+        """Record a reference to an item or block id, vanilla ids are skipped"""
+        if isinstance(item, dict):
+            item = item.get("item")
+        if not isinstance(item, str):
+            return
+        name = item_reference(item)
+        if name is not None:
+            self.refer(field_name, ("item", "block"), name)
+    
+    def require(self, parent, key, expected, near, severity="error"):
+        """Value of parent[key] if it has the expected type, reporting it otherwise"""
+        if not isinstance(parent, dict):
+            # Reported where the parent was required
+            return None
+        value = parent.get(key)
+        if value is None:
+            self.report(severity, "missing-field", f'Missing "{key}"', near)
+        elif not isinstance(value, expected):
+            self.report(severity, "wrong-type", f'"{key}" has the wrong type', key)
+            return None
+        return value
+    
+    # ==================== Rules ====================
+    def check(self, document):
+        """Run the rules of this file's kind, other files only have to parse"""
+        rule = getattr(self, f"check_{self.kind}", None)
+        if rule is None:
+            return
+        if not isinstance(document, dict):
+            self.report("error", "wrong-type", "The top level must be an object")
+            return
+        rule(document)
+    
+    def check_description(self, section, root_key, define_kind):
+        """description.identifier of a definition"""
+        description = self.require(section, "description", dict, root_key)
+        identifier = self.require(description, "identifier", str, "description")
+        if identifier is None:
+            return None
+        if not IDENTIFIER_PATTERN.match(identifier):
+            self.report("warning", "identifier-format", f'Identifier "{identifier}" should look like namespace:name', identifier)
+        self.define(define_kind, identifier)
+        return identifier
+    
+    def check_definition(self, document):
+        """Root key, format_version, description and components of a definition"""
+        root_key = ROOT_KEYS[self.kind]
+        if "format_version" not in document:
+            self.report("warning", "missing-field", 'Missing "format_version"')
+        section = self.require(document, root_key, dict, None)
+        if section is None:
+            return None
+        self.check_description(section, root_key, self.kind)
+        components = section.get("components", {})
+        if not isinstance(components, dict):
+            self.report("error", "wrong-type", '"components" has the wrong type', "components")
+            return None
+        return section
+    
+    def check_manifest(self, document):
+        """Header and modules of a pack manifest"""
+        if "format_version" not in document:
+            self.report("warning", "missing-field", 'Missing "format_version"')
+        header = self.require(document, "header", dict, None)
+        if header is not None:
+            self.require(header, "name", str, "header")
+            self.check_version(header, "header")
+            self.check_uuid(header, "header")
+        modules = self.require(document, "modules", list, None)
+        if modules is not None:
+            if not modules:
+                self.report("error", "missing-field", "The manifest has no modules", "modules")
+            for module in modules:
+                if not isinstance(module, dict):
+                    self.report("error", "wrong-type", "Modules must be objects", "modules")
+                    continue
+                self.require(module, "type", str, "modules")
+                self.check_version(module, "modules")
+                self.check_uuid(module, "modules")
+    
+    def check_version(self, section, near):
+        """A [major, minor, patch] version"""
+        version = self.require(section, "version", list, near)
+        if version is not None and (len(version) != 3 or not all(isinstance(part, int) for part in version)):
+            self.report("error", "wrong-type", '"version" must be three numbers', "version")
+    
+    def check_uuid(self, section, near):
+        """A well-formed UUID, recorded so duplicates can be found"""
+        value = self.require(section, "uuid", str, near)
+        if value is None:
+            return
+        if not UUID_PATTERN.match(value):
+            self.report("error", "uuid-format", f'"{value}" is not a valid UUID', value)
+        else:
+            self.define("uuid", value.lower())
+    
+    def check_item(self, document):
+        """Item definition, the icon refers to item_texture.json"""
+        section = self.check_definition(document)
+        if section is None:
+            return
+        icon = section.get("components", {}).get("minecraft:icon")
+        if isinstance(icon, dict):
+            textures = icon.get("textures")
+            icon = icon.get("texture") or (textures.get("default") if isinstance(textures, dict) else None)
+        self.refer("icon", ("item_texture",), icon)
+    
+    def check_block(self, document):
+        """Block definition, with its loot table and terrain textures"""
+        section = self.check_definition(document)
+        if section is None:
+            return
+        components = section.get("components", {})
+        loot = components.get("minecraft:loot")
+        if loot is not None and not isinstance(loot, str):
+            self.report("error", "wrong-type", '"minecraft:loot" of a block must be a loot table path', "minecraft:loot")
+        self.refer("loot", ("loot_table",), loot)
+        materials = components.get("minecraft:material_instances")
+        if isinstance(materials, dict):
+            for material in materials.values():
+                if isinstance(material, dict):
+                    self.refer("texture", ("terrain_texture",), material.get("texture"))
+    
+    def check_entity(self, document):
+        """Entity definition, with the tables of its components and component groups"""
+        section = self.check_definition(document)
+        if section is None:
+            return
+        groups = section.get("component_groups", {})
+        if not isinstance(groups, dict):
+            self.report("error", "wrong-type", '"component_groups" has the wrong type', "component_groups")
+            groups = {}
+        for components in [section.get("components", {}), *groups.values()]:
+            if not isinstance(components, dict):
+                continue
+            for key, field_name, kinds in (("minecraft:loot", "loot_table", ("loot_table",)),
+                                           ("minecraft:equipment", "equipment_table", ("loot_table",)),
+                                           ("minecraft:trade_table", "trade_table", ("trade_table",)),
+                                           ("minecraft:economy_trade_table", "trade_table", ("trade_table",))):
+                component = components.get(key)
+                if isinstance(component, dict):
+                    self.refer(field_name, kinds, component.get("table"))
+        events = section.get("events", {})
+        if not isinstance(events, dict):
+            self.report("error", "wrong-type", '"events" has the wrong type', "events")
+    
+    def check_spawn_rule(self, document):
+        """Spawn rules, which refer to an entity"""
+        section = self.check_definition(document)
+        if section is None:
+            return
+        description = section.get("description", {})
+        if isinstance(description, dict):
+            self.require(description, "population_control", str, "description", severity="warning")
+            identifier = description.get("identifier")
+            if isinstance(identifier, str) and item_reference(identifier) is not None:
+                self.refer("entity", ("entity",), identifier)
+        self.require(section, "conditions", list, ROOT_KEYS[self.kind], severity="warning")
+    
+    def check_recipe(self, document):
+        """Recipe of any type, with the items it uses"""
+        if "format_version" not in document:
+            self.report("warning", "missing-field", 'Missing "format_version"')
+        keys = [key for key in document if key in RECIPE_KEYS]
+        if not keys:
+            self.report("error", "missing-field", "No minecraft:recipe_* section")
+            return
+        if len(keys) > 1:
+            self.report("error", "wrong-type", "More than one recipe in a file", keys[1])
+        root_key = keys[0]
+        section = self.require(document, root_key, dict, None)
+        if section is None:
+            return
+        self.check_description(section, root_key, "recipe")
+        self.require(section, "tags", list, root_key, severity="warning")
+        
+        if root_key == "minecraft:recipe_shaped":
+            self.check_shaped(section, root_key)
+        elif root_key == "minecraft:recipe_shapeless":
+            ingredients = self.require(section, "ingredients", list, root_key)
+            if ingredients is not None and not ingredients:
+                self.report("error", "missing-field", "The recipe has no ingredients", "ingredients")
+            for ingredient in ingredients or []:
+                self.refer_item("ingredient", ingredient)
+            self.refer_item("output", self.require(section, "result", (dict, str, list), root_key))
+        elif root_key == "minecraft:recipe_furnace":
+            self.refer_item("input", self.require(section, "input", (dict, str), root_key))
+            self.refer_item("output", self.require(section, "output", (dict, str), root_key))
+        elif root_key in ("minecraft:recipe_brewing_mix", "minecraft:recipe_brewing_container"):
+            self.refer_item("input", self.require(section, "input", str, root_key))
+            self.refer_item("reagent", self.require(section, "reagent", str, root_key))
+            self.refer_item("output", self.require(section, "output", str, root_key))
+    
+    def check_shaped(self, section, root_key):
+        """Pattern and key of a shaped recipe"""
+        pattern = self.require(section, "pattern", list, root_key)
+        key = self.require(section, "key", dict, root_key)
+        self.refer_item("output", self.require(section, "result", (dict, list), root_key))
+        if pattern is None or key is None:
+            return
+        
+        if not pattern or len(pattern) > 3 or not all(isinstance(row, str) and 0 < len(row) <= 3 for row in pattern):
+            self.report("error", "pattern", "The pattern must be one to three rows of one to three characters", "pattern")
+            return
+        if len({len(row) for row in pattern}) > 1:
+            self.report("error", "pattern", "All pattern rows must have the same length", "pattern")
+        used = {symbol for row in pattern for symbol in row if symbol != " "}
+        for symbol in sorted(used - set(key)):
+            self.report("error", "pattern", f'Pattern symbol "{symbol}" is not in "key"', "pattern")
+        for symbol in sorted(set(key) - used):
+            self.report("warning", "pattern", f'Key "{symbol}" is not used in the pattern', "key")
+        for item in key.values():
+            self.refer_item("ingredient", item)
+    
+    def check_loot_table(self, document):
+        """Pools and entries of a loot table"""
+        pools = self.require(document, "pools", list, None)
+        for pool in pools or []:
+            if not isinstance(pool, dict):
+                self.report("error", "wrong-type", "Pools must be objects", "pools")
+                continue
+            for entry in self.require(pool, "entries", list, "pools") or []:
+                if not isinstance(entry, dict):
+                    self.report("error", "wrong-type", "Entries must be objects", "entries")
+                    continue
+                entry_type = entry.get("type", "item")
+                if entry_type not in LOOT_ENTRY_TYPES:
+                    self.report("warning", "loot-entry", f'Unknown entry type "{entry_type}"', entry_type)
+                weight = entry.get("weight", 1)
+                if not isinstance(weight, (int, float)) or isinstance(weight, bool) or weight <= 0:
+                    self.report("error", "loot-entry", "Entry weights must be positive numbers", "weight")
+                if entry_type == "item":
+                    self.refer_item("item", self.require(entry, "name", str, "entries"))
+                elif entry_type == "loot_table":
+                    self.refer("loot_table", ("loot_table",), self.require(entry, "name", str, "entries"))
+    
+    def check_atlas(self, document):
+        """item_texture.json or terrain_texture.json, whose keys are texture names"""
+        texture_data = self.require(document, "texture_data", dict, None)
+        for key, entry in (texture_data or {}).items():
+            self.define(self.kind, key)
+            textures = entry.get("textures") if isinstance(entry, dict) else None
+            for texture in textures if isinstance(textures, list) else [textures]:
+                if isinstance(texture, dict):
+                    texture = texture.get("path")
+                self.refer("texture", ("texture",), texture)
+    
+    check_item_texture = check_terrain_texture = check_atlas
+
+
+def file_kind(pack, parts):
+    """Rule set for a file from its pack and its path parts inside the pack"""
+    if len(parts) == 1 and parts[0] == "manifest.json":
+        return "manifest"
+    if pack == "behavior_pack":
+        if parts[0] in DEFINITION_FOLDERS:
+            return DEFINITION_FOLDERS[parts[0]]
+        if parts[0] in TABLE_FOLDERS:
+            return TABLE_FOLDERS[parts[0]]
+    elif parts[0] == "textures" and len(parts) == 2 and parts[1] in ATLAS_FILES:
+        return ATLAS_FILES[parts[1]]
+    return None
+
+
+def load_document(text):
+    """Parse JSON that may contain comments, raises json.JSONDecodeError"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json.loads(strip_comments(text))
+
+
+def check_file(path, relative, pack, parts):
+    """Diagnostics, definitions and references of one file as plain tuples"""
+    if not parts[-1].lower().endswith(".json"):
+        # Texture files only define their path
+        return relative, [], [("texture", os.path.splitext("/".join(parts))[0], None)], []
+    
+    kind = file_kind(pack, parts)
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            text = f.read()
+    except UnicodeDecodeError:
+        return relative, [("error", "encoding", "The file is not UTF-8", None)], [], []
+    except OSError as e:
+        return relative, [("error", "unreadable", f"Cannot read the file: {e.strerror}", None)], [], []
+    
+    try:
+        document = load_document(text)
+    except json.JSONDecodeError as e:
+        return relative, [("error", "json-syntax", f"Invalid JSON: {e.msg} (column {e.colno})", e.lineno)], [], []
+    
+    checker = FileChecker(text, kind)
+    try:
+        checker.check(document)
+    except Exception as e:
+        # A rule tripping over an unexpected shape only fails this file
+        checker.diagnostics.append(("error", "internal", f"The file could not be checked: {e}", None))
+    if kind in TABLE_FOLDERS.values():
+        # Tables are referred to by their path
+        checker.definitions.append((kind, "/".join(parts), None))
+    return relative, checker.diagnostics, checker.definitions, checker.references
+
+
+def check_batch(batch):
+    """Worker process: check_file() for a batch of files"""
+    return [check_file(*task) for task in batch]
+
+
+def file_task(path, bp_path, rp_path, project_path):
+    """check_file() arguments for a file, None for files that are not validated"""
+    path = str(path)
+    extension = os.path.splitext(path)[1].lower()
+    for pack_path in (bp_path, rp_path):
+        pack_prefix = os.path.join(str(pack_path), "")
+        if not path.startswith(pack_prefix):
+            continue
+        if extension == ".json" or (pack_path == rp_path and extension in TEXTURE_EXTENSIONS):
+            relative = os.path.relpath(path, project_path).replace(os.sep, "/")
+            return path, relative, pack_path.name, tuple(path[len(pack_prefix):].replace(os.sep, "/").split("/"))
+        return None
+    return None
+
+
+def collect_files(bp_path, rp_path, project_path, folders=None):
+    """check_file() arguments for every validated file of both packs, or of some folders in them"""
+    tasks = []
+    for folder in folders or (bp_path, rp_path):
+        for dir_path, dir_names, file_names in os.walk(folder):
+            dir_names.sort()
+            for name in sorted(file_names):
+                task = file_task(os.path.join(dir_path, name), bp_path, rp_path, project_path)
+                if task is not None:
+                    tasks.append(task)
+    return tasks
+
+
+class ProjectValidator:
+    """Validation state of a project that can be brought up to date one file at a time
+    
+    check_all() checks every file. Afterwards check_paths() checks just the
+    given files again, plus the files that depend on them: those that
+    refer to a name the changed files define (or used to define) and
+    those defining the same unique name. Only the cross-file checks of
+    the dependents have to run again, their own content did not change.
+    """
+    
+    def __init__(self, bp_path, rp_path, project_path=None):
+        self.bp_path = Path(bp_path)
+        self.rp_path = Path(rp_path)
+        self.project_path = Path(project_path or os.path.commonpath([self.bp_path, self.rp_path]))
+        # relative path -> (diagnostics, definitions, references) from check_file()
+        self.files = {}
+        # kind -> name -> {relative path: line}
+        self.defined = {}
+        # name -> relative paths of the files referring to it
+        self.referrers = {}
+        self.ready = False
+    
+    # ==================== Facts ====================
+    def add_facts(self, relative, diagnostics, definitions, references):
+        """Register the result of check_file()"""
+        self.files[relative] = (diagnostics, definitions, references)
+        for kind, name, line in definitions:
+            self.defined.setdefault(kind, {}).setdefault(name, {})[relative] = line
+        for _, _, name, _ in references:
+            self.referrers.setdefault(name, set()).add(relative)
+    
+    def remove_facts(self, relative):
+        """Forget a file, returns the facts it had"""
+        facts = self.files.pop(relative, None)
+        if facts is None:
+            return None
+        for kind, name, _ in facts[1]:
+            places = self.defined.get(kind, {}).get(name)
+            if places is not None:
+                places.pop(relative, None)
+                if not places:
+                    del self.defined[kind][name]
+        for _, _, name, _ in facts[2]:
+            referrers = self.referrers.get(name)
+            if referrers is not None:
+                referrers.discard(relative)
+                if not referrers:
+                    del self.referrers[name]
+        return facts
+    
+    def diagnostics(self, relative):
+        """Diagnostics of one file: its own checks, duplicates and unknown references"""
+        facts = self.files.get(relative)
+        if facts is None:
+            return []
+        own, definitions, references = facts
+        diagnostics = [Diagnostic(severity, message, relative, line, code) for severity, code, message, line in own]
+        
+        # Names defined more than once
+        for kind, name, line in definitions:
+            places = self.defined.get(kind, {}).get(name, {})
+            if kind in UNIQUE_KINDS and len(places) > 1:
+                others = ", ".join(other for other in places if other != relative)
+                diagnostics.append(Diagnostic("error", f'Duplicate {kind} "{name}", also defined in {others}',
+                                              relative, line, "duplicate"))
+        
+        # References to things no file defines
+        for field_name, kinds, name, line in references:
+            if not any(name in self.defined.get(kind, {}) for kind in kinds):
+                label = field_name.replace("_", " ").capitalize()
+                diagnostics.append(Diagnostic("warning", f'{label} "{name}" is not defined in this project',
+                                              relative, line, "unknown-reference"))
+        
+        diagnostics.sort(key=lambda diagnostic: diagnostic.line or 0)
+        return diagnostics
+    
+    # ==================== Checking ====================
+    def check_all(self, workers=None):
+        """Check every file of both packs, returns a ValidationResult"""
+        start = time.perf_counter()
+        tasks = collect_files(self.bp_path, self.rp_path, self.project_path)
+        
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(tasks) >= PARALLEL_THRESHOLD:
+            # Imported here, multiprocessing is slow to import and small projects never need it
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
+            
+            batches = [tasks[i:i + BATCH_SIZE] for i in range(0, len(tasks), BATCH_SIZE)]
+            # Spawned, forking the threaded editor process can deadlock
+            with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+                checked = [entry for batch in executor.map(check_batch, batches) for entry in batch]
+        else:
+            checked = check_batch(tasks)
+        
+        self.files, self.defined, self.referrers = {}, {}, {}
+        for entry in checked:
+            self.add_facts(*entry)
+        self.ready = True
+        
+        result = ValidationResult(files=sum(1 for task in tasks if task[1].endswith(".json")))
+        for relative in sorted(self.files):
+            result.diagnostics.extend(self.diagnostics(relative))
+        result.seconds = time.perf_counter() - start
+        return result
+    
+    def check_paths(self, paths):
+        """Check changed or deleted files again, returns {relative path: diagnostics} of every affected file"""
+        # relative path -> check_file() arguments of files to check, and files that are gone
+        tasks = {}
+        removed = set()
+        for path in paths:
+            path = str(path)
+            if os.path.isdir(path):
+                tasks.update((task[1], task) for task in collect_files(self.bp_path, self.rp_path, self.project_path, [path]))
+                continue
+            task = file_task(path, self.bp_path, self.rp_path, self.project_path)
+            if task is not None:
+                tasks[task[1]] = task
+            elif not os.path.exists(path):
+                # A deleted folder takes every file below it along
+                prefix = os.path.relpath(path, self.project_path).replace(os.sep, "/") + "/"
+                removed.update(relative for relative in self.files if relative.startswith(prefix))
+        
+        # Names the files defined before and after, their users are affected
+        names = set()
+        changed = set(tasks) | removed
+        for relative in changed:
+            old = self.remove_facts(relative)
+            if old is not None:
+                names.update((kind, name) for kind, name, _ in old[1])
+        for relative, task in tasks.items():
+            if os.path.isfile(task[0]):
+                facts = check_file(*task)[1:]
+                self.add_facts(relative, *facts)
+                names.update((kind, name) for kind, name, _ in facts[1])
+        
+        # Files whose cross-file checks may have changed
+        affected = set(changed)
+        for kind, name in names:
+            affected.update(self.referrers.get(name, ()))
+            if kind in UNIQUE_KINDS:
+                affected.update(self.defined.get(kind, {}).get(name, ()))
+        return {relative: self.diagnostics(relative) for relative in sorted(affected)}
+
+
+class ValidationWorker:
+    """Run a ProjectValidator on a worker thread and hand the diagnostics back to the Tk main loop
+    
+    on_results(by_file, full) receives {relative path: diagnostics}; after
+    a full check it covers every file, otherwise only the affected ones.
+    """
+    
+    def __init__(self, validator, widget, on_results, poll_ms=100):
+        self.validator = validator
+        self.widget = widget
+        self.on_results = on_results
+        self.poll_ms = poll_ms
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.results = queue.Queue()
+        # Requests made while a check runs are merged into the next one
+        self.pending = set()
+        self.full = False
+        self.running = False
+        self.thread = None
+        self.polling = False
+    
+    def submit(self, paths=None):
+        """Check changed paths again, or the whole project if paths is None"""
+        with self.lock:
+            if paths is None:
+                self.full = True
+            else:
+                self.pending.update(str(path) for path in paths)
+        self.wakeup.set()
+        
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="ValidationWorker", daemon=True)
+            self.thread.start()
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.poll_ms, self.poll)
+    
+    def run(self):
+        """Worker thread: check everything that was submitted so far"""
+        while True:
+            self.wakeup.wait()
+            with self.lock:
+                self.wakeup.clear()
+                full = self.full or not self.validator.ready
+                paths = self.pending
+                self.full = False
+                self.pending = set()
+                self.running = True
+            
+            try:
+                if full:
+                    self.validator.check_all()
+                    by_file = {relative: self.validator.diagnostics(relative) for relative in self.validator.files}
+                else:
+                    by_file = self.validator.check_paths(paths)
+                self.results.put((by_file, full))
+            except Exception as e:
+                print(f"Validation failed: {e}")
+            finally:
+                with self.lock:
+                    self.running = False
+    
+    def poll(self):
+        """Main thread: deliver finished results"""
+        try:
+            if not self.widget.winfo_exists():
+                return
+        except Exception:
+            return
+        
+        while True:
+            try:
+                by_file, full = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.on_results(by_file, full)
+        
+        with self.lock:
+            idle = not self.running and not self.wakeup.is_set()
+        if idle and self.results.empty():
+            self.polling = False
+            return
+        self.widget.after(self.poll_ms, self.poll)
+
+
+def validate_files(bp_path, rp_path, project_path=None, workers=None):
+    """Check every JSON file of both packs, returns a ValidationResult"""
+    return ProjectValidator(bp_path, rp_path, project_path).check_all(workers)
+
+
+def validate_project(project_path, workers=None):
+    """Structure checks followed by validate_files()"""
+    bp_path, rp_path = pack_paths(project_path)
+    structure = [Diagnostic(severity, message, code="structure") for severity, message in check_structure(project_path)]
+    if not bp_path.is_dir() or not rp_path.is_dir():
+        return ValidationResult(diagnostics=structure)
+    result = validate_files(bp_path, rp_path, project_path, workers)
+    result.diagnostics[:0] = structure
+    return result
@@ -0,0 +1,177 @@
+import mmap
+import os
+import tkinter as tk
+from array import array
+from bisect import bisect_left
+from tkinter import ttk
+
+
+class LineIndex:
+    """Memory-mapped file with a compact line index
+    
+    Instead of one offset per line, the index stores how many line breaks
+    come before each fixed-size block of the file. Counting line breaks per
+    block runs at C speed, so a 200 MB file is indexed in a fraction of a
+    second and the index itself stays a few kilobytes.
+    """
+    
+    BLOCK_SIZE = 64 * 1024
+    
+    def __init__(self, path, encoding="utf-8"):
+        self.path = path
+        self.encoding = encoding
+        self.file = None
+        self.data = b""
+        self.size = 0
+        self.open()
+    
+    def open(self):
+        """Map the file and build the block index"""
+        self.close()
+        self.file = open(self.path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        # Empty files cannot be mapped
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        
+        # Number of line breaks before each block
+        self.block_lines = array("Q")
+        breaks = 0
+        for start in range(0, self.size, self.BLOCK_SIZE):
+            self.block_lines.append(breaks)
+            breaks += self.data[start:start + self.BLOCK_SIZE].count(b"\n")
+        
+        # A last line without a trailing line break still counts
+        self.line_count = breaks + (1 if self.size and self.data[self.size - 1:self.size] != b"\n" else 0)
+    
+    def close(self):
+        """Release the mapping and the file handle"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+    
+    def is_stale(self):
+        """Check whether the file size changed since it was mapped"""
+        try:
+            return os.stat(self.path).st_size != self.size
+        except OSError:
+            return True
+    
+    def line_offset(self, line):
+        """Byte offset where a line (0-based) starts"""
+        if line <= 0:
+            return 0
+        if line >= self.line_count:
+            return self.size
+        
+        # Last block that starts before the line's preceding line break
+        block = bisect_left(self.block_lines, line) - 1
+        position = block * self.BLOCK_SIZE
+        for _ in range(line - self.block_lines[block]):
+            position = self.data.find(b"\n", position) + 1
+        return position
+    
+    def get_lines(self, first, count):
+        """Decode count lines starting at line first"""
+        start = self.line_offset(first)
+        end = start
+        for _ in range(max(0, min(count, self.line_count - first))):
+            newline = self.data.find(b"\n", end)
+            if newline == -1:
+                end = self.size
+                break
+            end = newline + 1
+        return self.data[start:end].decode(self.encoding, errors="replace")
+
+
+class VirtualTextView(ttk.Frame):
+    """Read-only text view that only renders the visible window of lines"""
+    
+    def __init__(self, parent, path, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.index = LineIndex(path)
+        self.first_line = 0
+        self.visible_lines = 50
+        
+        self.text = tk.Text(self, wrap=tk.NONE)
+        self.scrollbar_y = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar_x = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.text.xview)
+        self.text.config(xscrollcommand=self.scrollbar_x.set)
+        
+        self.scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Scrolling is handled here, not by the Text widget
+        self.text.bind("<Configure>", lambda e: self.render())
+        self.text.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.text.bind("<Button-4>", lambda e: self.scroll_lines(-3))
+        self.text.bind("<Button-5>", lambda e: self.scroll_lines(3))
+        self.text.bind("<Up>", lambda e: self.scroll_lines(-1))
+        self.text.bind("<Down>", lambda e: self.scroll_lines(1))
+        self.text.bind("<Prior>", lambda e: self.scroll_lines(-self.visible_lines))
+        self.text.bind("<Next>", lambda e: self.scroll_lines(self.visible_lines))
+        self.text.bind("<Control-Home>", lambda e: self.scroll_to(0))
+        self.text.bind("<Control-End>", lambda e: self.scroll_to(self.index.line_count))
+        self.bind("<Destroy>", self.on_destroy)
+        
+        self.render()
+    
+    @property
+    def line_count(self):
+        """Number of lines in the file"""
+        return self.index.line_count
+    
+    def render(self):
+        """Show the lines that fit in the widget"""
+        if self.index.is_stale():
+            # The file changed under the mapping, map it again
+            self.index.open()
+        
+        line_height = max(1, int(self.text.tk.call("font", "metrics", self.text.cget("font"), "-linespace")))
+        self.visible_lines = max(1, self.text.winfo_height() // line_height)
+        self.first_line = max(0, min(self.first_line, self.index.line_count - self.visible_lines))
+        
+        content = self.index.get_lines(self.first_line, self.visible_lines)
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", content)
+        self.text.config(state=tk.DISABLED)
+        
+        total = max(1, self.index.line_count)
+        self.scrollbar_y.set(self.first_line / total,
+                             min(1.0, (self.first_line + self.visible_lines) / total))
+        return "break"
+    
+    def scroll_lines(self, delta):
+        """Scroll by a number of lines"""
+        return self.scroll_to(self.first_line + delta)
+    
+    def scroll_to(self, line):
+        """Make line the first visible line"""
+        self.first_line = max(0, min(int(line), self.index.line_count - 1))
+        return self.render()
+    
+    def yview(self, *args):
+        """Scrollbar command"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.index.line_count)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_lines
+            self.scroll_lines(amount)
+    
+    def on_mouse_wheel(self, event):
+        """Mouse wheel on Windows and macOS"""
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll_lines(-3 * steps)
+    
+    def on_destroy(self, event):
+        """Release the mapping when the view goes away"""
+        if event.widget is self:
+            self.index.close()
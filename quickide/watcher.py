@@ -0,0 +1,335 @@
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Change kinds delivered to subscribers
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+RESCAN = "rescan"
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def merge_change(changes, path, kind):
+    """Fold a new change for a path into a pending batch"""
+    previous = changes.get(path)
+    if previous is None or previous == RESCAN:
+        changes[path] = kind
+    elif previous == CREATED and kind == DELETED:
+        # Created and removed again before anyone saw it (e.g. a temp file)
+        del changes[path]
+    elif previous == CREATED:
+        pass
+    elif previous == DELETED and kind != DELETED:
+        changes[path] = MODIFIED
+    else:
+        changes[path] = kind
+
+
+class InotifyBackend:
+    """Linux inotify backend, watches every folder under the roots"""
+    
+    def __init__(self, roots):
+        # ctypes.util pulls in shutil, tempfile and subprocess, only load it on the watcher thread
+        import ctypes
+        import ctypes.util
+        
+        self.get_errno = ctypes.get_errno
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(self.get_errno(), "inotify_init1 failed")
+        
+        # Watch descriptor -> folder path
+        self.watches = {}
+        self.roots = [Path(root) for root in roots]
+        try:
+            for root in self.roots:
+                if root.exists():
+                    self.add_tree(root, None)
+        except OSError:
+            # e.g. the watch limit was reached, the caller falls back to polling
+            self.close()
+            raise
+    
+    def add_watch(self, path):
+        """Watch a single folder"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            errno = self.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {path}: {os.strerror(errno)}")
+        self.watches[wd] = Path(path)
+    
+    def add_tree(self, path, changes):
+        """Watch a folder and everything below it
+        
+        Files that appeared before the watch was in place are reported as
+        created when changes is given.
+        """
+        self.add_watch(path)
+        for dir_path, dir_names, file_names in os.walk(path):
+            for name in dir_names:
+                child = Path(dir_path) / name
+                self.add_watch(child)
+                if changes is not None:
+                    merge_change(changes, child, CREATED)
+            if changes is not None:
+                for name in file_names:
+                    merge_change(changes, Path(dir_path) / name, CREATED)
+    
+    def read(self, changes, timeout):
+        """Wait up to timeout seconds and fold any events into changes
+        
+        Returns whether any event was read, even one that left changes as it was.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped, subscribers have to resync the roots
+                for root in self.roots:
+                    changes[root] = RESCAN
+                continue
+            
+            folder = self.watches.get(wd)
+            if folder is None:
+                continue
+            
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                merge_change(changes, folder, DELETED)
+                continue
+            
+            path = folder / os.fsdecode(name)
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                merge_change(changes, path, CREATED)
+                if mask & IN_ISDIR:
+                    try:
+                        self.add_tree(path, changes)
+                    except OSError:
+                        pass
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                merge_change(changes, path, DELETED)
+            else:
+                merge_change(changes, path, MODIFIED)
+        return bool(data)
+    
+    def close(self):
+        """Release the inotify descriptor"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingBackend:
+    """Portable backend comparing mtime/size snapshots of the roots"""
+    
+    def __init__(self, roots, interval=1.0):
+        self.roots = [Path(root) for root in roots]
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+    
+    def take_snapshot(self):
+        """Map every path under the roots to (is_dir, mtime_ns, size)"""
+        snapshot = {}
+        stack = [str(root) for root in self.roots if root.exists()]
+        while stack:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        is_dir = entry.is_dir()
+                        # A folder's own mtime changes with its children, so only record that it exists
+                        snapshot[entry.path] = (True, 0, 0) if is_dir else (False, stat.st_mtime_ns, stat.st_size)
+                        if is_dir:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+        return snapshot
+    
+    def read(self, changes, timeout):
+        """Sleep for the poll interval and fold the snapshot diff into changes
+        
+        Returns whether anything changed since the last snapshot.
+        """
+        time.sleep(self.interval)
+        current = self.take_snapshot()
+        old = self.snapshot
+        changed = False
+        
+        for path, info in current.items():
+            previous = old.get(path)
+            if previous is None:
+                merge_change(changes, Path(path), CREATED)
+                changed = True
+            elif previous != info:
+                merge_change(changes, Path(path), MODIFIED)
+                changed = True
+        
+        for path in old.keys() - current.keys():
+            merge_change(changes, Path(path), DELETED)
+            changed = True
+        
+        self.snapshot = current
+        return changed
+    
+    def close(self):
+        """Nothing to release"""
+
+
+class ProjectWatcher:
+    """Watch the pack folders in the background and report batched changes
+    
+    Events are collected on a worker thread, debounced, and handed to the
+    Tk main loop through after(), so subscribers can touch widgets.
+    Subscribers get a dict mapping Path -> "created"/"modified"/"deleted",
+    or "rescan" for a root whose events were lost.
+    """
+    
+    def __init__(self, roots, debounce=0.3, poll_interval=1.0, use_inotify=True):
+        self.roots = [Path(root) for root in roots]
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.subscribers = []
+        self.batches = queue.Queue()
+        self.backend = None
+        self.thread = None
+        self.widget = None
+        self.stop_event = threading.Event()
+    
+    def subscribe(self, callback):
+        """Register a callback for change batches"""
+        self.subscribers.append(callback)
+    
+    def unsubscribe(self, callback):
+        """Remove a callback"""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+    
+    def create_backend(self):
+        """Use inotify on Linux and fall back to polling elsewhere or on failure"""
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                return InotifyBackend(self.roots)
+            except (OSError, AttributeError) as e:
+                # e.g. the inotify watch limit is too low for the project
+                print(f"inotify unavailable, polling for changes instead: {e}")
+        return PollingBackend(self.roots, self.poll_interval)
+    
+    def start(self, widget):
+        """Start watching and deliver batches on widget's main loop"""
+        if self.thread is not None:
+            return
+        
+        self.widget = widget
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="ProjectWatcher", daemon=True)
+        self.thread.start()
+        self.widget.after(100, self.drain)
+    
+    def stop(self):
+        """Stop the worker thread"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+            self.thread = None
+        self.widget = None
+    
+    def run(self):
+        """Worker thread: read events and emit a batch once they settle"""
+        try:
+            self.backend = self.create_backend()
+        except Exception as e:
+            print(f"Failed to start file watcher: {e}")
+            return
+        
+        pending = {}
+        last_event = 0.0
+        try:
+            while not self.stop_event.is_set():
+                # Every event restarts the quiet period, also repeated saves of a pending path
+                seen = self.backend.read(pending, self.debounce)
+                now = time.monotonic()
+                if seen:
+                    last_event = now
+                
+                # Flush once no new events arrived for the debounce period
+                if pending and now - last_event >= self.debounce:
+                    self.batches.put(pending)
+                    pending = {}
+        finally:
+            self.backend.close()
+    
+    def drain(self):
+        """Main thread: pass queued batches to subscribers"""
+        if self.widget is None:
+            return
+        
+        changes = {}
+        while True:
+            try:
+                batch = self.batches.get_nowait()
+            except queue.Empty:
+                break
+            for path, kind in batch.items():
+                merge_change(changes, path, kind)
+        
+        if changes:
+            for callback in list(self.subscribers):
+                try:
+                    callback(changes)
+                except Exception as e:
+                    print(f"File watcher subscriber failed: {e}")
+        
+        try:
+            self.widget.after(100, self.drain)
+        except Exception:
+            # The window has been destroyed
+            self.stop_event.set()
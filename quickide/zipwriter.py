@@ -0,0 +1,278 @@
+"""Zip archive writer with parallel compression
+
+zipfile compresses each member on the calling thread while writing it.
+Here members are compressed on a thread pool (zlib releases the GIL) and
+written to the archive in order as they become ready. Already compressed
+formats such as PNG and OGG are stored instead of deflated again. An
+optional transform rewrites member data (e.g. minified JSON) before it is
+compressed.
+"""
+
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from quickide.exportcache import content_hash
+
+STORED = 0
+DEFLATED = 8
+
+# Compression levels by name, numbers 0-9 are accepted as well
+LEVELS = {"store": 0, "fast": 1, "default": 6, "small": 9}
+DEFAULT_LEVEL = 6
+
+# Formats that are compressed already and barely shrink when deflated
+STORED_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".ogg", ".mp3", ".fsb",
+    ".zip", ".mcpack", ".mcaddon", ".mcworld", ".mctemplate"
+}
+
+# Timestamp and permission bits of reproducible archives. The timestamp is
+# 1980-01-01 00:00 local time, so the DOS date fields are the same in every
+# time zone
+REPRODUCIBLE_MTIME = time.mktime((1980, 1, 1, 0, 0, 0, 0, 1, -1))
+REPRODUCIBLE_MODE = 0o100644
+
+# Stop reading ahead once this many bytes wait to be written
+MAX_PENDING_BYTES = 128 * 1024 * 1024
+
+# Same thresholds as zipfile, larger values use the zip64 fields
+ZIP64_LIMIT = (1 << 31) - 1
+ZIP_FILECOUNT_LIMIT = (1 << 16) - 1
+UTF8_FLAG = 0x800
+
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+END_RECORD = struct.Struct("<IHHHHIIH")
+ZIP64_END_RECORD = struct.Struct("<IQHHIIQQQQ")
+ZIP64_LOCATOR = struct.Struct("<IIQI")
+
+
+def parse_level(value):
+    """Compression level from a number or one of LEVELS"""
+    if isinstance(value, int):
+        level = value
+    elif str(value).strip().lower() in LEVELS:
+        level = LEVELS[str(value).strip().lower()]
+    else:
+        level = int(value)
+    if not 0 <= level <= 9:
+        raise ValueError(f"Compression level must be 0-9, got {level}")
+    return level
+
+
+def dos_date_time(timestamp):
+    """Zip (DOS) date and time fields for a timestamp"""
+    year, month, day, hour, minute, second = time.localtime(timestamp)[:6]
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    dos_date = (year - 1980) << 9 | month << 5 | day
+    dos_time = hour << 11 | minute << 5 | second // 2
+    return dos_date, dos_time
+
+
+def clamp(value):
+    """Classic 32 bit field value, 0xFFFFFFFF when the zip64 field holds it"""
+    return value if value < ZIP64_LIMIT else 0xFFFFFFFF
+
+
+@dataclass
+class Member:
+    """A file that goes into the archive"""
+    path: str
+    arcname: str
+    size: int = 0
+    # Timestamp and permission bits, taken from the file when None
+    mtime: float = None
+    mode: int = None
+
+
+@dataclass
+class CompressedMember:
+    """Member data ready to be written"""
+    member: Member
+    method: int
+    crc: int
+    size: int
+    data: bytes
+    mtime: float
+    mode: int
+    # Why the transform left the member as it was
+    warning: str = None
+
+
+def compress_member(member, level, cache=None, transform=None):
+    """Read, transform and compress one member, runs on a worker thread
+    
+    transform(arcname, data) returns the data to archive. If it raises
+    ValueError the member is archived unchanged with a warning, and is not
+    cached so the warning comes up again next time.
+    """
+    stat = os.stat(member.path)
+    mtime = stat.st_mtime if member.mtime is None else member.mtime
+    mode = stat.st_mode if member.mode is None else member.mode
+    
+    # Unchanged since the last export: copy the cached data
+    if cache is not None:
+        cached = cache.lookup(member.arcname, stat, level)
+        if cached is not None:
+            method, crc, size, cached_data = cached
+            if cached_data is None:
+                with open(member.path, "rb") as f:
+                    cached_data = f.read()
+            return CompressedMember(member, method, crc, size, cached_data, mtime, mode)
+    
+    with open(member.path, "rb") as f:
+        data = f.read()
+    
+    # Same content as a cached member (touched or renamed file)
+    digest = None
+    if cache is not None:
+        digest = content_hash(data)
+        cached = cache.lookup_content(member.arcname, stat, level, digest)
+        if cached is not None:
+            method, crc, size, cached_data = cached
+            return CompressedMember(member, method, crc, size, data if cached_data is None else cached_data, mtime, mode)
+    
+    source, warning = data, None
+    if transform is not None:
+        try:
+            data = transform(member.arcname, data)
+        except ValueError as e:
+            warning = str(e)
+    
+    crc = zlib.crc32(data)
+    method, compressed = STORED, data
+    extension = os.path.splitext(member.arcname)[1].lower()
+    if level > 0 and extension not in STORED_EXTENSIONS and data:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+        # Keep whichever is smaller
+        if len(deflated) < len(data):
+            method, compressed = DEFLATED, deflated
+    
+    if cache is not None and warning is None:
+        # Only data that differs from the source goes into the cache
+        cache.store(member.arcname, stat, level, digest, method, crc, len(data),
+                    None if compressed is source else compressed)
+    return CompressedMember(member, method, crc, len(data), compressed, mtime, mode, warning)
+
+
+class ZipWriter:
+    """Minimal zip writer for members compressed elsewhere, with zip64 support"""
+    
+    def __init__(self, file):
+        self.file = file
+        self.entries = []
+        self.offset = 0
+    
+    def write(self, item):
+        """Append a compressed member"""
+        name = item.member.arcname.encode("utf-8")
+        flags = UTF8_FLAG if not item.member.arcname.isascii() else 0
+        dos_date, dos_time = dos_date_time(item.mtime)
+        
+        zip64 = item.size >= ZIP64_LIMIT or len(item.data) >= ZIP64_LIMIT
+        extra = struct.pack("<HHQQ", 1, 16, item.size, len(item.data)) if zip64 else b""
+        header = LOCAL_HEADER.pack(
+            0x04034b50, 45 if zip64 else 20, flags, item.method, dos_time, dos_date, item.crc,
+            0xFFFFFFFF if zip64 else len(item.data), 0xFFFFFFFF if zip64 else item.size,
+            len(name), len(extra)
+        )
+        
+        self.entries.append((name, flags, item.method, dos_time, dos_date, item.crc,
+                             len(item.data), item.size, item.mode, self.offset))
+        self.file.write(header)
+        self.file.write(name)
+        self.file.write(extra)
+        self.file.write(item.data)
+        self.offset += len(header) + len(name) + len(extra) + len(item.data)
+    
+    def close(self):
+        """Write the central directory"""
+        directory_offset = self.offset
+        for name, flags, method, dos_time, dos_date, crc, compressed_size, size, mode, offset in self.entries:
+            # Values too large for the classic fields move into the zip64 extra field
+            zip64_values = [value for value in (size, compressed_size, offset) if value >= ZIP64_LIMIT]
+            extra = struct.pack("<HH", 1, 8 * len(zip64_values)) + struct.pack(f"<{len(zip64_values)}Q", *zip64_values) if zip64_values else b""
+            header = CENTRAL_HEADER.pack(
+                0x02014b50, 3 << 8 | (45 if zip64_values else 20), 45 if zip64_values else 20, flags, method,
+                dos_time, dos_date, crc,
+                clamp(compressed_size), clamp(size),
+                len(name), len(extra), 0, 0, 0, (mode & 0xFFFF) << 16, clamp(offset)
+            )
+            self.file.write(header)
+            self.file.write(name)
+            self.file.write(extra)
+            self.offset += len(header) + len(name) + len(extra)
+        
+        directory_size = self.offset - directory_offset
+        count = len(self.entries)
+        if count >= ZIP_FILECOUNT_LIMIT or directory_offset >= ZIP64_LIMIT or directory_size >= ZIP64_LIMIT:
+            self.file.write(ZIP64_END_RECORD.pack(0x06064b50, ZIP64_END_RECORD.size - 12, 45, 45, 0, 0,
+                                                  count, count, directory_size, directory_offset))
+            self.file.write(ZIP64_LOCATOR.pack(0x07064b50, 0, self.offset, 1))
+        self.file.write(END_RECORD.pack(0x06054b50, 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+                                        clamp(directory_size), clamp(directory_offset), 0))
+
+
+def write_archive(members, output_path, level=DEFAULT_LEVEL, workers=None, cache=None, reproducible=False,
+                  transform=None):
+    """Compress members in parallel and write them to output_path in order
+    
+    cache is an optional ExportCache; it is saved once the archive is
+    complete. With reproducible, members are sorted by name and get fixed
+    timestamps and permissions, so the same files and level always give
+    the same bytes. transform is passed on to compress_member(). Returns
+    the list of CompressedMember results without their data.
+    """
+    level = parse_level(level)
+    workers = workers or os.cpu_count() or 1
+    written = []
+    
+    if reproducible:
+        members = sorted(members, key=lambda m: m.arcname)
+        for member in members:
+            member.mtime, member.mode = REPRODUCIBLE_MTIME, REPRODUCIBLE_MODE
+    
+    try:
+        with open(output_path, "wb") as f, ThreadPoolExecutor(max_workers=workers) as executor:
+            writer = ZipWriter(f)
+            pending = []
+            pending_bytes = 0
+            members = iter(members)
+            exhausted = False
+            
+            while True:
+                # Read ahead while the window has room
+                while not exhausted and (not pending or (len(pending) < workers * 4 and pending_bytes < MAX_PENDING_BYTES)):
+                    member = next(members, None)
+                    if member is None:
+                        exhausted = True
+                        break
+                    pending.append((member.size, executor.submit(compress_member, member, level, cache, transform)))
+                    pending_bytes += member.size
+                
+                if not pending:
+                    break
+                
+                size, future = pending.pop(0)
+                pending_bytes -= size
+                item = future.result()
+                writer.write(item)
+                item.data = b""
+                written.append(item)
+            
+            writer.close()
+    except BaseException:
+        # Keep the cache of the last complete export
+        if cache is not None:
+            cache.close()
+        raise
+    
+    if cache is not None:
+        cache.save()
+    return written